@@ -5,6 +5,7 @@
 
 from .core.policy_analyzer import PolicyAnalyzer
 from .core.redundancy_analyzer import RedundancyAnalyzer
+from .core.shadow_analyzer import ShadowAnalyzer
 from .core.change_analyzer import ChangeAnalyzer
 
-__all__ = ['PolicyAnalyzer', 'RedundancyAnalyzer', 'ChangeAnalyzer'] 
\ No newline at end of file
+__all__ = ['PolicyAnalyzer', 'RedundancyAnalyzer', 'ShadowAnalyzer', 'ChangeAnalyzer'] 
\ No newline at end of file
@@ -4,6 +4,7 @@
 
 from .policy_analyzer import PolicyAnalyzer
 from .redundancy_analyzer import RedundancyAnalyzer
+from .shadow_analyzer import ShadowAnalyzer
 from .change_analyzer import ChangeAnalyzer
 
-__all__ = ['PolicyAnalyzer', 'RedundancyAnalyzer', 'ChangeAnalyzer'] 
\ No newline at end of file
+__all__ = ['PolicyAnalyzer', 'RedundancyAnalyzer', 'ShadowAnalyzer', 'ChangeAnalyzer'] 
\ No newline at end of file
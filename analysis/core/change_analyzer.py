@@ -2,11 +2,16 @@
 정책 변경사항 분석을 위한 클래스입니다.
 """
 
+import numpy as np
 import pandas as pd
 import logging
 from typing import Dict, List, Set
 from datetime import datetime
 
+from firewall.fingerprint import FINGERPRINT_COLUMNS, RULE_HASH_COLUMN
+
+DIFF_COLUMNS = ['Rule Name', 'Column', 'Before', 'After']
+
 class ChangeAnalyzer:
     """정책 변경사항 분석을 위한 클래스"""
     
@@ -29,7 +34,8 @@ class ChangeAnalyzer:
         added = df_merged[df_merged['_merge'] == 'right_only']
         added_cols = ['Rule Name'] + [col for col in added.columns 
                                     if col.endswith('_after') 
-                                    and not col.startswith('Seq')]
+                                    and not col.startswith('Seq')
+                                    and col[:-len('_after')] not in FINGERPRINT_COLUMNS]
         return added[added_cols].rename(
             columns=lambda x: x.replace('_after', '')
         )
@@ -48,51 +54,86 @@ class ChangeAnalyzer:
         removed = df_merged[df_merged['_merge'] == 'left_only']
         removed_cols = ['Rule Name'] + [col for col in removed.columns 
                                       if col.endswith('_before')
-                                      and not col.startswith('Seq')]
+                                      and not col.startswith('Seq')
+                                      and col[:-len('_before')] not in FINGERPRINT_COLUMNS]
         return removed[removed_cols].rename(
             columns=lambda x: x.replace('_before', '')
         )
     
     def _find_changed_policies(self, 
-                             df_merged: pd.DataFrame) -> pd.DataFrame:
+                             df_merged: pd.DataFrame,
+                             diff_format: str = 'long') -> pd.DataFrame:
         """
         변경된 정책을 찾습니다.
+        전체 값을 한 번에 비교하며, 양쪽 모두 비어 있는(NaN) 값은 변경되지 않은 것으로 봅니다.
         
         Args:
             df_merged: 병합된 데이터프레임
+            diff_format: 'long'(정책/컬럼별 한 행) 또는 'wide'(정책별 한 행, 변경된 컬럼만 _before/_after 값)
         
         Returns:
             변경된 정책 데이터프레임
+            - long: Rule Name, Column, Before, After
+            - wide: Rule Name, {컬럼}_before, {컬럼}_after (변경되지 않은 칸은 NaN)
         """
-        # 공통 컬럼 찾기 (Seq와 _merge 제외)
+        # 공통 컬럼 찾기 (Seq, _merge, 해시 컬럼 제외)
         common_cols = [col.replace('_before', '') 
                       for col in df_merged.columns 
                       if col.endswith('_before')
-                      and not col.startswith('Seq')]
-        
-        # 변경 조건 생성
-        change_conditions = [
-            df_merged[f'{col}_before'] != df_merged[f'{col}_after']
-            for col in common_cols
-        ]
-        
-        # 변경된 정책 필터링
-        changed = df_merged[
-            (df_merged['_merge'] == 'both') & 
-            pd.concat(change_conditions, axis=1).any(axis=1)
-        ]
-        
-        # 변경 내역 생성
-        changes_list = []
-        for idx, row in changed.iterrows():
-            changes = {'Rule Name': row['Rule Name']}
-            for col in common_cols:
-                if row[f'{col}_before'] != row[f'{col}_after']:
-                    changes[f'{col}_before'] = row[f'{col}_before']
-                    changes[f'{col}_after'] = row[f'{col}_after']
-            changes_list.append(changes)
-        
-        return pd.DataFrame(changes_list)
+                      and not col.startswith('Seq')
+                      and col[:-len('_before')] not in FINGERPRINT_COLUMNS]
+        
+        both = df_merged[df_merged['_merge'] == 'both']
+        
+        # 양쪽 모두 정책 해시가 있으면 해시가 다른 정책만 컬럼별로 비교
+        hash_before, hash_after = f'{RULE_HASH_COLUMN}_before', f'{RULE_HASH_COLUMN}_after'
+        if hash_before in both.columns and hash_after in both.columns:
+            both = both[both[hash_before] != both[hash_after]]
+        names = both['Rule Name'].to_numpy(dtype=object)
+        before = both[[f'{col}_before' for col in common_cols]].to_numpy(dtype=object)
+        after = both[[f'{col}_after' for col in common_cols]].to_numpy(dtype=object)
+        
+        # 변경 여부 (NaN끼리는 같은 값으로 취급)
+        changed_mask = (before != after) & ~(pd.isna(before) & pd.isna(after))
+        
+        if diff_format == 'wide':
+            return self._wide_changes(names, common_cols, before, after, changed_mask)
+        
+        rows, cols = np.nonzero(changed_mask)
+        return pd.DataFrame({
+            'Rule Name': names[rows],
+            'Column': np.array(common_cols, dtype=object)[cols],
+            'Before': before[rows, cols],
+            'After': after[rows, cols]
+        }, columns=DIFF_COLUMNS)
+    
+    def _wide_changes(self,
+                      names: np.ndarray,
+                      common_cols: List[str],
+                      before: np.ndarray,
+                      after: np.ndarray,
+                      changed_mask: np.ndarray) -> pd.DataFrame:
+        """
+        변경 내역을 정책별 한 행으로 만듭니다.
+        컬럼은 처음 변경된 정책 순서대로, 같은 정책 안에서는 원래 컬럼 순서대로 나열합니다.
+        """
+        changed_rows = changed_mask.any(axis=1)
+        if not changed_rows.any():
+            return pd.DataFrame()
+        
+        mask = changed_mask[changed_rows]
+        before = before[changed_rows]
+        after = after[changed_rows]
+        first_row = np.where(mask.any(axis=0), mask.argmax(axis=0), len(mask))
+        
+        changes = {'Rule Name': names[changed_rows]}
+        for i in np.lexsort((np.arange(len(common_cols)), first_row)):
+            if first_row[i] == len(mask):
+                continue
+            changes[f'{common_cols[i]}_before'] = np.where(mask[:, i], before[:, i], np.nan)
+            changes[f'{common_cols[i]}_after'] = np.where(mask[:, i], after[:, i], np.nan)
+        
+        return pd.DataFrame(changes).infer_objects()
     
     def analyze(self, 
                 df_before: pd.DataFrame,
@@ -105,6 +146,8 @@ class ChangeAnalyzer:
             df_before: 이전 정책 데이터프레임
             df_after: 현재 정책 데이터프레임
             **kwargs: 추가 매개변수
+                diff_format: 변경된 정책 형식, 'long'(기본값, 정책/컬럼별 한 행) 또는
+                    'wide'(정책별 한 행, 기존 형식)
         
         Returns:
             분석 결과를 담은 딕셔너리
@@ -127,12 +170,12 @@ class ChangeAnalyzer:
             # 변경사항 분석
             added = self._find_added_policies(df_merged)
             removed = self._find_removed_policies(df_merged)
-            changed = self._find_changed_policies(df_merged)
+            changed = self._find_changed_policies(df_merged, kwargs.get('diff_format', 'long'))
             
             self.logger.info(
                 f"분석 완료 - 추가: {len(added)}개, "
                 f"제거: {len(removed)}개, "
-                f"변경: {len(changed)}개"
+                f"변경: {changed['Rule Name'].nunique() if not changed.empty else 0}개"
             )
             
             return {
@@ -2,10 +2,37 @@
 중복 정책 분석을 위한 클래스입니다.
 """
 
+import os
+import numpy as np
 import pandas as pd
 import logging
-from typing import Dict, List, Tuple
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
+
+from .shadow_analyzer import ShadowAnalyzer
+
+# 모드별로 이 건수 이상일 때만 파티션을 프로세스 풀에서 분석
+# (exact 모드는 벡터 연산이라 프로세스 생성/전송 비용을 넘는 규모에서만 이득)
+PARALLEL_MIN_RULES = {
+    'exact': 200000,
+    'shadow': 5000
+}
+
+
+# 정책 상태에 저장하는 정규화 키의 컬럼 구분자 (정책 값에 나오지 않는 문자)
+KEY_SEPARATOR = '\x1f'
+
+# 정책을 구분하는 컬럼 (정책에 있는 컬럼만 사용, 같은 이름의 정책도 Vsys가 다르면 다른 정책)
+RULE_ID_COLUMNS = ['Vsys', 'Rule Name']
+
+STATE_KEY_COLUMN = 'Key'
+
+
+def find_partition_groups(mode: str, rules: pd.DataFrame, vendor: str, options: dict) -> pd.DataFrame:
+    """프로세스 풀 작업 함수: 파티션 하나의 중복 그룹을 찾습니다."""
+    return RedundancyAnalyzer()._find_groups(rules, vendor, mode, **options)
+
 
 class RedundancyAnalyzer:
     """중복 정책 분석을 위한 클래스"""
@@ -13,26 +40,52 @@ class RedundancyAnalyzer:
     def __init__(self):
         """RedundancyAnalyzer 초기화"""
         self.logger = logging.getLogger(__name__)
+        self.shadow_analyzer = ShadowAnalyzer()
         self.vendor_columns = {
             'paloalto': ['Enable', 'Action', 'Source', 'User', 'Destination', 'Service', 'Application', 'Category', 'Vsys'],
             'ngf': ['Enable', 'Action', 'Source', 'User', 'Destination', 'Service', 'Application'],
             'default': ['Enable', 'Action', 'Source', 'User', 'Destination', 'Service', 'Application']
         }
+        # 값이 다르면 서로 중복/포함될 수 없는 컬럼 (분석 키에 반드시 포함된 컬럼만 사용)
+        self.partition_columns = {
+            'paloalto': ['Vsys']
+        }
+    
+    def _normalize_column(self, column: pd.Series) -> pd.Series:
+        """
+        정책 컬럼 하나를 정규화합니다.
+        문자열은 콤마로 구분된 멤버를 정렬하고, 그 외 값은 문자열로 변환합니다.
+        고유 값마다 한 번만 정규화한 뒤 전체 행에 매핑합니다.
+        
+        Args:
+            column: 정규화할 정책 컬럼
+        
+        Returns:
+            정규화된 문자열 컬럼
+        """
+        codes, uniques = pd.factorize(column, use_na_sentinel=False)
+        normalized = [
+            ','.join(sorted(x.split(','))) if isinstance(x, str) else str(x)
+            for x in uniques
+        ]
+        return pd.Series(pd.Index(normalized, dtype=object).take(codes), index=column.index)
     
-    def _normalize_policy(self, policy_series: pd.Series) -> tuple:
+    def _policy_keys(self, df_check: pd.DataFrame) -> pd.Series:
         """
-        정책 데이터를 정규화합니다.
+        정규화된 정책 컬럼들로 정책 키를 생성합니다.
+        같은 정책은 같은 키를 가지며, 키는 처음 나온 순서대로 0부터 부여됩니다.
         
         Args:
-            policy_series: 정규화할 정책 데이터
+            df_check: 분석할 컬럼만 선택한 데이터프레임
         
         Returns:
-            정규화된 정책 데이터 튜플
+            정책 키 시리즈
         """
-        return tuple(
-            ','.join(sorted(str(x).split(','))) if isinstance(x, str) else str(x)
-            for x in policy_series
-        )
+        normalized = pd.DataFrame({col: self._normalize_column(df_check[col]) for col in df_check.columns})
+        hashed = pd.util.hash_pandas_object(normalized, index=False)
+        # 해시 충돌에도 결과가 달라지지 않도록 해시와 정규화된 값을 함께 그룹 키로 사용
+        return normalized.groupby([hashed] + [normalized[col] for col in normalized.columns],
+                                  sort=False).ngroup()
     
     def _prepare_data(self, df: pd.DataFrame, vendor: str) -> pd.DataFrame:
         """
@@ -54,80 +107,275 @@ class RedundancyAnalyzer:
         
         return df_filtered
     
+    def _select_rules(self, df: pd.DataFrame, vendor: str, mode: str) -> pd.DataFrame:
+        """모드별 분석 대상 정책을 선택하고 인덱스를 0부터 다시 부여합니다 (인덱스 = 전체 순서)."""
+        if mode == 'shadow':
+            rules = df[df['Enable'] == 'Y']
+        else:
+            rules = self._prepare_data(df, vendor)
+        return rules.reset_index(drop=True)
+    
+    def _partitions(self, rules: pd.DataFrame, vendor: str) -> List[pd.DataFrame]:
+        """
+        정책을 서로 독립적인 파티션으로 나눕니다.
+        정규화한 파티션 컬럼 값이 같은 정책끼리 묶으며, 값에 any가 있으면 나누지 않습니다.
+        
+        Args:
+            rules: _select_rules로 선택한 정책 데이터프레임
+            vendor: 방화벽 벤더
+        
+        Returns:
+            파티션별 데이터프레임 리스트 (원래 인덱스 유지)
+        """
+        columns = [col for col in self.partition_columns.get(vendor, []) if col in rules.columns]
+        if not columns or rules.empty:
+            return [rules]
+        
+        normalized = [self._normalize_column(rules[col]) for col in columns]
+        if any(column.str.lower().eq('any').any() for column in normalized):
+            return [rules]
+        return [partition for _, partition in rules.groupby(normalized, sort=False)]
+    
+    def _find_groups(self, rules: pd.DataFrame, vendor: str, mode: str = 'exact', **kwargs) -> pd.DataFrame:
+        """
+        정책 중 중복(또는 포함) 그룹에 속한 정책을 찾습니다.
+        
+        Args:
+            rules: 분석할 정책 데이터프레임 (인덱스 = 전체 정책 중 순서)
+            vendor: 방화벽 벤더
+            mode: 'exact' 또는 'shadow'
+            **kwargs: shadow 모드의 객체 DataFrame
+        
+        Returns:
+            그룹에 속한 정책 데이터프레임. No는 Upper 정책의 인덱스 값이고, Type은 Upper/Lower입니다.
+        """
+        if mode == 'shadow':
+            return self.shadow_analyzer.find_groups(rules, vendor, **kwargs)
+        
+        columns_to_check = self.vendor_columns.get(vendor, self.vendor_columns['default'])
+        return self._group_rules(rules, self._policy_keys(rules[columns_to_check]))
+    
+    def _group_rules(self, rules: pd.DataFrame, policy_keys: pd.Series) -> pd.DataFrame:
+        """
+        정책 키가 같은 정책끼리 묶어 2건 이상인 그룹의 정책만 반환합니다.
+        
+        Args:
+            rules: 분석할 정책 데이터프레임 (인덱스 = 전체 정책 중 순서)
+            policy_keys: rules와 같은 인덱스의 정책 키
+        
+        Returns:
+            그룹에 속한 정책 데이터프레임. No는 Upper 정책의 인덱스 값이고, Type은 Upper/Lower입니다.
+        """
+        results = rules.infer_objects()
+        
+        # 처음 나온 정책은 Upper, 같은 정책이 다시 나오면 Lower
+        results['No'] = pd.Series(rules.index, index=rules.index).groupby(policy_keys).transform('first')
+        results['Type'] = policy_keys.duplicated().map({False: 'Upper', True: 'Lower'})
+        
+        # Upper와 Lower가 모두 있는 그룹(2건 이상)만 반환
+        return results[results.groupby('No')['No'].transform('size') > 1]
+    
+    def _merge_groups(self, frames: List[pd.DataFrame], columns: pd.Index) -> pd.DataFrame:
+        """
+        파티션별 분석 결과를 합치고 Upper 정책 순서대로 No를 다시 부여합니다.
+        파티션 처리 순서와 관계없이 전체를 한 번에 분석한 결과와 같습니다.
+        """
+        valid_groups = pd.concat(frames) if len(frames) > 1 else frames[0].copy()
+        
+        # No 재할당
+        valid_groups['No'] = valid_groups.groupby('No').ngroup() + 1
+        
+        # 컬럼 순서 정리
+        columns_order = ['No', 'Type'] + [col for col in columns if col not in ['No', 'Type']]
+        valid_groups = valid_groups[columns_order]
+        
+        # Type 기준으로 정렬 (Upper가 위에 오도록)
+        return valid_groups.sort_values(by=['No', 'Type'], ascending=[True, False])
+    
     def analyze(self, df: pd.DataFrame, vendor: str, **kwargs) -> pd.DataFrame:
         """
         중복 정책을 분석합니다.
+        Vsys처럼 값이 다르면 중복될 수 없는 컬럼이 있는 벤더는 정책을 파티션으로 나누고,
+        정책이 많으면 파티션을 여러 프로세스에서 동시에 분석합니다.
         
         Args:
             df: 분석할 정책 데이터프레임
             vendor: 방화벽 벤더
             **kwargs: 추가 매개변수
+                mode: 'exact'(기본값, 정규화한 값이 같은 정책) 또는
+                    'shadow'(IP/포트 범위상 앞선 정책에 완전히 포함되는 정책)
+                max_workers: 파티션 분석 프로세스 수 (기본값: CPU 수, 1이면 단일 프로세스)
+                network_objects, network_group_objects, service_objects, service_group_objects:
+                    shadow 모드에서 객체 이름을 IP/포트 범위로 해석할 때 사용하는 Collector export 결과
         
         Returns:
             분석 결과 데이터프레임
         """
+        options = dict(kwargs)
+        mode = options.pop('mode', 'exact')
+        max_workers = options.pop('max_workers', None)
+        
         try:
             self.logger.info("중복 정책 분석 시작")
             
             # 데이터 준비
-            df_filtered = self._prepare_data(df, vendor)
-            
-            # 분석할 컬럼 선택
-            columns_to_check = self.vendor_columns.get(vendor, self.vendor_columns['default'])
-            df_check = df_filtered[columns_to_check]
+            rules = self._select_rules(df, vendor, mode)
+            partitions = self._partitions(rules, vendor)
+            workers = min(max_workers or os.cpu_count() or 1, len(partitions))
             
             # 중복 정책 분석
-            policy_map = defaultdict(list)
-            results_list = []
-            current_no = 1
-            total = len(df_filtered)
+            self.logger.info(f"정책 중복 여부 확인 중... ({len(rules)}건, 파티션 {len(partitions)}개)")
+            if workers > 1 and len(rules) >= PARALLEL_MIN_RULES.get(mode, PARALLEL_MIN_RULES['exact']):
+                # 큰 파티션부터 제출해 프로세스별 작업량을 고르게 분배
+                partitions.sort(key=len, reverse=True)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    frames = list(executor.map(
+                        find_partition_groups, repeat(mode), partitions, repeat(vendor), repeat(options)
+                    ))
+            else:
+                frames = [self._find_groups(rules, vendor, mode, **options)]
             
-            self.logger.info("정책 중복 여부 확인 중...")
-            for i in range(total):
-                try:
-                    # 진행률 표시 (10% 단위로)
-                    if i % (total // 10) == 0 or i == total - 1:
-                        progress = (i + 1) / total * 100
-                        print(f"\r정책 분석 중: {progress:.1f}% ({i + 1}/{total})", end='', flush=True)
-                    
-                    current_policy = self._normalize_policy(df_check.iloc[i])
-                    if current_policy in policy_map:
-                        row = df_filtered.iloc[i].to_dict()
-                        row.update({'No': policy_map[current_policy], 'Type': 'Lower'})
-                        results_list.append(row)
-                    else:
-                        policy_map[current_policy] = current_no
-                        row = df_filtered.iloc[i].to_dict()
-                        row.update({'No': current_no, 'Type': 'Upper'})
-                        results_list.append(row)
-                        current_no += 1
-                except Exception as e:
-                    self.logger.warning(f"정책 {i} 분석 중 오류 발생: {e}")
-                    continue
+            valid_groups = self._merge_groups(frames, df.columns)
             
-            print()  # 줄바꿈
+            self.logger.info("중복 정책 분석 완료")
+            return valid_groups
             
-            # 결과 데이터프레임 생성
-            results = pd.DataFrame(results_list)
+        except Exception as e:
+            self.logger.error(f"중복 정책 분석 중 오류 발생: {e}")
+            raise
+    
+    def _rule_keys(self, df: pd.DataFrame, vendor: str) -> pd.Series:
+        """
+        정책별 정규화 키를 생성합니다. 분석 대상(활성화된 Allow 정책)이 아닌 정책의 키는 NaN입니다.
+        
+        Args:
+            df: 정책 데이터프레임
+            vendor: 방화벽 벤더
+        
+        Returns:
+            df와 같은 인덱스의 정규화 키 문자열 시리즈
+        """
+        df_filtered = self._prepare_data(df, vendor)
+        columns_to_check = self.vendor_columns.get(vendor, self.vendor_columns['default'])
+        normalized = [self._normalize_column(df_filtered[col]) for col in columns_to_check]
+        keys = normalized[0].str.cat(normalized[1:], sep=KEY_SEPARATOR) if len(df_filtered) else pd.Series(dtype=object)
+        return keys.reindex(df.index)
+    
+    @staticmethod
+    def _rule_id_columns(df: pd.DataFrame) -> List[str]:
+        """정책을 구분하는 컬럼 중 df에 있는 컬럼을 반환합니다."""
+        return [col for col in RULE_ID_COLUMNS if col in df.columns]
+    
+    def _make_state(self, df: pd.DataFrame, keys: pd.Series) -> pd.DataFrame:
+        """정책 구분 컬럼과 정규화 키로 정책 상태를 만듭니다."""
+        state = {col: df[col].to_numpy() for col in self._rule_id_columns(df)}
+        state[STATE_KEY_COLUMN] = keys.to_numpy()
+        return pd.DataFrame(state)
+    
+    def build_state(self, df: pd.DataFrame, vendor: str) -> pd.DataFrame:
+        """
+        증분 분석(analyze_incremental)에 사용할 정책 상태를 생성합니다.
+        
+        Args:
+            df: 분석한 정책 데이터프레임
+            vendor: 방화벽 벤더
+        
+        Returns:
+            정책별 정규화 키 데이터프레임 (Vsys(있는 경우), Rule Name, Key)
+        """
+        return self._make_state(df, self._rule_keys(df, vendor))
+    
+    @staticmethod
+    def save_state(state: pd.DataFrame, file_path: str) -> None:
+        """정책 상태를 파일로 저장합니다."""
+        columns = [col for col in RULE_ID_COLUMNS if col in state.columns] + [STATE_KEY_COLUMN]
+        state[columns].to_pickle(file_path)
+    
+    @staticmethod
+    def load_state(file_path: str) -> pd.DataFrame:
+        """저장된 정책 상태를 읽어옵니다."""
+        return pd.read_pickle(file_path)
+    
+    def _stored_keys(self, df: pd.DataFrame, state: pd.DataFrame) -> Optional[Tuple[pd.Series, pd.Series]]:
+        """
+        현재 정책별로 상태에 저장된 정규화 키를 찾습니다.
+        정책 구분 컬럼(Vsys, Rule Name)이 상태에 없거나 현재 정책/상태에서 정책이 유일하게 구분되지 않으면
+        저장된 키를 사용할 수 없으므로 None을 반환합니다.
+        
+        Returns:
+            (df와 같은 인덱스의 저장된 키, 상태에 있는 정책 여부) 또는 None
+        """
+        id_columns = self._rule_id_columns(df)
+        if any(col not in state.columns for col in id_columns):
+            self.logger.warning(f"정책 상태에 {', '.join(id_columns)} 컬럼이 없어 모든 정책 키를 다시 계산합니다.")
+            return None
+        
+        current_ids = pd.MultiIndex.from_frame(df[id_columns].astype(object))
+        stored_ids = pd.MultiIndex.from_frame(state[id_columns].astype(object))
+        if current_ids.has_duplicates or stored_ids.has_duplicates:
+            self.logger.warning(f"{', '.join(id_columns)}이(가) 같은 정책이 있어 모든 정책 키를 다시 계산합니다.")
+            return None
+        
+        found = stored_ids.get_indexer(current_ids)
+        stored = state[STATE_KEY_COLUMN].to_numpy(dtype=object)
+        keys = pd.Series(np.where(found >= 0, stored[found], np.nan), index=df.index, dtype=object)
+        return keys, pd.Series(found >= 0, index=df.index)
+    
+    def analyze_incremental(self,
+                            df: pd.DataFrame,
+                            vendor: str,
+                            state: pd.DataFrame,
+                            changes: Optional[Dict[str, pd.DataFrame]] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        이전 분석의 정책 상태와 ChangeAnalyzer 결과로 중복 정책을 다시 분석합니다 (exact 모드).
+        추가/변경된 정책과 상태에 없는 정책만 다시 정규화하고, 나머지 정책은 저장된 키를 그대로 사용하므로
+        정규화 비용이 전체 정책 수가 아닌 변경 건수에 비례합니다. 결과는 analyze(df, vendor)와 같습니다.
+        
+        Args:
+            df: 현재 정책 데이터프레임 (전체)
+            vendor: 방화벽 벤더
+            state: 이전 분석의 정책 상태 (build_state 또는 이전 analyze_incremental 결과)
+            changes: ChangeAnalyzer.analyze 결과 (added, removed, changed). None이면 모든 정책을 다시 정규화합니다.
+        
+        Returns:
+            (분석 결과 데이터프레임, 현재 정책 상태)
+        """
+        try:
+            self.logger.info("중복 정책 증분 분석 시작")
             
-            # Upper와 Lower가 모두 있는 그룹만 필터링
-            valid_groups = results.groupby('No').filter(
-                lambda x: set(x['Type']) == {'Upper', 'Lower'}
-            )
+            # 추가/변경된 정책은 다시 정규화 (삭제된 정책은 현재 정책에 없으므로 상태에서 자연히 빠짐)
+            # 변경 내역에는 Vsys가 없을 수 있으므로 이름이 같은 정책은 모두 다시 정규화
+            dirty = set()
+            if changes is not None:
+                for name in ['added', 'changed']:
+                    change_df = changes.get(name)
+                    if change_df is not None and 'Rule Name' in change_df.columns:
+                        dirty.update(change_df['Rule Name'])
+            stored = self._stored_keys(df, state) if changes is not None else None
             
-            # No 재할당
-            valid_groups['No'] = valid_groups.groupby('No').ngroup() + 1
+            keys = pd.Series(np.nan, index=df.index, dtype=object)
+            reuse = pd.Series(False, index=df.index)
+            if stored is not None:
+                keys, in_state = stored
+                reuse = in_state & ~df['Rule Name'].isin(dirty)
+                keys = keys.where(reuse)
+            if not reuse.all():
+                keys[~reuse] = self._rule_keys(df[~reuse], vendor)
+            self.logger.info(f"정책 키 재계산: {(~reuse).sum()}건 / 전체 {len(df)}건")
             
-            # 컬럼 순서 정리
-            columns_order = ['No', 'Type'] + [col for col in df.columns if col not in ['No', 'Type']]
-            valid_groups = valid_groups[columns_order]
+            # 분석 대상 정책의 순서대로 키를 묶어 그룹 생성
+            eligible = keys.notna()
+            rules = df[eligible].copy().reset_index(drop=True)
+            policy_keys = pd.Series(pd.factorize(keys[eligible].to_numpy())[0], index=rules.index)
+            groups = self._group_rules(rules, policy_keys)
             
-            # Type 기준으로 정렬 (Upper가 위에 오도록)
-            valid_groups = valid_groups.sort_values(by=['No', 'Type'], ascending=[True, False])
+            # 벤더별 값 변환은 결과에 포함된 정책에만 적용
+            valid_groups = self._merge_groups([self._prepare_data(groups, vendor)], df.columns)
+            new_state = self._make_state(df, keys)
             
-            self.logger.info("중복 정책 분석 완료")
-            return valid_groups
+            self.logger.info("중복 정책 증분 분석 완료")
+            return valid_groups, new_state
             
         except Exception as e:
-            self.logger.error(f"중복 정책 분석 중 오류 발생: {e}")
-            raise 
\ No newline at end of file
+            self.logger.error(f"중복 정책 증분 분석 중 오류 발생: {e}")
+            raise
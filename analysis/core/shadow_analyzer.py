@@ -0,0 +1,429 @@
+"""
+포함(shadow) 관계 기반 중복 정책 분석을 위한 클래스입니다.
+"""
+
+import bisect
+import heapq
+import ipaddress
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from firewall.group_resolver import flatten_group_entries
+
+# 모든 값을 의미하는 멤버
+ANY_VALUES = {'any', ''}
+
+# 주소 체계별 비트 수
+ADDRESS_BITS = {4: 32, 6: 128}
+
+# 모든 주소를 포함하는 인덱스 키
+ROOT_KEY = ('*',)
+
+# 규칙 하나를 인덱스에 넣을 때 주소 방향별 최대 키 수 (초과하면 ROOT_KEY 사용)
+MAX_INDEX_KEYS = 8
+
+# 서비스 객체로 내보내지지 않는 기본 서비스
+BUILTIN_SERVICES = {
+    'service-http': [('tcp', 80, 80), ('tcp', 8080, 8080)],
+    'service-https': [('tcp', 443, 443)],
+}
+
+
+def merge_intervals(intervals) -> tuple:
+    """
+    (구분값, 시작, 끝) 구간들을 정렬하고 겹치거나 맞닿은 구간을 합칩니다.
+    """
+    merged = []
+    for family, start, end in sorted(intervals):
+        if merged and merged[-1][0] == family and start <= merged[-1][2] + 1:
+            if end > merged[-1][2]:
+                merged[-1] = (family, merged[-1][1], end)
+        else:
+            merged.append((family, start, end))
+    return tuple(merged)
+
+
+def intervals_cover(outer: tuple, inner: tuple) -> bool:
+    """
+    정렬/병합된 outer 구간들이 inner 구간들을 모두 포함하는지 확인합니다.
+    outer는 병합되어 있으므로 inner 구간 하나는 outer 구간 하나에 완전히 들어가야 합니다.
+    """
+    for family, start, end in inner:
+        position = bisect.bisect_right(outer, (family, start, float('inf'))) - 1
+        if position < 0:
+            return False
+        outer_family, outer_start, outer_end = outer[position]
+        if outer_family != family or outer_start > start or outer_end < end:
+            return False
+    return True
+
+
+def parse_address(value: str) -> Optional[Tuple[int, int, int]]:
+    """
+    IP, CIDR, 'start-end' 범위 문자열을 (IP 버전, 시작, 끝) 정수 구간으로 변환합니다.
+    해석할 수 없으면 None을 반환합니다.
+    """
+    value = value.strip()
+    try:
+        if '-' in value:
+            start, end = (ipaddress.ip_address(part.strip()) for part in value.split('-', 1))
+            if start.version != end.version:
+                return None
+            return start.version, int(start), int(end)
+        network = ipaddress.ip_network(value, strict=False)
+        return network.version, int(network.network_address), int(network.broadcast_address)
+    except ValueError:
+        return None
+
+
+def parse_ports(protocol: str, ports: str) -> List[Tuple[str, int, int]]:
+    """
+    '80', '8000-8080', '80,443' 형식의 포트 문자열을 (프로토콜, 시작, 끝) 구간 리스트로 변환합니다.
+    포트가 없으면 프로토콜 전체 포트로 처리하며, 해석할 수 없으면 빈 리스트를 반환합니다.
+    """
+    protocol = str(protocol).strip().lower()
+    if not protocol or protocol == 'nan':
+        return []
+    if ports is None or pd.isna(ports) or str(ports).strip() in ANY_VALUES:
+        return [(protocol, 0, 65535)]
+
+    intervals = []
+    for port in str(ports).split(','):
+        port = port.strip()
+        try:
+            if '-' in port:
+                start, end = port.split('-', 1)
+                intervals.append((protocol, int(start), int(end)))
+            else:
+                intervals.append((protocol, int(port), int(port)))
+        except ValueError:
+            return []
+    return intervals
+
+
+def hull_key(intervals: tuple) -> tuple:
+    """
+    구간들을 모두 포함하는 가장 작은 prefix 블록을 인덱스 키로 반환합니다.
+    A의 구간들이 B의 구간들을 포함하면 A의 키는 B의 키와 같거나 B 키의 상위 블록입니다.
+    """
+    families = {family for family, _, _ in intervals}
+    if len(families) != 1:
+        return ROOT_KEY
+    family = families.pop()
+    bits = ADDRESS_BITS[family]
+    start = intervals[0][1]
+    end = max(interval_end for _, _, interval_end in intervals)
+    prefix_length = bits - (start ^ end).bit_length()
+    return family, prefix_length, start >> (bits - prefix_length)
+
+
+def ancestor_keys(key: tuple) -> List[tuple]:
+    """hull_key로 만든 키와 그 상위 블록 키 전체를 반환합니다."""
+    if key == ROOT_KEY:
+        return [ROOT_KEY]
+    family, prefix_length, network = key
+    return [ROOT_KEY] + [
+        (family, length, network >> (prefix_length - length))
+        for length in range(prefix_length + 1)
+    ]
+
+
+class MemberSet:
+    """규칙 컬럼 하나의 해석 결과 (숫자 구간 + 해석하지 못한 멤버 이름)"""
+
+    __slots__ = ('is_any', 'intervals', 'tokens')
+
+    def __init__(self, is_any: bool, intervals: tuple = (), tokens: frozenset = frozenset()):
+        self.is_any = is_any
+        self.intervals = intervals
+        self.tokens = tokens
+
+    def covers(self, other: 'MemberSet') -> bool:
+        """other의 모든 멤버를 포함하는지 확인합니다."""
+        if self.is_any:
+            return True
+        if other.is_any:
+            return False
+        return other.tokens <= self.tokens and intervals_cover(self.intervals, other.intervals)
+
+
+class ShadowAnalyzer:
+    """앞선 정책에 완전히 포함되어 적용되지 않는(shadow) 정책 분석을 위한 클래스"""
+
+    def __init__(self):
+        """ShadowAnalyzer 초기화"""
+        self.logger = logging.getLogger(__name__)
+        self.vendor_columns = {
+            'paloalto': ['User', 'Application', 'Category', 'Vsys'],
+            'ngf': ['User', 'Application'],
+            'default': ['User', 'Application']
+        }
+
+    def _group_members(self, group_df: Optional[pd.DataFrame]) -> Dict[str, List[str]]:
+        """그룹 객체 DataFrame을 {그룹 이름: 펼친 멤버 리스트}로 변환합니다."""
+        if group_df is None or group_df.empty:
+            return {}
+        flattened = flatten_group_entries(group_df[['Group Name', 'Entry']])
+        return {
+            name: [member for member in str(entry).split(',') if member]
+            for name, entry in zip(flattened['Group Name'], flattened['Entry'])
+        }
+
+    def _address_lookup(self, network_objects: Optional[pd.DataFrame]) -> Dict[str, tuple]:
+        """네트워크 객체 DataFrame을 {객체 이름: (구간들, 해석 실패 여부)}로 변환합니다."""
+        lookup = {}
+        if network_objects is None or network_objects.empty:
+            return lookup
+        for name, value in zip(network_objects['Name'], network_objects['Value']):
+            intervals, unresolved = lookup.get(name, ((), False))
+            parsed = [parse_address(part) for part in str(value).split(',') if part.strip()]
+            resolved = tuple(interval for interval in parsed if interval is not None)
+            lookup[name] = (intervals + resolved, unresolved or len(resolved) < len(parsed) or not parsed)
+        return lookup
+
+    def _service_lookup(self, service_objects: Optional[pd.DataFrame]) -> Dict[str, tuple]:
+        """서비스 객체 DataFrame을 {객체 이름: (구간들, 해석 실패 여부)}로 변환합니다."""
+        lookup = {name: (tuple(intervals), False) for name, intervals in BUILTIN_SERVICES.items()}
+        if service_objects is None or service_objects.empty:
+            return lookup
+        for name, protocol, port in zip(service_objects['Name'], service_objects['Protocol'],
+                                        service_objects['Port']):
+            intervals, unresolved = lookup.get(name, ((), False))
+            parsed = parse_ports(protocol, port)
+            lookup[name] = (intervals + tuple(parsed), unresolved or not parsed)
+        return lookup
+
+    def _resolver(self, lookup: Dict[str, tuple], groups: Dict[str, List[str]], literal_parser):
+        """
+        규칙 셀 문자열을 MemberSet으로 변환하는 함수를 반환합니다.
+        같은 셀 문자열은 한 번만 해석합니다.
+        """
+        cache = {}
+
+        def resolve(cell) -> MemberSet:
+            if cell in cache:
+                return cache[cell]
+            if isinstance(cell, str):
+                members = [member.strip() for member in cell.split(',') if member.strip()]
+            else:
+                members = [str(cell)]  # 숫자나 NaN은 문자열 멤버 하나로 취급
+            if not members or any(member.lower() in ANY_VALUES for member in members):
+                result = MemberSet(True)
+            else:
+                intervals, tokens = [], set()
+                for member in members:
+                    for leaf in groups.get(member, [member]):
+                        if leaf in lookup:
+                            leaf_intervals, unresolved = lookup[leaf]
+                            intervals.extend(leaf_intervals)
+                            if unresolved:
+                                tokens.add(leaf)
+                            continue
+                        literal = literal_parser(leaf)
+                        if literal:
+                            intervals.extend(literal)
+                        else:
+                            tokens.add(leaf)
+                result = MemberSet(False, merge_intervals(intervals), frozenset(tokens))
+            cache[cell] = result
+            return result
+
+        return resolve
+
+    def _resolve_rules(self, rules: pd.DataFrame, vendor: str, **objects) -> List[dict]:
+        """규칙별 Source/Destination/Service/기타 컬럼을 MemberSet으로 해석합니다."""
+        address_groups = self._group_members(objects.get('network_group_objects'))
+        service_groups = self._group_members(objects.get('service_group_objects'))
+
+        def address_literal(value):
+            interval = parse_address(value)
+            return [interval] if interval else []
+
+        resolve_address = self._resolver(self._address_lookup(objects.get('network_objects')),
+                                         address_groups, address_literal)
+        resolve_service = self._resolver(self._service_lookup(objects.get('service_objects')),
+                                         service_groups, lambda value: [])
+
+        attribute_columns = [col for col in self.vendor_columns.get(vendor, self.vendor_columns['default'])
+                             if col in rules.columns]
+        attribute_resolvers = {col: self._resolver({}, {}, lambda value: []) for col in attribute_columns}
+
+        resolved = []
+        for row in zip(rules['Source'], rules['Destination'], rules['Service'],
+                       *(rules[col] for col in attribute_columns)):
+            source, destination, service = row[:3]
+            resolved.append({
+                'Source': resolve_address(source),
+                'Destination': resolve_address(destination),
+                'Service': resolve_service(service),
+                'attributes': [attribute_resolvers[col](value) for col, value in zip(attribute_columns, row[3:])],
+            })
+        return resolved
+
+    @staticmethod
+    def _covers(upper: dict, lower: dict) -> bool:
+        """upper 규칙이 lower 규칙의 모든 트래픽을 포함하는지 확인합니다."""
+        return (upper['Source'].covers(lower['Source'])
+                and upper['Destination'].covers(lower['Destination'])
+                and upper['Service'].covers(lower['Service'])
+                and all(u.covers(l) for u, l in zip(upper['attributes'], lower['attributes'])))
+
+    @staticmethod
+    def _index_keys(members: MemberSet) -> List[tuple]:
+        """
+        주소 MemberSet을 넣을 인덱스 키 목록을 반환합니다.
+        구간별 prefix 블록과 해석하지 못한 멤버 이름을 키로 사용하며,
+        any이거나 키가 너무 많으면 모든 조회에 포함되는 ROOT_KEY 하나만 사용합니다.
+        """
+        if members.is_any:
+            return [ROOT_KEY]
+        keys = {hull_key((interval,)) for interval in members.intervals}
+        keys.update(('token', token) for token in members.tokens)
+        if not keys or len(keys) > MAX_INDEX_KEYS:
+            return [ROOT_KEY]
+        return list(keys)
+
+    @staticmethod
+    def _query_keys(members: MemberSet) -> Optional[set]:
+        """
+        주소 MemberSet을 포함할 수 있는 규칙의 인덱스 키 집합을 반환합니다.
+        포함하는 규칙은 가장 넓은 구간을 포함하는 구간(같거나 상위 블록)을 가져야 하고,
+        구간이 없으면 같은 멤버 이름을 가져야 합니다. 좁힐 수 없으면 None을 반환합니다.
+        """
+        if members.is_any:
+            return {ROOT_KEY}
+        if members.intervals:
+            widest = max(members.intervals, key=lambda interval: interval[2] - interval[1])
+            return set(ancestor_keys(hull_key((widest,))))
+        if members.tokens:
+            return {ROOT_KEY, ('token', min(members.tokens))}
+        return None
+
+    def find_shadowed(self, resolved: List[dict]) -> Dict[int, int]:
+        """
+        각 규칙을 완전히 포함하는 가장 앞선 규칙을 찾습니다.
+
+        가려지지 않은 규칙을 (출발지 키, 목적지 키) 2단계 인덱스에 넣고,
+        _query_keys로 포함 가능한 버킷의 규칙만 앞선 순서대로 정확히 비교합니다.
+
+        Args:
+            resolved: _resolve_rules 결과
+
+        Returns:
+            {가려진 규칙 위치: 포함하는 규칙 위치}
+        """
+        index: Dict[tuple, Dict[tuple, List[int]]] = {}
+        shadowed = {}
+        first_positions: Dict[tuple, int] = {}
+
+        for position, rule in enumerate(resolved):
+            # 해석 결과가 같은 규칙이 앞에 있으면 그 규칙(또는 그 규칙을 포함하는 규칙)이 가장 앞선 포함 규칙
+            signature = tuple(id(rule[col]) for col in ('Source', 'Destination', 'Service')) + tuple(
+                id(members) for members in rule['attributes'])
+            if signature in first_positions:
+                first = first_positions[signature]
+                shadowed[position] = shadowed.get(first, first)
+                continue
+            first_positions[signature] = position
+
+            source_keys = self._query_keys(rule['Source'])
+            destination_keys = self._query_keys(rule['Destination'])
+
+            buckets = []
+            source_buckets = index.values() if source_keys is None else (
+                index[key] for key in source_keys if key in index)
+            for destination_buckets in source_buckets:
+                if destination_keys is None:
+                    buckets.extend(destination_buckets.values())
+                elif len(destination_buckets) <= len(destination_keys):
+                    buckets.extend(bucket for bucket_key, bucket in destination_buckets.items()
+                                   if bucket_key in destination_keys)
+                else:
+                    buckets.extend(destination_buckets[bucket_key] for bucket_key in destination_keys
+                                   if bucket_key in destination_buckets)
+
+            previous = None
+            for candidate in heapq.merge(*buckets):
+                if candidate == previous:  # 여러 버킷에 들어 있는 규칙은 한 번만 비교
+                    continue
+                previous = candidate
+                if self._covers(resolved[candidate], rule):
+                    shadowed[position] = candidate
+                    break
+            else:
+                # 가려진 규칙을 포함하는 규칙은 그보다 앞선 포함 규칙도 포함하므로 인덱스에 넣지 않음
+                for source_key in self._index_keys(rule['Source']):
+                    destination_buckets = index.setdefault(source_key, {})
+                    for destination_key in self._index_keys(rule['Destination']):
+                        destination_buckets.setdefault(destination_key, []).append(position)
+
+        return shadowed
+
+    def find_groups(self, rules: pd.DataFrame, vendor: str, **kwargs) -> pd.DataFrame:
+        """
+        rules에서 포함 관계 그룹을 찾아 Upper 다음에 Lower가 원래 순서대로 오도록 나열합니다.
+
+        Args:
+            rules: 분석할 (활성화된) 정책 데이터프레임
+            vendor: 방화벽 벤더
+            **kwargs: analyze와 같은 객체 DataFrame
+
+        Returns:
+            그룹에 속한 정책 데이터프레임. No는 Upper 정책의 rules 인덱스 값이며,
+            인덱스는 rules의 인덱스를 그대로 유지합니다.
+        """
+        resolved = self._resolve_rules(rules, vendor, **kwargs)
+        shadowed = self.find_shadowed(resolved)
+        self.logger.info(f"가려진 정책 {len(shadowed)}건 / 전체 {len(resolved)}건")
+
+        lowers_by_upper: Dict[int, List[int]] = {}
+        for lower, upper in sorted(shadowed.items()):
+            lowers_by_upper.setdefault(upper, []).append(lower)
+
+        positions, uppers, types = [], [], []
+        for upper in sorted(lowers_by_upper):
+            positions.append(upper)
+            uppers.append(upper)
+            types.append('Upper')
+            for lower in lowers_by_upper[upper]:
+                positions.append(lower)
+                uppers.append(upper)
+                types.append('Lower')
+
+        result = rules.iloc[positions].copy()
+        result['No'] = rules.index[uppers] if uppers else []
+        result['Type'] = types
+        return result
+
+    def analyze(self, df: pd.DataFrame, vendor: str, **kwargs) -> pd.DataFrame:
+        """
+        앞선 정책에 완전히 포함되는 정책을 분석합니다.
+
+        Args:
+            df: 분석할 정책 데이터프레임
+            vendor: 방화벽 벤더
+            **kwargs: network_objects, network_group_objects, service_objects,
+                service_group_objects (Collector export 결과 DataFrame)
+
+        Returns:
+            분석 결과 데이터프레임 (포함하는 정책은 Upper, 가려진 정책은 Lower)
+        """
+        try:
+            self.logger.info("포함 관계 정책 분석 시작")
+
+            # 활성화된 정책만 분석 (Action과 관계없이 앞선 정책에 포함되면 적용되지 않음)
+            rules = df[df['Enable'] == 'Y'].reset_index(drop=True)
+            result = self.find_groups(rules, vendor, **kwargs).reset_index(drop=True)
+
+            # 포함하는 정책 순서대로 No 부여
+            result['No'] = result.groupby('No').ngroup() + 1
+            columns_order = ['No', 'Type'] + [col for col in df.columns if col not in ['No', 'Type']]
+
+            self.logger.info("포함 관계 정책 분석 완료")
+            return result[columns_order]
+
+        except Exception as e:
+            self.logger.error(f"포함 관계 정책 분석 중 오류 발생: {e}")
+            raise
@@ -113,7 +113,7 @@ class ExcelHandler:
                     'Category': ['추가된 정책', '제거된 정책', '변경된 정책'],
                     'Count': [len(results['added']), 
                             len(results['removed']), 
-                            len(results['changed'])]
+                            results['changed']['Rule Name'].nunique() if not results['changed'].empty else 0]
                 }
                 pd.DataFrame(summary_data).to_excel(writer, 
                                                   sheet_name='Summary', 
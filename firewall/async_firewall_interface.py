@@ -0,0 +1,153 @@
+# firewall/async_firewall_interface.py
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from abc import ABC, abstractmethod
+import pandas as pd
+from typing import Optional
+
+from .firewall_interface import FirewallInterface
+
+
+class AsyncFirewallInterface(ABC):
+    """FirewallInterface의 asyncio 버전입니다. 하나의 이벤트 루프에서 여러 장비를 동시에 수집할 수 있습니다."""
+
+    @abstractmethod
+    async def get_system_info(self) -> pd.DataFrame:
+        """시스템 정보를 DataFrame으로 반환합니다."""
+        pass
+
+    @abstractmethod
+    async def export_security_rules(self) -> pd.DataFrame:
+        """보안 규칙 데이터를 DataFrame으로 반환합니다."""
+        pass
+
+    @abstractmethod
+    async def export_network_objects(self) -> pd.DataFrame:
+        """네트워크 객체 정보를 DataFrame으로 반환합니다.
+        Returns:
+            pd.DataFrame: Name, Type, Value 컬럼을 가진 DataFrame
+        """
+        pass
+
+    @abstractmethod
+    async def export_network_group_objects(self) -> pd.DataFrame:
+        """네트워크 그룹 객체 정보를 DataFrame으로 반환합니다.
+        Returns:
+            pd.DataFrame: Group Name, Entry 컬럼을 가진 DataFrame
+        """
+        pass
+
+    @abstractmethod
+    async def export_service_objects(self) -> pd.DataFrame:
+        """서비스 객체 정보를 DataFrame으로 반환합니다.
+        Returns:
+            pd.DataFrame: Name, Protocol, Port 컬럼을 가진 DataFrame
+        """
+        pass
+
+    @abstractmethod
+    async def export_service_group_objects(self) -> pd.DataFrame:
+        """서비스 그룹 객체 정보를 DataFrame으로 반환합니다.
+        Returns:
+            pd.DataFrame: Group Name, Entry 컬럼을 가진 DataFrame
+        """
+        pass
+
+    @abstractmethod
+    async def export_usage_logs(self, days: Optional[int] = None) -> pd.DataFrame:
+        """정책 사용이력을 DataFrame으로 반환합니다.
+        Args:
+            days: 조회할 기간 (일), None인 경우 전체 기간
+        Returns:
+            pd.DataFrame: Rule Name, Last Hit Date, Unused Days 컬럼을 가진 DataFrame
+        """
+        pass
+
+    @asynccontextmanager
+    async def session(self):
+        """수집 세션 비동기 컨텍스트 매니저.
+        세션 안의 export 호출들은 장비 연결과 내려받은 데이터를 공유할 수 있습니다.
+        기본 구현은 아무 작업도 하지 않으며, 필요한 Collector가 재정의합니다.
+        """
+        yield self
+
+    async def close(self) -> None:
+        """장비 연결과 HTTP 세션을 정리합니다."""
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+class SyncFirewallAdapter(FirewallInterface):
+    """
+    AsyncFirewallInterface 구현체를 기존 동기 FirewallInterface로 감싸는 어댑터입니다.
+    전용 이벤트 루프를 소유하며 각 메서드 호출을 해당 루프에서 완료될 때까지 실행합니다.
+    """
+
+    def __init__(self, collector: AsyncFirewallInterface):
+        self.collector = collector
+        self._loop = asyncio.new_event_loop()
+
+    def _run(self, coro):
+        if self._loop.is_closed():
+            coro.close()
+            raise RuntimeError("이미 닫힌 어댑터입니다.")
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return self._loop.run_until_complete(coro)
+        coro.close()
+        raise RuntimeError("실행 중인 이벤트 루프 안에서는 SyncFirewallAdapter를 사용할 수 없습니다. 비동기 Collector를 직접 await 하세요.")
+
+    @contextmanager
+    def session(self):
+        """수집 세션 컨텍스트 매니저.
+        비동기 Collector의 session()을 전용 이벤트 루프에서 열어 세션 안의 export가 로그인과
+        내려받은 데이터를 공유하고, 세션이 끝나면 HTTP 세션과 전용 이벤트 루프를 닫습니다.
+        """
+        try:
+            context = self.collector.session()
+            self._run(context.__aenter__())
+            try:
+                yield self
+            except BaseException as e:
+                if not self._run(context.__aexit__(type(e), e, e.__traceback__)):
+                    raise
+            else:
+                self._run(context.__aexit__(None, None, None))
+        finally:
+            self.close()
+
+    def get_system_info(self) -> pd.DataFrame:
+        return self._run(self.collector.get_system_info())
+
+    def export_security_rules(self) -> pd.DataFrame:
+        return self._run(self.collector.export_security_rules())
+
+    def export_network_objects(self) -> pd.DataFrame:
+        return self._run(self.collector.export_network_objects())
+
+    def export_network_group_objects(self) -> pd.DataFrame:
+        return self._run(self.collector.export_network_group_objects())
+
+    def export_service_objects(self) -> pd.DataFrame:
+        return self._run(self.collector.export_service_objects())
+
+    def export_service_group_objects(self) -> pd.DataFrame:
+        return self._run(self.collector.export_service_group_objects())
+
+    def export_usage_logs(self, days: Optional[int] = None) -> pd.DataFrame:
+        return self._run(self.collector.export_usage_logs(days))
+
+    def close(self) -> None:
+        """비동기 Collector를 정리한 뒤 전용 이벤트 루프를 닫습니다."""
+        if self._loop.is_closed():
+            return
+        try:
+            self._run(self.collector.close())
+        finally:
+            self._loop.close()
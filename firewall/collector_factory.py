@@ -1,10 +1,13 @@
 # firewall/collector_factory.py
 from typing import Dict, Any
 from .firewall_interface import FirewallInterface
+from .async_firewall_interface import AsyncFirewallInterface, SyncFirewallAdapter
 from .paloalto.paloalto_collector import PaloAltoCollector
 from .mf2.mf2_collector import MF2Collector
 from .ngf.ngf_collector import NGFCollector
 from .mock.mock_collector import MockCollector
+from .paloalto.paloalto_async_collector import AsyncPaloAltoCollector
+from .ngf.ngf_async_collector import AsyncNGFCollector
 
 class FirewallCollectorFactory:
     # 각 방화벽 타입별 필수 파라미터 정의
@@ -15,17 +18,51 @@ class FirewallCollectorFactory:
         'mock': ['hostname', 'username', 'password']  # Mock 방화벽 추가
     }
 
+    # 각 방화벽 타입별 선택 파라미터 정의 (지정된 경우에만 Collector에 전달)
+    OPTIONAL_PARAMS: Dict[str, list] = {
+        'paloalto': ['stream_config', 'pool_size', 'max_workers'],
+        'mf2': [],
+        'ngf': ['pool_size', 'max_workers'],
+        'mock': []
+    }
+
+    # 비동기 Collector를 지원하는 방화벽 타입별 선택 파라미터 정의
+    ASYNC_OPTIONAL_PARAMS: Dict[str, list] = {
+        'paloalto': ['stream_config', 'pool_size', 'max_workers'],
+        'ngf': ['pool_size', 'max_workers']
+    }
+
     @staticmethod
-    def get_collector(source_type: str, **kwargs) -> FirewallInterface:
+    def _validate_params(source_type: str, kwargs: Dict[str, Any]) -> str:
+        """방화벽 타입과 필수 파라미터를 검사하고 소문자로 정규화한 타입을 반환합니다."""
+        source_type = source_type.lower()
+
+        # 지원하지 않는 방화벽 타입 체크
+        if source_type not in FirewallCollectorFactory.REQUIRED_PARAMS:
+            raise ValueError(f"지원하지 않는 방화벽 타입입니다: {source_type}")
+
+        # 필수 파라미터 체크
+        required_params = FirewallCollectorFactory.REQUIRED_PARAMS[source_type]
+        missing_params = [param for param in required_params if param not in kwargs]
+        if missing_params:
+            raise ValueError(f"{source_type} 방화벽에 필요한 파라미터가 누락되었습니다: {', '.join(missing_params)}")
+        return source_type
+
+    @staticmethod
+    def get_collector(source_type: str, use_async: bool = False, **kwargs) -> FirewallInterface:
         """방화벽 타입에 따른 Collector 객체를 생성하여 반환합니다.
 
         Args:
             source_type (str): 방화벽 타입 ('paloalto', 'mf2', 'ngf', 'mock' 중 하나)
+            use_async (bool): True이면 비동기 Collector를 SyncFirewallAdapter로 감싸서 반환 (paloalto, ngf만 지원)
             **kwargs: 각 방화벽 타입별 필요한 파라미터
                 - paloalto:
                     - hostname: 장비 호스트명
                     - username: 접속 계정
                     - password: 접속 비밀번호
+                    - stream_config (선택): 설정 XML 스트리밍 파싱 여부
+                    - pool_size (선택): HTTP 커넥션 풀 크기
+                    - max_workers (선택): vsys별 히트 카운트 동시 조회 수
                 - mf2:
                     - device_ip: 장비 IP
                     - username: 접속 계정
@@ -34,6 +71,7 @@ class FirewallCollectorFactory:
                     - hostname: 장비 호스트명
                     - ext_clnt_id: 외부 클라이언트 ID
                     - ext_clnt_secret: 외부 클라이언트 시크릿
+                    - pool_size (선택): HTTP 커넥션 풀 크기
                 - mock:
                     - hostname: 가상 호스트명
                     - username: 가상 계정
@@ -45,27 +83,58 @@ class FirewallCollectorFactory:
         Raises:
             ValueError: 알 수 없는 방화벽 타입이거나 필수 파라미터가 누락된 경우
         """
-        source_type = source_type.lower()
-        
-        # 지원하지 않는 방화벽 타입 체크
-        if source_type not in FirewallCollectorFactory.REQUIRED_PARAMS:
-            raise ValueError(f"지원하지 않는 방화벽 타입입니다: {source_type}")
-        
-        # 필수 파라미터 체크
-        required_params = FirewallCollectorFactory.REQUIRED_PARAMS[source_type]
-        missing_params = [param for param in required_params if param not in kwargs]
-        if missing_params:
-            raise ValueError(f"{source_type} 방화벽에 필요한 파라미터가 누락되었습니다: {', '.join(missing_params)}")
+        if use_async:
+            return SyncFirewallAdapter(FirewallCollectorFactory.get_async_collector(source_type, **kwargs))
+
+        source_type = FirewallCollectorFactory._validate_params(source_type, kwargs)
+
+        # 선택 파라미터 수집
+        options = {
+            param: kwargs[param]
+            for param in FirewallCollectorFactory.OPTIONAL_PARAMS[source_type]
+            if param in kwargs
+        }
 
         # Collector 객체 생성 및 반환
         if source_type == 'paloalto':
-            return PaloAltoCollector(kwargs['hostname'], kwargs['username'], kwargs['password'])
+            return PaloAltoCollector(kwargs['hostname'], kwargs['username'], kwargs['password'], **options)
         elif source_type == 'mf2':
             return MF2Collector(kwargs['device_ip'], kwargs['username'], kwargs['password'])
         elif source_type == 'ngf':
-            return NGFCollector(kwargs['hostname'], kwargs['ext_clnt_id'], kwargs['ext_clnt_secret'])
+            return NGFCollector(kwargs['hostname'], kwargs['ext_clnt_id'], kwargs['ext_clnt_secret'], **options)
         elif source_type == 'mock':
             return MockCollector(kwargs['hostname'], kwargs['username'], kwargs['password'])
         
         # 여기까지 오면 안되지만, 혹시 모르니 예외 처리
-        raise ValueError(f"알 수 없는 방화벽 모듈 타입: {source_type}")
\ No newline at end of file
+        raise ValueError(f"알 수 없는 방화벽 모듈 타입: {source_type}")
+
+    @staticmethod
+    def get_async_collector(source_type: str, **kwargs) -> AsyncFirewallInterface:
+        """방화벽 타입에 따른 비동기 Collector 객체를 생성하여 반환합니다.
+        동기 코드에서 사용하려면 SyncFirewallAdapter로 감싸면 됩니다 (get_collector(..., use_async=True)).
+
+        Args:
+            source_type (str): 방화벽 타입 ('paloalto', 'ngf' 중 하나)
+            **kwargs: get_collector와 같은 필수 파라미터
+                - paloalto 선택 파라미터: stream_config, pool_size, max_workers
+                - ngf 선택 파라미터: pool_size, max_workers (서비스 그룹 상세 동시 조회 수)
+
+        Returns:
+            AsyncFirewallInterface: 방화벽 타입에 맞는 비동기 Collector 객체
+
+        Raises:
+            ValueError: 비동기 수집을 지원하지 않는 타입이거나 필수 파라미터가 누락된 경우
+        """
+        source_type = FirewallCollectorFactory._validate_params(source_type, kwargs)
+        if source_type not in FirewallCollectorFactory.ASYNC_OPTIONAL_PARAMS:
+            raise ValueError(f"비동기 수집을 지원하지 않는 방화벽 타입입니다: {source_type}")
+
+        options = {
+            param: kwargs[param]
+            for param in FirewallCollectorFactory.ASYNC_OPTIONAL_PARAMS[source_type]
+            if param in kwargs
+        }
+
+        if source_type == 'paloalto':
+            return AsyncPaloAltoCollector(kwargs['hostname'], kwargs['username'], kwargs['password'], **options)
+        return AsyncNGFCollector(kwargs['hostname'], kwargs['ext_clnt_id'], kwargs['ext_clnt_secret'], **options)
@@ -0,0 +1,123 @@
+# firewall/excel_writer.py
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+# 한 번에 파이썬 값으로 변환하는 행 수 (메모리 사용량을 일정하게 유지)
+CHUNK_ROWS = 10000
+
+# 열 너비 계산에 사용할 최대 표본 행 수
+WIDTH_SAMPLE_ROWS = 50000
+
+
+def column_widths(df: pd.DataFrame, max_width: float = 40, sample_rows: Optional[int] = WIDTH_SAMPLE_ROWS) -> List[float]:
+    """
+    헤더와 값의 최대 글자 수로 열 너비를 계산합니다. (최대 글자 수 + 2) * 1.2, 최대 max_width
+    열마다 고유 값의 문자열 길이만 계산하며, 행이 sample_rows보다 많으면 일부 행만 표본으로 사용합니다.
+
+    :param df: 저장할 DataFrame
+    :param max_width: 최대 열 너비
+    :param sample_rows: 표본 행 수 (None이면 전체 행 사용)
+    :return: 열 순서대로의 너비 리스트
+    """
+    if sample_rows is not None and len(df) > sample_rows:
+        df = df.sample(n=sample_rows, random_state=0)
+
+    widths = []
+    for position in range(df.shape[1]):
+        uniques = pd.Series(pd.unique(df.iloc[:, position].dropna()), dtype=object)
+        lengths = uniques.astype(str).str.len()
+        max_length = max(len(str(df.columns[position])), int(lengths.max()) if len(lengths) else 0)
+        widths.append(min(max_width, (max_length + 2) * 1.2))
+    return widths
+
+
+def _styled_cell(worksheet, value, fill: Optional[PatternFill] = None, font: Optional[Font] = None,
+                 alignment: Optional[Alignment] = None) -> WriteOnlyCell:
+    cell = WriteOnlyCell(worksheet, value=value)
+    if fill is not None:
+        cell.fill = fill
+    if font is not None:
+        cell.font = font
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+
+def write_sheet(workbook: Workbook, df: pd.DataFrame, sheet_name: str,
+                header_fill: Optional[PatternFill] = None,
+                header_fills: Optional[Dict[int, PatternFill]] = None,
+                header_alignments: Optional[Dict[int, Alignment]] = None,
+                banner: Optional[str] = None,
+                auto_width: bool = False,
+                max_width: float = 40,
+                widths: Optional[List[float]] = None) -> None:
+    """
+    write-only 워크북에 DataFrame을 시트 하나로 기록합니다 (인덱스 제외, 빈 값은 빈 셀).
+    스타일은 행을 쓰는 시점에 함께 적용하므로 저장 후 파일을 다시 열 필요가 없습니다.
+
+    :param workbook: Workbook(write_only=True)
+    :param df: 저장할 DataFrame
+    :param sheet_name: 시트 이름
+    :param header_fill: 헤더 전체 배경색
+    :param header_fills: 열 번호(1부터)별 헤더 배경색 (header_fill보다 우선)
+    :param header_alignments: 열 번호(1부터)별 헤더 정렬
+    :param banner: 헤더 위 첫 행에 굵게 기록할 값 (수식 가능)
+    :param auto_width: 값 길이에 맞춰 열 너비 조절 여부
+    :param max_width: auto_width 사용 시 최대 열 너비
+    :param widths: 열 순서대로 지정할 너비 (지정하면 auto_width 대신 사용)
+    """
+    worksheet = workbook.create_sheet(title=sheet_name)
+
+    # write-only 시트는 행을 쓰기 전에 열 너비를 지정해야 함
+    if widths is None and auto_width:
+        widths = column_widths(df, max_width)
+    for position, width in enumerate(widths or [], start=1):
+        worksheet.column_dimensions[get_column_letter(position)].width = width
+
+    if banner is not None:
+        worksheet.append([_styled_cell(worksheet, banner, font=Font(bold=True))])
+
+    header_fills = header_fills or {}
+    header_alignments = header_alignments or {}
+    worksheet.append([
+        _styled_cell(
+            worksheet, column,
+            fill=header_fills.get(position, header_fill),
+            alignment=header_alignments.get(position)
+        )
+        for position, column in enumerate(df.columns, start=1)
+    ])
+
+    for start in range(0, len(df), CHUNK_ROWS):
+        chunk = df.iloc[start:start + CHUNK_ROWS].astype(object)
+        for row in chunk.where(chunk.notna(), None).to_numpy():
+            worksheet.append(row.tolist())
+
+
+def write_excel(file_name: str, data: Union[pd.DataFrame, List[pd.DataFrame]],
+                sheet_names: Union[str, List[str], None] = None, **style) -> str:
+    """
+    하나 이상의 DataFrame을 write-only 모드로 엑셀 파일에 한 번에 저장합니다.
+
+    :param file_name: 저장할 파일 이름
+    :param data: 단일 DataFrame 또는 DataFrame 리스트
+    :param sheet_names: 시트 이름 또는 시트 이름 리스트 (기본값: Sheet1, Sheet2, ...)
+    :param style: 모든 시트에 적용할 write_sheet 스타일 옵션
+    :return: 저장한 파일 이름
+    """
+    frames = data if isinstance(data, list) else [data]
+    if sheet_names is None:
+        sheet_names = [f"Sheet{i + 1}" for i in range(len(frames))]
+    elif not isinstance(sheet_names, list):
+        sheet_names = [sheet_names]
+
+    workbook = Workbook(write_only=True)
+    for df, sheet_name in zip(frames, sheet_names):
+        write_sheet(workbook, df, sheet_name, **style)
+    workbook.save(file_name)
+    return file_name
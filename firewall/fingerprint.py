@@ -0,0 +1,97 @@
+# firewall/fingerprint.py
+from typing import Dict, List
+
+import pandas as pd
+
+# 정책 전체 내용 해시 컬럼
+RULE_HASH_COLUMN = 'Rule Hash'
+
+# 의미 단위 필드 그룹별 해시 컬럼과 대상 컬럼 (정책 데이터에 있는 컬럼만 사용)
+FIELD_GROUPS: Dict[str, List[str]] = {
+    'Match Hash': ['Source', 'User', 'Destination', 'Service', 'Application', 'Category', 'Vsys'],
+    'Action Hash': ['Enable', 'Action'],
+    'Meta Hash': ['Rule Name', 'Description'],
+}
+
+# 정책 순서가 바뀌어도 해시가 유지되도록 전체 내용 해시에서 제외하는 컬럼
+POSITION_COLUMNS = ['Seq']
+
+FINGERPRINT_COLUMNS = [RULE_HASH_COLUMN] + list(FIELD_GROUPS)
+
+# 빈 값(NaN/None)을 빈 문자열과 구분하기 위한 값
+NULL_TOKEN = '\x00'
+
+
+def _normalize_column(column: pd.Series, sort_members: bool) -> pd.Series:
+    """
+    해시 계산용으로 컬럼 값을 문자열로 변환합니다. 고유 값마다 한 번만 변환합니다.
+    sort_members가 True이면 콤마로 구분된 멤버를 정렬해 멤버 순서와 관계없이 같은 값으로 만듭니다.
+    """
+    codes, uniques = pd.factorize(column, use_na_sentinel=False)
+    normalized = []
+    for value in uniques:
+        if pd.isna(value):
+            normalized.append(NULL_TOKEN)
+        elif sort_members and isinstance(value, str):
+            normalized.append(','.join(sorted(member.strip() for member in value.split(','))))
+        else:
+            normalized.append(str(value))
+    return pd.Series(pd.Index(normalized, dtype=object).take(codes), index=column.index)
+
+
+def hash_columns(df: pd.DataFrame, columns: List[str], sort_members: bool = False) -> pd.Series:
+    """
+    지정한 컬럼 값으로 정책별 64비트 해시를 계산합니다.
+    같은 값이면 실행 환경과 관계없이 항상 같은 해시가 나옵니다 (컬럼 이름 순서로 결합).
+
+    :param df: 정책 DataFrame
+    :param columns: 해시 대상 컬럼 (df에 없는 컬럼은 무시)
+    :param sort_members: 콤마로 구분된 멤버 순서를 무시할지 여부
+    :return: df와 같은 인덱스의 uint64 해시 시리즈
+    """
+    present = sorted(col for col in columns if col in df.columns)
+    normalized = pd.DataFrame(
+        {col: _normalize_column(df[col], sort_members) for col in present},
+        index=df.index
+    )
+    # 컬럼 이름도 해시에 포함해 대상 컬럼 구성이 다르면 다른 해시가 나오도록 함
+    normalized.columns = range(len(present))
+    names = pd.Series('\x1f'.join(present), index=df.index, dtype=object)
+    normalized[len(present)] = names
+    return pd.util.hash_pandas_object(normalized, index=False)
+
+
+def fingerprint_rules(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    정책 DataFrame의 내용 해시 컬럼들을 계산합니다.
+
+    - Rule Hash: Seq와 해시 컬럼을 제외한 전체 컬럼
+    - Match Hash: 매칭 조건 (멤버 순서 무시)
+    - Action Hash: 활성화 여부와 Action
+    - Meta Hash: 정책 이름과 설명
+
+    :param df: 정책 DataFrame
+    :return: FINGERPRINT_COLUMNS 컬럼을 가진 DataFrame (df와 같은 인덱스)
+    """
+    content_columns = [
+        col for col in df.columns
+        if col not in POSITION_COLUMNS and col not in FINGERPRINT_COLUMNS
+    ]
+    fingerprints = {RULE_HASH_COLUMN: hash_columns(df, content_columns)}
+    for hash_column, columns in FIELD_GROUPS.items():
+        fingerprints[hash_column] = hash_columns(df, columns, sort_members=(hash_column == 'Match Hash'))
+    return pd.DataFrame(fingerprints, index=df.index, columns=FINGERPRINT_COLUMNS)
+
+
+def add_fingerprints(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    정책 DataFrame 뒤에 내용 해시 컬럼들을 추가한 복사본을 반환합니다.
+    이미 해시 컬럼이 있으면 현재 내용으로 다시 계산합니다.
+
+    :param df: 정책 DataFrame
+    :return: 해시 컬럼이 추가된 DataFrame
+    """
+    result = df.drop(columns=[col for col in FINGERPRINT_COLUMNS if col in df.columns])
+    if result.empty and not len(result.columns):
+        return result
+    return pd.concat([result, fingerprint_rules(result)], axis=1)
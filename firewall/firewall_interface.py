@@ -1,9 +1,24 @@
 # firewall/firewall_interface.py
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 import pandas as pd
 from typing import Optional
 
 class FirewallInterface(ABC):
+    @contextmanager
+    def session(self):
+        """수집 세션 컨텍스트 매니저.
+        세션 안의 export 호출들은 장비 연결과 내려받은 데이터를 공유할 수 있습니다.
+        기본 구현은 아무 작업도 하지 않으며, 필요한 Collector가 재정의합니다.
+        """
+        yield self
+
+    def close(self) -> None:
+        """장비 연결과 HTTP 커넥션 풀 등 Collector가 소유한 자원을 정리합니다.
+        기본 구현은 아무 작업도 하지 않으며, 자원을 소유한 Collector가 재정의합니다.
+        """
+        pass
+
     @abstractmethod
     def get_system_info(self) -> pd.DataFrame:
         """시스템 정보를 DataFrame으로 반환합니다."""
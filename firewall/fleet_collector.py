@@ -0,0 +1,291 @@
+# firewall/fleet_collector.py
+import json
+import time
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .collector_factory import FirewallCollectorFactory
+from .fingerprint import add_fingerprints
+
+# 수집 항목별 Collector 메서드
+EXPORT_METHODS: Dict[str, str] = {
+    'system_info': 'get_system_info',
+    'security_rules': 'export_security_rules',
+    'network_objects': 'export_network_objects',
+    'network_group_objects': 'export_network_group_objects',
+    'service_objects': 'export_service_objects',
+    'service_group_objects': 'export_service_group_objects',
+    'usage_logs': 'export_usage_logs',
+}
+
+# 인벤토리 항목 중 Collector 생성 파라미터가 아닌 키
+RESERVED_KEYS = ('name', 'source_type', 'timeout')
+
+FAILURE_COLUMNS = ['Device', 'Vendor', 'Export', 'Error']
+
+
+def load_inventory(file_path: str) -> List[dict]:
+    """
+    장비 인벤토리 JSON 파일을 읽어 장비 목록을 반환합니다.
+
+    파일은 장비 dict의 리스트이거나 {"devices": [...]} 형식이어야 하며,
+    각 장비는 source_type과 FirewallCollectorFactory에 필요한 파라미터를 가집니다.
+    name은 선택 항목이며 결과 데이터의 Device 컬럼 값으로 사용됩니다.
+
+    :param file_path: 인벤토리 파일 경로
+    :return: 장비 dict 리스트
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        inventory = json.load(f)
+    if isinstance(inventory, dict):
+        inventory = inventory.get('devices', [])
+    if not isinstance(inventory, list):
+        raise ValueError(f"인벤토리 형식이 올바르지 않습니다: {file_path}")
+
+    for device in inventory:
+        if 'source_type' not in device:
+            raise ValueError(f"source_type이 없는 장비가 있습니다: {device.get('name', device)}")
+    return inventory
+
+
+class FleetCollector:
+    """여러 방화벽 장비의 데이터를 병렬로 수집하여 장비별로 태깅된 하나의 데이터셋으로 합칩니다."""
+
+    def __init__(self, max_workers: int = 16, vendor_limits: Optional[Dict[str, int]] = None,
+                 device_timeout: Optional[float] = 1800, exports: Optional[List[str]] = None,
+                 usage_days: Optional[int] = None):
+        """
+        Args:
+            max_workers: 전체 동시 수집 장비 수
+            vendor_limits: 벤더별 동시 수집 장비 수 (예: {'mf2': 4})
+            device_timeout: 장비 1대의 수집 제한 시간 (초), None이면 제한 없음
+            exports: 수집할 항목 목록 (EXPORT_METHODS의 키), None이면 전체
+            usage_days: export_usage_logs에 전달할 미사용 기준 일수
+        """
+        self.max_workers = max(1, max_workers)
+        self.device_timeout = device_timeout
+        self.exports = list(exports) if exports else list(EXPORT_METHODS)
+        unknown = [name for name in self.exports if name not in EXPORT_METHODS]
+        if unknown:
+            raise ValueError(f"지원하지 않는 수집 항목입니다: {', '.join(unknown)}")
+        self.usage_days = usage_days
+        self.vendor_limits = {vendor.lower(): max(1, limit) for vendor, limit in (vendor_limits or {}).items()}
+        # 수집 중인 장비 수 (제한 시간을 넘겨 백그라운드에서 실행 중인 작업 스레드 포함)
+        self._slots = threading.Condition()
+        self._running = 0
+        self._vendor_running: Dict[str, int] = {}
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def _device_name(device: dict) -> str:
+        return str(device.get('name') or device.get('hostname') or device.get('device_ip'))
+
+    def _collect_device(self, device: dict, outcome: dict) -> None:
+        """장비 1대의 Collector를 생성하고 하나의 수집 세션에서 지정된 항목을 순서대로 수집합니다."""
+        params = {key: value for key, value in device.items() if key not in RESERVED_KEYS}
+        try:
+            collector = FirewallCollectorFactory.get_collector(device['source_type'], **params)
+        except Exception as e:
+            outcome['errors'].append(('collector', str(e)))
+            return
+
+        # 장비 연결과 내려받은 데이터를 모든 수집 항목이 공유하도록 하나의 세션에서 수집
+        try:
+            with collector.session():
+                for export_name in self.exports:
+                    method = getattr(collector, EXPORT_METHODS[export_name])
+                    try:
+                        if export_name == 'usage_logs':
+                            df = method(self.usage_days)
+                        else:
+                            df = method()
+                        if df is None:
+                            df = pd.DataFrame()
+                        elif export_name == 'security_rules':
+                            # 변경 비교/중복 제거에 사용할 정책별 내용 해시를 수집 시점에 함께 저장
+                            df = add_fingerprints(df)
+                        outcome['data'][export_name] = df
+                    except Exception as e:
+                        outcome['errors'].append((export_name, str(e)))
+        except Exception as e:
+            outcome['errors'].append(('session', str(e)))
+        finally:
+            # 장비마다 생성한 Collector의 커넥션 풀/이벤트 루프를 정리
+            try:
+                collector.close()
+            except Exception as e:
+                self.logger.warning(f"{self._device_name(device)} Collector 정리 중 오류 발생: {e}")
+
+    def _has_free_slot(self, vendor: str) -> bool:
+        """전체/벤더별 동시성 제한 안에서 장비를 더 수집할 수 있는지 확인합니다. (_slots 잠금 안에서 호출)"""
+        if self._running >= self.max_workers:
+            return False
+        limit = self.vendor_limits.get(vendor)
+        return limit is None or self._vendor_running.get(vendor, 0) < limit
+
+    def _acquire_slot(self, vendor: str) -> None:
+        """전체/벤더별 동시성 슬롯을 점유합니다. (_slots 잠금 안에서 호출)"""
+        self._running += 1
+        self._vendor_running[vendor] = self._vendor_running.get(vendor, 0) + 1
+
+    def _release_slot(self, vendor: str) -> None:
+        """전체/벤더별 동시성 슬롯을 반환하고 대기 중인 장비의 수집을 시작하도록 알립니다."""
+        with self._slots:
+            self._running -= 1
+            self._vendor_running[vendor] -= 1
+            self._slots.notify_all()
+
+    def _collect_device_in_slot(self, device: dict, outcome: dict, vendor: str) -> None:
+        """
+        장비 1대를 수집하고, 작업 스레드가 실제로 끝날 때 동시성 슬롯을 반환합니다.
+        제한 시간을 넘긴 작업도 스레드가 종료될 때까지 슬롯을 점유하므로
+        max_workers와 vendor_limits가 항상 지켜집니다.
+        """
+        try:
+            self._collect_device(device, outcome)
+        finally:
+            self._release_slot(vendor)
+
+    def _run_device(self, device: dict) -> dict:
+        """
+        이미 점유한 동시성 슬롯 안에서 장비 1대를 수집합니다.
+        제한 시간을 넘기면 그때까지 완료된 항목만 반환하고 나머지는 실패로 기록합니다.
+        (응답 없는 소켓 호출은 중단할 수 없으므로 해당 작업 스레드는 백그라운드에서 종료되며,
+        종료될 때까지 동시성 슬롯을 계속 점유합니다.)
+        """
+        name = self._device_name(device)
+        vendor = str(device['source_type']).lower()
+        timeout = device.get('timeout', self.device_timeout)
+        outcome = {'data': {}, 'errors': []}
+
+        start = time.monotonic()
+        worker = threading.Thread(
+            target=self._collect_device_in_slot,
+            args=(device, outcome, vendor),
+            name=f"fleet-{name}",
+            daemon=True
+        )
+        try:
+            worker.start()
+        except Exception:
+            self._release_slot(vendor)
+            raise
+        worker.join(timeout)
+        elapsed = time.monotonic() - start
+
+        if worker.is_alive():
+            data = dict(outcome['data'])
+            errors = list(outcome['errors'])
+            finished = set(data) | {export for export, _ in errors}
+            errors.extend(
+                (export_name, f"수집 제한 시간 초과 ({timeout}초)")
+                for export_name in self.exports if export_name not in finished
+            )
+            self.logger.error(f"{name} 수집 제한 시간 초과 ({elapsed:.1f}초)")
+            return {'name': name, 'vendor': vendor, 'data': data, 'errors': errors}
+
+        if outcome['errors']:
+            self.logger.warning(f"{name} 수집 일부 실패 ({elapsed:.1f}초): {len(outcome['errors'])}건")
+        else:
+            self.logger.info(f"{name} 수집 완료 ({elapsed:.1f}초)")
+        return {'name': name, 'vendor': vendor, 'data': outcome['data'], 'errors': outcome['errors']}
+
+    def _run_devices(self, inventory: List[dict]) -> List[dict]:
+        """
+        벤더별 대기열에서 슬롯이 비어 있는 벤더의 장비만 꺼내 수집을 시작합니다.
+        동시성 제한에 걸린 벤더의 장비가 다른 벤더 장비의 수집을 막지 않으며,
+        시작 가능한 장비가 여럿이면 인벤토리 순서를 따릅니다.
+
+        Returns:
+            인벤토리 순서의 장비별 수집 결과 (_run_device 참고)
+        """
+        queues: Dict[str, deque] = {}
+        for index, device in enumerate(inventory):
+            queues.setdefault(str(device['source_type']).lower(), deque()).append(index)
+
+        results: List[Optional[dict]] = [None] * len(inventory)
+        errors: List[Exception] = []
+
+        def run(index: int) -> None:
+            try:
+                results[index] = self._run_device(inventory[index])
+            except Exception as e:
+                errors.append(e)
+
+        threads = []
+        with self._slots:
+            while queues:
+                ready = [vendor for vendor in queues if self._has_free_slot(vendor)]
+                if not ready:
+                    self._slots.wait()
+                    continue
+                vendor = min(ready, key=lambda name: queues[name][0])
+                index = queues[vendor].popleft()
+                if not queues[vendor]:
+                    del queues[vendor]
+                self._acquire_slot(vendor)
+                thread = threading.Thread(target=run, args=(index,), name=f"fleet-run-{index}")
+                try:
+                    thread.start()
+                except Exception:
+                    self._running -= 1
+                    self._vendor_running[vendor] -= 1
+                    raise
+                threads.append(thread)
+
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return results
+
+    def collect(self, inventory: List[dict]) -> Dict[str, pd.DataFrame]:
+        """
+        인벤토리의 모든 장비를 병렬로 수집합니다.
+
+        Args:
+            inventory: 장비 dict 리스트 (load_inventory 참고)
+
+        Returns:
+            수집 항목별로 합쳐진 DataFrame 딕셔너리
+            - 각 수집 항목: 맨 앞에 Device, Vendor 컬럼이 추가된 전체 장비 데이터
+              (security_rules에는 firewall.fingerprint의 내용 해시 컬럼 포함)
+            - failures: 실패한 장비/항목 목록 (Device, Vendor, Export, Error)
+        """
+        self.logger.info(f"장비 {len(inventory)}대 수집 시작")
+        start = time.monotonic()
+
+        device_results = self._run_devices(inventory)
+
+        frames = {export_name: [] for export_name in self.exports}
+        failures = []
+        for result in device_results:
+            for export_name, df in result['data'].items():
+                tagged = df.copy()
+                tagged.insert(0, 'Device', result['name'])
+                tagged.insert(1, 'Vendor', result['vendor'])
+                frames[export_name].append(tagged)
+            for export_name, error in result['errors']:
+                failures.append({
+                    'Device': result['name'],
+                    'Vendor': result['vendor'],
+                    'Export': export_name,
+                    'Error': error
+                })
+
+        combined = {
+            export_name: pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame(columns=['Device', 'Vendor'])
+            for export_name, dfs in frames.items()
+        }
+        combined['failures'] = pd.DataFrame(failures, columns=FAILURE_COLUMNS)
+
+        failed_devices = combined['failures']['Device'].nunique()
+        self.logger.info(
+            f"장비 {len(inventory)}대 수집 완료 ({time.monotonic() - start:.1f}초) - "
+            f"실패 장비: {failed_devices}대"
+        )
+        return combined
@@ -0,0 +1,138 @@
+# firewall/group_resolver.py
+import logging
+from typing import Dict, Hashable, Iterable, List, Optional
+
+import pandas as pd
+
+# 그룹 이름의 범위를 구분하는 컬럼 (같은 이름의 그룹도 범위가 다르면 다른 그룹)
+SCOPE_COLUMNS = ['Device', 'Vsys']
+
+
+def expand_groups(adjacency: Dict[Hashable, Iterable[Hashable]]) -> Dict[Hashable, List[Hashable]]:
+    """
+    중첩 그룹의 전체 멤버(하위 그룹을 모두 펼친 결과)를 계산합니다.
+
+    adjacency의 키는 그룹 ID, 값은 직접 멤버 ID 목록입니다. 멤버 ID가 adjacency의 키이면
+    하위 그룹으로, 아니면 일반 객체(leaf)로 취급합니다.
+    강연결 요소(Tarjan) 단위로 한 번씩만 계산하므로 그룹과 멤버 수에 비례하는 시간에 끝나며,
+    순환 참조된 그룹들은 서로의 멤버를 모두 공유하는 것으로 처리하고 경고를 남깁니다.
+
+    :param adjacency: {그룹 ID: 직접 멤버 ID 목록}
+    :return: {그룹 ID: 중복 없이 처음 나온 순서대로 정렬된 leaf 멤버 ID 리스트}
+    """
+    members = {group_id: list(member_ids) for group_id, member_ids in adjacency.items()}
+    closures: Dict[Hashable, List[Hashable]] = {}
+    index: Dict[Hashable, int] = {}
+    lowlink: Dict[Hashable, int] = {}
+    on_stack = set()
+    stack: List[Hashable] = []
+
+    def close_component(component: List[Hashable]) -> None:
+        component_set = set(component)
+        if len(component) > 1 or component[0] in members[component[0]]:
+            logging.warning("그룹 순환 참조 감지: %s", ', '.join(map(str, component)))
+        closure = {}
+        for group_id in reversed(component):
+            for member_id in members[group_id]:
+                if member_id in component_set:
+                    continue
+                if member_id in members:
+                    closure.update(dict.fromkeys(closures[member_id]))
+                else:
+                    closure[member_id] = None
+        result = list(closure)
+        for group_id in component:
+            closures[group_id] = result
+
+    # 재귀 대신 명시적 스택으로 깊이 우선 탐색 (깊은 중첩에서도 재귀 한도에 걸리지 않음)
+    for root in members:
+        if root in index:
+            continue
+        work = [(root, 0)]
+        while work:
+            group_id, position = work.pop()
+            if position == 0:
+                index[group_id] = lowlink[group_id] = len(index)
+                stack.append(group_id)
+                on_stack.add(group_id)
+            else:
+                child = members[group_id][position - 1]
+                if child in members and child in on_stack:
+                    lowlink[group_id] = min(lowlink[group_id], lowlink[child])
+
+            children = members[group_id]
+            while position < len(children):
+                child = children[position]
+                position += 1
+                if child not in members:
+                    continue
+                if child not in index:
+                    work.append((group_id, position))
+                    work.append((child, 0))
+                    break
+                if child in on_stack:
+                    lowlink[group_id] = min(lowlink[group_id], index[child])
+            else:
+                if lowlink[group_id] == index[group_id]:
+                    component = []
+                    while True:
+                        member_id = stack.pop()
+                        on_stack.discard(member_id)
+                        component.append(member_id)
+                        if member_id == group_id:
+                            break
+                    close_component(component)
+
+    return closures
+
+
+def flatten_group_entries(group_df: pd.DataFrame, name_column: str = 'Group Name',
+                          entry_column: str = 'Entry', scope_columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Entry에 다른 그룹 이름이 포함된 그룹 DataFrame을 전체 멤버로 펼쳐서 반환합니다.
+
+    행마다 별도의 그룹으로 펼치며, 멤버 이름은 같은 범위(scope_columns 값이 같은 행)의 그룹만 참조합니다.
+    같은 범위에 이름이 같은 그룹이 여러 개이면(범위 컬럼이 없는 여러 vsys 데이터 등) 각 행은 자신의
+    멤버를 유지하고, 그 이름을 참조하는 다른 그룹은 같은 이름의 그룹을 모두 펼칩니다.
+
+    :param group_df: 그룹 이름과 콤마로 구분된 멤버 문자열을 가진 DataFrame
+    :param name_column: 그룹 이름 컬럼
+    :param entry_column: 멤버 문자열 컬럼
+    :param scope_columns: 그룹 이름의 범위 컬럼 (기본값: SCOPE_COLUMNS 중 group_df에 있는 컬럼)
+    :return: entry_column을 펼친 멤버로 바꾼 DataFrame 복사본
+    """
+    if group_df.empty:
+        return group_df
+
+    if scope_columns is None:
+        scope_columns = [column for column in SCOPE_COLUMNS if column in group_df.columns]
+    scopes = list(zip(*(group_df[column] for column in scope_columns))) if scope_columns else [()] * len(group_df)
+
+    # 그룹 노드는 (이름, 행 위치)로 구분 (멤버 이름 문자열과 겹치지 않도록 튜플 사용)
+    nodes = list(zip(group_df[name_column], range(len(group_df))))
+    rows_by_name = {}
+    for scope, node in zip(scopes, nodes):
+        rows_by_name.setdefault((scope, node[0]), []).append(node)
+    duplicated = [str(name) for (_, name), group_nodes in rows_by_name.items() if len(group_nodes) > 1]
+    if duplicated:
+        logging.warning("같은 범위에 이름이 같은 그룹이 있습니다: %s", ', '.join(duplicated))
+
+    adjacency = {}
+    for scope, node, entry in zip(scopes, nodes, group_df[entry_column]):
+        members = []
+        member_ids = [member.strip() for member in entry.split(',')] if isinstance(entry, str) else []
+        for member_id in member_ids:
+            if not member_id:
+                continue
+            referenced = rows_by_name.get((scope, member_id))
+            if referenced is None:
+                members.append(member_id)
+            else:
+                # 그룹은 자기 자신을 포함할 수 없으므로 같은 이름의 다른 그룹을 참조한 것으로 처리
+                members.extend(group for group in referenced if group != node)
+        adjacency[node] = members
+
+    closures = expand_groups(adjacency)
+    result = group_df.copy()
+    result[entry_column] = [','.join(closures[node]) for node in nodes]
+    return result
@@ -0,0 +1,83 @@
+# firewall/http_session.py
+import asyncio
+import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:  # 비동기 Collector를 사용할 때만 필요
+    aiohttp = None
+
+# 재시도할 HTTP 상태 코드 (과부하/일시 장애)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_http_session(pool_size: int = 10, max_retries: int = 3,
+                        backoff_factor: float = 0.5) -> requests.Session:
+    """
+    장비 단위로 공유하는 keep-alive HTTP 세션을 생성합니다.
+    같은 장비에 대한 모든 API 호출이 커넥션 풀을 재사용하므로
+    호출마다 TCP/TLS 핸드셰이크를 반복하지 않습니다.
+
+    :param pool_size: 장비당 유지할 최대 커넥션 수
+    :param max_retries: 연결 실패 및 일시 장애 응답에 대한 최대 재시도 횟수
+    :param backoff_factor: 재시도 간 지수 백오프 계수 (초)
+    :return: 풀링/재시도 어댑터가 장착된 requests.Session
+    """
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.verify = False
+    return session
+
+
+def create_async_http_session(pool_size: int = 10) -> 'aiohttp.ClientSession':
+    """
+    비동기 Collector용 keep-alive HTTP 세션을 생성합니다.
+    실행 중인 이벤트 루프 안에서 호출해야 합니다.
+
+    :param pool_size: 장비당 유지할 최대 커넥션 수
+    :return: 커넥션 수가 제한된 aiohttp.ClientSession
+    """
+    if aiohttp is None:
+        raise ImportError("비동기 Collector를 사용하려면 aiohttp 패키지가 필요합니다 (pip install aiohttp)")
+    connector = aiohttp.TCPConnector(limit_per_host=pool_size, ssl=False)
+    return aiohttp.ClientSession(connector=connector)
+
+
+async def request_with_retry(session: 'aiohttp.ClientSession', method: str, url: str,
+                             max_retries: int = 3, backoff_factor: float = 0.5, **kwargs):
+    """
+    create_http_session과 같은 기준(연결 실패, RETRY_STATUS_CODES)으로 재시도하며 비동기 요청을 수행합니다.
+    반환된 응답은 호출한 쪽에서 본문을 읽거나 release() 해야 합니다.
+
+    :param session: aiohttp.ClientSession
+    :param method: HTTP 메서드
+    :param url: 요청 URL
+    :param max_retries: 최대 재시도 횟수
+    :param backoff_factor: 재시도 간 지수 백오프 계수 (초)
+    :return: aiohttp.ClientResponse
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            response = await session.request(method, url, **kwargs)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == max_retries:
+                raise
+        else:
+            if response.status not in RETRY_STATUS_CODES or attempt == max_retries:
+                return response
+            response.release()
+        await asyncio.sleep(backoff_factor * (2 ** attempt))
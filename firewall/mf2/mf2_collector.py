@@ -1,43 +1,98 @@
 # firewall/mf2/mf2_collector.py
 import pandas as pd
 from typing import Optional
+from contextlib import contextmanager
 from firewall.firewall_interface import FirewallInterface
-from .mf2_module import show_system_info, export_security_rules, download_object_files, host_parsing, network_parsing, combine_mask_end, delete_files, export_address_objects, service_parsing
-import os
+from .mf2_module import (
+    show_system_info, export_security_rules, export_mf2_data, fetch_object_contents, parse_rule_content,
+    parse_host_content, parse_network_content, parse_group_content, parse_service_content, combine_mask_end,
+    build_address_objects
+)
+
+REMOTE_DIRECTORY = '/secui/etc/'
+
+# conf 파일별 파서
+CONF_PARSERS = {
+    'hostobject.conf': parse_host_content,
+    'networkobject.conf': parse_network_content,
+    'groupobject.conf': parse_group_content,
+    'serviceobject.conf': parse_service_content,
+}
+
 
 class MF2Collector(FirewallInterface):
     def __init__(self, device_ip: str, username: str, password: str):
         self.device_ip = device_ip
         self.username = username
         self.password = password
-        module_dir = os.path.dirname(os.path.abspath(__file__))
-        self.temp_dir = os.path.join(module_dir, 'temp')
-        os.makedirs(self.temp_dir, exist_ok=True)
+        # 수집 세션 상태 (session() 안에서만 사용)
+        self._session_contents = None
+        self._session_frames = {}
+
+    @contextmanager
+    def session(self):
+        """수집 세션 컨텍스트 매니저.
+        하나의 SSH 연결로 fwrules 파일과 conf 파일 4종의 내용을 한 번에 메모리로 읽어오고,
+        세션 안의 모든 export는 이 내용의 파싱 결과를 공유합니다.
+        세션 밖에서 호출된 export는 기존처럼 필요한 파일만 개별로 읽어옵니다.
+        """
+        if self._session_contents is not None:  # 이미 열린 세션 재사용
+            yield self
+            return
+
+        try:
+            self._session_contents = export_mf2_data(
+                self.device_ip, 22, self.username, self.password, REMOTE_DIRECTORY
+            )
+            self._session_frames = {}
+            yield self
+        finally:
+            self._session_contents = None
+            self._session_frames = {}
+
+    def _session_frame(self, file_key: str, parser) -> Optional[pd.DataFrame]:
+        """세션에서 읽어온 파일의 파싱 결과를 반환합니다 (파일별로 한 번만 파싱)."""
+        if file_key not in self._session_contents:
+            return None
+        if file_key not in self._session_frames:
+            self._session_frames[file_key] = parser(self._session_contents[file_key])
+        # 호출한 쪽에서 컬럼을 추가/변경하므로 복사본 반환
+        return self._session_frames[file_key].copy()
+
+    def _object_frames(self, conf_types: list) -> Optional[dict]:
+        """conf 파일별 파싱 결과를 반환합니다. 필요한 파일이 하나라도 없으면 None을 반환합니다."""
+        if self._session_contents is not None:
+            frames = {conf: self._session_frame(conf, CONF_PARSERS[conf]) for conf in conf_types}
+            return None if any(df is None for df in frames.values()) else frames
+
+        contents = fetch_object_contents(self.device_ip, 22, self.username, self.password, REMOTE_DIRECTORY, conf_types)
+        if len(contents) < len(conf_types):
+            return None
+        return {conf: CONF_PARSERS[conf](contents[conf]) for conf in conf_types}
 
     def get_system_info(self) -> pd.DataFrame:
         # 기본 포트 22 사용
         return show_system_info(self.device_ip, self.username, self.password)
 
     def export_security_rules(self) -> pd.DataFrame:
+        if self._session_contents is not None:
+            rule_df = self._session_frame('fwrules', parse_rule_content)
+            return rule_df if rule_df is not None else pd.DataFrame()
         return export_security_rules(self.device_ip, self.username, self.password)
 
     def export_network_objects(self) -> pd.DataFrame:
         """네트워크 객체 정보를 PaloAlto 형식으로 변환하여 반환합니다."""
-        conf_types = ['hostobject.conf', 'networkobject.conf']
-        files = download_object_files(self.device_ip, 22, self.username, self.password, '/secui/etc/', self.temp_dir, conf_types)
-        if len(files) < len(conf_types):
+        frames = self._object_frames(['hostobject.conf', 'networkobject.conf'])
+        if frames is None:
             return pd.DataFrame(columns=['Name', 'Type', 'Value'])
 
-        host_file = os.path.join(self.temp_dir, f"{self.device_ip}_hostobject.conf")
-        network_file = os.path.join(self.temp_dir, f"{self.device_ip}_networkobject.conf")
-
         # 호스트 객체 처리
-        host_df = host_parsing(host_file)
+        host_df = frames['hostobject.conf']
         host_df = host_df[['name', 'ip']].rename(columns={'name': 'Name', 'ip': 'Value'})
         host_df['Type'] = 'ip-netmask'
 
         # 네트워크 객체 처리
-        network_df = network_parsing(network_file)
+        network_df = frames['networkobject.conf']
         network_df['Value'] = network_df.apply(combine_mask_end, axis=1)
         network_df = network_df[['name', 'Value']].rename(columns={'name': 'Name'})
         network_df['Type'] = 'ip-netmask'
@@ -46,38 +101,29 @@ class MF2Collector(FirewallInterface):
         result_df = pd.concat([host_df, network_df], ignore_index=True)
         # 'Value'에 '-'가 포함되어 있으면 ip-range, 그렇지 않으면 ip-netmask로 설정
         result_df['Type'] = result_df['Value'].apply(lambda v: 'ip-range' if '-' in str(v) else 'ip-netmask')
-
-        delete_files(files)
         return result_df
 
     def export_network_group_objects(self) -> pd.DataFrame:
         """네트워크 그룹 객체 정보를 PaloAlto 형식으로 변환하여 반환합니다."""
-        conf_types = ['hostobject.conf', 'networkobject.conf', 'groupobject.conf']
-        files = download_object_files(self.device_ip, 22, self.username, self.password, '/secui/etc/', self.temp_dir, conf_types)
-        if len(files) < len(conf_types):
+        frames = self._object_frames(['hostobject.conf', 'networkobject.conf', 'groupobject.conf'])
+        if frames is None:
             return pd.DataFrame(columns=['Group Name', 'Entry'])
 
-        group_file = os.path.join(self.temp_dir, f"{self.device_ip}_groupobject.conf")
-        host_file = os.path.join(self.temp_dir, f"{self.device_ip}_hostobject.conf")
-        network_file = os.path.join(self.temp_dir, f"{self.device_ip}_networkobject.conf")
-
-        address_df, group_df = export_address_objects(group_file, host_file, network_file)
-        delete_files(files)
+        address_df, group_df = build_address_objects(
+            frames['groupobject.conf'], frames['hostobject.conf'], frames['networkobject.conf']
+        )
         return group_df[['Group Name', 'Entry']]
 
     def export_service_objects(self) -> pd.DataFrame:
         """서비스 객체 정보를 PaloAlto 형식으로 변환하여 반환합니다."""
-        conf_types = ['serviceobject.conf']
-        files = download_object_files(self.device_ip, 22, self.username, self.password, '/secui/etc/', self.temp_dir, conf_types)
-        if len(files) < len(conf_types):
+        frames = self._object_frames(['serviceobject.conf'])
+        if frames is None:
             return pd.DataFrame(columns=['Name', 'Protocol', 'Port'])
 
-        service_file = os.path.join(self.temp_dir, f"{self.device_ip}_serviceobject.conf")
-        service_df = service_parsing(service_file)
+        service_df = frames['serviceobject.conf']
         service_df = service_df[['name', 'protocol', 'str_svc_port']].rename(
             columns={'name': 'Name', 'protocol': 'Protocol', 'str_svc_port': 'Port'}
         )
-        delete_files(files)
         return service_df
 
     def export_service_group_objects(self) -> pd.DataFrame:
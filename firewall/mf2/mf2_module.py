@@ -1,11 +1,13 @@
+import io
 import os
 import re
 import logging
 import paramiko
 from scp import SCPClient
 import pandas as pd
-from openpyxl import load_workbook
-from openpyxl.styles import PatternFill
+
+from firewall.group_resolver import expand_groups
+from firewall.excel_writer import write_excel
 
 # Paramiko의 로그 레벨을 WARNING 이상으로 설정 (INFO 로그 제거)
 
@@ -14,6 +16,9 @@ POLICY_DIRECTORY = 'ls -ls *.fwrules'
 CONF_DIRECTORY = 'ls *.conf'
 INFO_FILE = 'cat /etc/SECUIMF2.info'
 
+# 수집 대상 객체 conf 파일
+OBJECT_CONF_FILES = ['groupobject.conf', 'hostobject.conf', 'networkobject.conf', 'serviceobject.conf']
+
 # 정규표현식 패턴
 HOST_PATTERN = {
     'id': r'id = (\d+)',
@@ -65,6 +70,22 @@ SERVICE_PATTERN = {
     'description': r'd = "([^"]+)"',
 }
 
+# 규칙 파일 필드 패턴
+RULE_PATTERN = {
+    'rid': r"\{rid=(.*?), ",
+    'description': r"description=\"(.*?)\", use=",
+    'use': r"use=\"(.*?)\", action",
+    'action': r"action=\"(.*?)\", group",
+    'shaping_string': r"shaping_string=\"(.*?)\", bi_di",
+    'source': r"from = \{(.*?)\},  to",
+    'destination': r"to = \{(.*?)\},  service",
+    'service': r"service = \{(.*?)\},  vid",
+    'ua': r"ua = \{(.*?)\}, unuse",
+}
+
+# 중괄호 토큰
+BRACE_TOKEN = re.compile(r'[{}]')
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 
@@ -89,49 +110,58 @@ def exec_remote_command(ssh: paramiko.SSHClient, command: str, remote_directory:
     return ssh.exec_command(full_command)
 
 
-def download_file(ssh: paramiko.SSHClient, remote_directory: str, file_name: str, local_directory: str, host: str) -> str:
+def read_remote_file(scp: SCPClient, remote_directory: str, file_name: str) -> str:
+    """
+    SCP 채널로 원격 파일을 메모리 버퍼에 받아 문자열로 반환합니다.
+    로컬 디스크에는 파일을 남기지 않습니다.
+    """
+    buffer = io.BytesIO()
+    scp.getfo(os.path.join(remote_directory, file_name), buffer)
+    return buffer.getvalue().decode('utf-8-sig')
+
+
+def find_latest_rule_file(ssh: paramiko.SSHClient, remote_directory: str) -> str:
+    """
+    원격 디렉토리에서 최신 fwrules 파일명을 반환합니다. 파일이 없으면 빈 문자열을 반환합니다.
+    """
+    _, stdout, stderr = exec_remote_command(ssh, POLICY_DIRECTORY, remote_directory)
+    error = stderr.read()
+    if error:
+        raise Exception(f"정책 파일 조회 실패: {error.decode()}")
+    fwrules_lines = stdout.readlines()
+    return fwrules_lines[0].split()[-1] if fwrules_lines else ""
+
+
+def list_conf_files(ssh: paramiko.SSHClient, remote_directory: str, conf_types: list) -> list:
     """
-    SCPClient를 사용하여 파일을 다운로드하고, 다운로드된 파일명을 반환합니다.
+    원격 디렉토리의 conf 파일 중 conf_types에 해당하는 파일명을 반환합니다.
     """
-    remote_path = os.path.join(remote_directory, file_name)
-    download_name = f"{host}_{file_name}"
-    local_path = os.path.join(local_directory, download_name)
-    with SCPClient(ssh.get_transport()) as scp:
-        scp.get(remote_path, local_path)
-    return download_name
+    _, stdout, stderr = exec_remote_command(ssh, CONF_DIRECTORY, remote_directory)
+    error = stderr.read()
+    if error:
+        raise Exception(f"설정 파일 조회 실패: {error.decode()}")
+    return [line.strip() for line in stdout.readlines() if line.strip() in conf_types]
 
 
 # ────────────── SSH/FILE DOWNLOAD FUNCTIONS ──────────────
 
-def export_mf2_data(host: str, port: int, username: str, password: str,
-                    remote_directory: str, local_directory: str) -> list:
-    downloaded_files = []
+def export_mf2_data(host: str, port: int, username: str, password: str, remote_directory: str) -> dict:
+    """
+    하나의 SSH 연결에서 최신 fwrules 파일과 객체 conf 파일 4종의 내용을 모두 읽어옵니다.
+
+    :return: {'fwrules': 규칙 파일 내용, '<conf 파일명>': conf 파일 내용} 형태의 딕셔너리
+    """
     ssh = None
     try:
         ssh = create_ssh_client(host, port, username, password)
-        # fwrules 파일 다운로드
-        _, stdout, stderr = exec_remote_command(ssh, POLICY_DIRECTORY, remote_directory)
-        if stderr.read():
-            raise Exception(f"정책 파일 조회 실패: {stderr.read().decode()}")
-            
-        fwrules_lines = stdout.readlines()
-        if fwrules_lines:
-            latest_file = fwrules_lines[0].split()[-1]
-            downloaded_files.append(download_file(ssh, remote_directory, latest_file, local_directory, host))
-
-        # conf 파일 다운로드
-        specified_conf_files = ['groupobject.conf', 'hostobject.conf', 'networkobject.conf', 'serviceobject.conf']
-        _, stdout, stderr = exec_remote_command(ssh, CONF_DIRECTORY, remote_directory)
-        if stderr.read():
-            raise Exception(f"설정 파일 조회 실패: {stderr.read().decode()}")
-            
-        conf_lines = stdout.readlines()
-        for line in conf_lines:
-            conf_file = line.strip()
-            if conf_file in specified_conf_files:
-                downloaded_files.append(download_file(ssh, remote_directory, conf_file, local_directory, host))
-        
-        return downloaded_files
+        contents = {}
+        with SCPClient(ssh.get_transport()) as scp:
+            latest_file = find_latest_rule_file(ssh, remote_directory)
+            if latest_file:
+                contents['fwrules'] = read_remote_file(scp, remote_directory, latest_file)
+            for conf_file in list_conf_files(ssh, remote_directory, OBJECT_CONF_FILES):
+                contents[conf_file] = read_remote_file(scp, remote_directory, conf_file)
+        return contents
     except Exception as e:
         logging.error(f"MF2 데이터 내보내기 실패 - {host}: {str(e)}")
         raise Exception(f"MF2 데이터 내보내기 실패: {str(e)}")
@@ -140,56 +170,45 @@ def export_mf2_data(host: str, port: int, username: str, password: str,
             ssh.close()
 
 
-def download_rule_file(host: str, port: int, username: str, password: str,
-                       remote_directory: str, local_directory: str) -> str:
+def fetch_rule_content(host: str, port: int, username: str, password: str, remote_directory: str) -> str:
     """
-    원격 장비에서 fwrules 파일(최신 파일 1건)을 다운로드한 후,
-    다운로드된 파일명을 반환합니다.
+    원격 장비에서 최신 fwrules 파일(1건)의 내용을 읽어 반환합니다.
+    실패하면 빈 문자열을 반환합니다.
     """
-    latest_download = ""
+    content = ""
     ssh = create_ssh_client(host, port, username, password)
     try:
-        _, stdout, _ = exec_remote_command(ssh, POLICY_DIRECTORY, remote_directory)
-        fwrules_lines = stdout.readlines()
-        if fwrules_lines:
-            latest_file = fwrules_lines[0].split()[-1]
-            latest_download = download_file(ssh, remote_directory, latest_file, local_directory, host)
+        latest_file = find_latest_rule_file(ssh, remote_directory)
+        if latest_file:
+            with SCPClient(ssh.get_transport()) as scp:
+                content = read_remote_file(scp, remote_directory, latest_file)
     except Exception as e:
-        logging.error("download_rule_file error: %s", e)
+        logging.error("fetch_rule_content error: %s", e)
     finally:
         ssh.close()
-        return latest_download
+    return content
 
 
-def download_object_files(host: str, port: int, username: str, password: str,
-                          remote_directory: str, local_directory: str, conf_types: list = None) -> list:
+def fetch_object_contents(host: str, port: int, username: str, password: str,
+                          remote_directory: str, conf_types: list = None) -> dict:
     """
-    원격 장비에서 지정된 conf 파일들을 다운로드한 후, 다운로드된 파일명 리스트를 반환합니다.
+    원격 장비에서 지정된 conf 파일들의 내용을 읽어 {conf 파일명: 내용} 딕셔너리로 반환합니다.
+    실패하면 그때까지 읽은 파일만 반환합니다.
     """
     if conf_types is None:
-        conf_types = ['groupobject.conf', 'hostobject.conf', 'networkobject.conf', 'serviceobject.conf']
-    
-    downloaded_files = []
+        conf_types = OBJECT_CONF_FILES
+
+    contents = {}
     ssh = create_ssh_client(host, port, username, password)
     try:
-        _, stdout, _ = exec_remote_command(ssh, CONF_DIRECTORY, remote_directory)
-        conf_lines = stdout.readlines()
         with SCPClient(ssh.get_transport()) as scp:
-            for line in conf_lines:
-                conf_file = line.strip()
-                if conf_file in conf_types:
-                    # 다운로드할 로컬 파일 경로 지정
-                    download_name = f"{host}_{conf_file}"
-                    local_path = os.path.join(local_directory, download_name)
-                    # 이미 파일이 있으면 다운로드하지 않음
-                    if not os.path.exists(local_path):
-                        scp.get(os.path.join(remote_directory, conf_file), local_path)
-                    downloaded_files.append(local_path)
+            for conf_file in list_conf_files(ssh, remote_directory, conf_types):
+                contents[conf_file] = read_remote_file(scp, remote_directory, conf_file)
     except Exception as e:
-        logging.error("download_object_files error: %s", e)
+        logging.error("fetch_object_contents error: %s", e)
     finally:
         ssh.close()
-        return downloaded_files
+    return contents
 
 
 def show_system_info(host: str, username: str, password: str) -> pd.DataFrame:
@@ -235,22 +254,6 @@ def show_system_info(host: str, username: str, password: str) -> pd.DataFrame:
         ssh.close()
 
 
-def delete_files(file_paths):
-    """
-    파일 경로(리스트 또는 단일 경로)에 대해 존재하면 삭제합니다.
-    """
-    if not isinstance(file_paths, list):
-        file_paths = [file_paths]
-    for path in file_paths:
-        if os.path.exists(path):
-            try:
-                os.remove(path)
-            except Exception as e:
-                logging.error("파일 삭제 실패 (%s): %s", path, e)
-        else:
-            logging.warning("File not found: %s", path)
-
-
 # ────────────── FILE CONTENT & PARSING FUNCTIONS ──────────────
 
 def remove_newlines_from_file(file_path: str) -> str:
@@ -269,50 +272,77 @@ def remove_newlines_from_file(file_path: str) -> str:
 def extract_braces_of_depth_1_or_more(content: str) -> list:
     """
     중괄호({})로 둘러싸인 블록 중 깊이가 1 이상인 내용들을 리스트로 반환합니다.
+    중괄호 위치만 순회하며 최상위 블록을 오프셋으로 잘라내므로 파일 크기에 선형입니다.
     """
     depth = 0
+    start = 0
     results = []
-    temp = ""
-    for char in content:
-        if char == '{':
+    for match in BRACE_TOKEN.finditer(content):
+        if match.group() == '{':
             if depth == 0:
-                temp = ""
-            temp += char
+                start = match.start()
             depth += 1
-        elif char == '}':
-            temp += char
+        else:
             depth -= 1
             if depth == 0:
-                results.append(temp.strip())
-        elif depth >= 1:
-            temp += char
+                results.append(content[start:match.end()])
     return results
 
 
 def extract_braces_of_depth_2_or_more_without_outer_braces(content: str) -> list:
     """
     중괄호 블록 중 깊이가 2 이상인 부분만 추출하여 외부 중괄호는 제거한 내용을 리스트로 반환합니다.
+    중괄호 위치만 순회하며 깊이 2 블록을 오프셋으로 잘라내므로 파일 크기에 선형입니다.
     """
     depth = 0
+    start = 0
     results = []
-    temp = ""
-    for char in content:
-        if char == '{':
-            if depth >= 1:
-                temp += char
+    for match in BRACE_TOKEN.finditer(content):
+        if match.group() == '{':
             depth += 1
-        elif char == '}':
+            if depth == 2:
+                start = match.end()
+        else:
             depth -= 1
-            if depth >= 1:
-                temp += char
-                if depth == 1:
-                    results.append(temp[1:-1].strip())
-                    temp = ""
-        elif depth >= 2:
-            temp += char
+            if depth == 1:
+                results.append(content[start:match.start()].strip())
     return results
 
 
+def compile_field_pattern(patterns: dict) -> dict:
+    """
+    필드별 정규표현식을 미리 컴파일합니다.
+    필드마다 개별 패턴을 유지해야 정규식 엔진이 키의 고정 문자열 접두사로 빠르게 탐색할 수 있으며,
+    키가 겹치는 필드(한 키가 다른 키의 일부인 경우)도 서로 영향을 주지 않습니다.
+
+    :param patterns: {필드명: 첫 번째 그룹을 값으로 가지는 정규표현식}
+    :return: {필드명: 컴파일된 패턴}
+    """
+    return {field: re.compile(pattern) for field, pattern in patterns.items()}
+
+
+def search_fields(compiled: dict, text: str) -> dict:
+    """
+    필드마다 re.search(pattern, text).group(1)과 같은 첫 번째 매치 값을 반환합니다.
+    결과 딕셔너리는 원래 패턴 정의 순서를 따르며, 매치되지 않은 필드는 포함하지 않습니다.
+    """
+    data = {}
+    for field, pattern in compiled.items():
+        match = pattern.search(text)
+        if match:
+            data[field] = match.group(1)
+    return data
+
+
+# 객체 타입별 컴파일된 필드 패턴
+HOST_FIELDS = compile_field_pattern(HOST_PATTERN)
+MASK_FIELDS = compile_field_pattern(MASK_PATTERN)
+RANGE_FIELDS = compile_field_pattern(RANGE_PATTERN)
+GROUP_FIELDS = compile_field_pattern(GROUP_PATTERN)
+SERVICE_FIELDS = compile_field_pattern(SERVICE_PATTERN)
+RULE_FIELDS = compile_field_pattern(RULE_PATTERN)
+
+
 def parse_object(input_str: str) -> str:
     """
     문자열에서 따옴표를 제거한 후, 공백이나 콤마 기준으로 두 번째 토큰을 추출하여 콤마로 연결한 문자열을 반환합니다.
@@ -333,49 +363,49 @@ def parse_object(input_str: str) -> str:
     return ','.join(parsed)
 
 
-def group_parsing(file_path: str) -> pd.DataFrame:
+def parse_group_content(content: str) -> pd.DataFrame:
     """
-    그룹 객체 파일을 파싱하여 DataFrame으로 반환합니다.
+    그룹 객체 파일 내용을 파싱하여 DataFrame으로 반환합니다.
     """
-    content = remove_newlines_from_file(file_path)
+    content = content.replace('\n', '')
     depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content)
     if depth_braces:
         depth_braces.pop(0)  # id 정보 삭제
 
     data_list = []
     for text in depth_braces:
-        data = {}
-        for key, pattern in GROUP_PATTERN.items():
-            match = re.search(pattern, text)
-            if match:
-                if key in ['hosts', 'networks']:
-                    items = []
-                    obj_str = match.group(1)
-                    if obj_str:
-                        for item in obj_str.split(','):
-                            # item 형식: key=value 또는 [key]
-                            items.append(item.split('=')[0].replace('[', '').replace(']', ''))
-                    data[key] = ','.join(items)
-                elif key == 'count':
-                    items = []
-                    obj_str = match.group(1)
-                    if obj_str:
-                        for item in obj_str.split(','):
-                            parts = item.split('=')
-                            if len(parts) > 1:
-                                items.append(parts[1])
-                    data[key] = ','.join(items)
-                else:
-                    data[key] = match.group(1)
+        data = search_fields(GROUP_FIELDS, text)
+        for key in ['count', 'hosts', 'networks']:
+            if key not in data:
+                continue
+            items = []
+            obj_str = data[key]
+            if obj_str:
+                for item in obj_str.split(','):
+                    if key == 'count':
+                        parts = item.split('=')
+                        if len(parts) > 1:
+                            items.append(parts[1])
+                    else:
+                        # item 형식: key=value 또는 [key]
+                        items.append(item.split('=')[0].replace('[', '').replace(']', ''))
+            data[key] = ','.join(items)
         data_list.append(data)
     return pd.DataFrame(data_list)
 
 
-def service_parsing(file_path: str) -> pd.DataFrame:
+def group_parsing(file_path: str) -> pd.DataFrame:
     """
-    서비스 객체 파일을 파싱하여 DataFrame으로 반환합니다.
+    그룹 객체 파일을 읽어 parse_group_content로 파싱합니다.
+    """
+    return parse_group_content(remove_newlines_from_file(file_path))
+
+
+def parse_service_content(content: str) -> pd.DataFrame:
+    """
+    서비스 객체 파일 내용을 파싱하여 DataFrame으로 반환합니다.
     """
-    content = remove_newlines_from_file(file_path)
+    content = content.replace('\n', '')
     depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content)
     if depth_braces:
         # 첫 두 항목(id 등) 삭제
@@ -385,102 +415,94 @@ def service_parsing(file_path: str) -> pd.DataFrame:
 
     data_list = []
     for text in depth_braces:
-        data = {}
-        for key, pattern in SERVICE_PATTERN.items():
-            match = re.search(pattern, text)
-            if match:
-                data[key] = match.group(1)
-        data_list.append(data)
+        data_list.append(search_fields(SERVICE_FIELDS, text))
     return pd.DataFrame(data_list)
 
 
-def network_parsing(file_path: str) -> pd.DataFrame:
+def service_parsing(file_path: str) -> pd.DataFrame:
+    """
+    서비스 객체 파일을 읽어 parse_service_content로 파싱합니다.
+    """
+    return parse_service_content(remove_newlines_from_file(file_path))
+
+
+def parse_network_content(content: str) -> pd.DataFrame:
     """
-    네트워크 객체 파일을 파싱하여 DataFrame으로 반환합니다.
+    네트워크 객체 파일 내용을 파싱하여 DataFrame으로 반환합니다.
     range 문자열 포함 여부에 따라 RANGE_PATTERN 또는 MASK_PATTERN을 사용합니다.
     """
-    content = remove_newlines_from_file(file_path)
+    content = content.replace('\n', '')
     depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content)
     if depth_braces:
         depth_braces.pop(0)
     data_list = []
     for text in depth_braces:
-        data = {}
-        pattern = RANGE_PATTERN if "range" in text else MASK_PATTERN
-        for key, pat in pattern.items():
-            match = re.search(pat, text)
-            if match:
-                data[key] = match.group(1)
-        data_list.append(data)
+        fields = RANGE_FIELDS if "range" in text else MASK_FIELDS
+        data_list.append(search_fields(fields, text))
     return pd.DataFrame(data_list)
 
 
-def host_parsing(file_path: str) -> pd.DataFrame:
+def network_parsing(file_path: str) -> pd.DataFrame:
+    """
+    네트워크 객체 파일을 읽어 parse_network_content로 파싱합니다.
+    """
+    return parse_network_content(remove_newlines_from_file(file_path))
+
+
+def parse_host_content(content: str) -> pd.DataFrame:
     """
-    호스트 객체 파일을 파싱하여 DataFrame으로 반환합니다.
+    호스트 객체 파일 내용을 파싱하여 DataFrame으로 반환합니다.
     """
-    content = remove_newlines_from_file(file_path)
+    content = content.replace('\n', '')
     depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content)
     if depth_braces:
         depth_braces.pop(0)
     data_list = []
     for text in depth_braces:
-        data = {}
-        for key, pattern in HOST_PATTERN.items():
-            match = re.search(pattern, text)
-            if match:
-                data[key] = match.group(1)
-        data_list.append(data)
+        data_list.append(search_fields(HOST_FIELDS, text))
     return pd.DataFrame(data_list)
 
 
-def rule_parsing(file_path: str) -> pd.DataFrame:
+def host_parsing(file_path: str) -> pd.DataFrame:
+    """
+    호스트 객체 파일을 읽어 parse_host_content로 파싱합니다.
+    """
+    return parse_host_content(remove_newlines_from_file(file_path))
+
+
+def parse_rule_content(content: str) -> pd.DataFrame:
     """
-    규칙(rule) 파일을 파싱하여 DataFrame으로 반환합니다.
+    규칙(rule) 파일 내용을 파싱하여 DataFrame으로 반환합니다.
     """
-    content = remove_newlines_from_file(file_path)
+    content = content.replace('\n', '')
     depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content)
     if not depth_braces:
         return pd.DataFrame()
     rule_blocks = extract_braces_of_depth_1_or_more(depth_braces[0])
 
-    # 정규표현식 패턴들
-    rule_pattern = r"\{rid=(.*?), "
-    description_pattern = r"description=\"(.*?)\", use="
-    use_pattern = r"use=\"(.*?)\", action"
-    action_pattern = r"action=\"(.*?)\", group"
-    shaping_pattern = r"shaping_string=\"(.*?)\", bi_di"
-    source_pattern = r"from = \{(.*?)\},  to"
-    destination_pattern = r"to = \{(.*?)\},  service"
-    service_pattern = r"service = \{(.*?)\},  vid"
-    ua_pattern = r"ua = \{(.*?)\}, unuse"
-
     policies = []
     for idx, block in enumerate(rule_blocks):
-        rulename = re.findall(rule_pattern, block)
-        description = re.findall(description_pattern, block)
-        use = re.findall(use_pattern, block)
-        action = re.findall(action_pattern, block)
-        shaping_string = re.findall(shaping_pattern, block)
-        shaping_string = shaping_string[0] if shaping_string else ""
+        fields = search_fields(RULE_FIELDS, block)
+        rulename = fields.get('rid')
+        shaping_string = fields.get('shaping_string', "")
         schedule = shaping_string.split('=')[1].lstrip('"') if "time=" in shaping_string else ''
-        source = re.findall(source_pattern, block)
-        destination = re.findall(destination_pattern, block)
-        service = re.findall(service_pattern, block)
-        ua = re.findall(ua_pattern, block)
+        source = fields.get('source')
+        destination = fields.get('destination')
+        service = fields.get('service')
+        ua = fields.get('ua')
 
         policy = {
             "Seq": idx + 1,
-            "Rule Name": int(rulename[0]) if rulename else None,
-            "Enable": use[0] if use else "",
-            "Action": action[0] if action else "",
-            "Source": parse_object(source[0]) if source else "",
-            "User": parse_object(ua[0]) if ua else "",
-            "Destination": parse_object(destination[0]) if destination else "",
-            "Service": parse_object(service[0]) if service else "",
+            "Rule Name": int(rulename) if rulename is not None else None,
+            "Enable": fields.get('use', ""),
+            "Action": fields.get('action', ""),
+            "Source": parse_object(source) if source is not None else "",
+            "User": parse_object(ua) if ua is not None else "",
+            "Destination": parse_object(destination) if destination is not None else "",
+            "Service": parse_object(service) if service is not None else "",
             "Application": "Any",
             "Security Profile": schedule,
-            "Description": description[0] if description else "",
+            "Description": fields.get('description', ""),
         }
         policies.append(policy)
 
@@ -491,6 +513,13 @@ def rule_parsing(file_path: str) -> pd.DataFrame:
     return df
 
 
+def rule_parsing(file_path: str) -> pd.DataFrame:
+    """
+    규칙(rule) 파일을 읽어 parse_rule_content로 파싱합니다.
+    """
+    return parse_rule_content(remove_newlines_from_file(file_path))
+
+
 # ────────────── OBJECT EXPORT & COMBINE FUNCTIONS ──────────────
 
 def combine_mask_end(row: pd.Series) -> str:
@@ -504,38 +533,34 @@ def combine_mask_end(row: pd.Series) -> str:
         return f"{row.get('ip/start')}-{row.get('mask/end')}"
 
 
-def replace_values(ids: str, mapping: dict) -> str:
+def build_address_objects(group_df: pd.DataFrame, host_df: pd.DataFrame, network_df: pd.DataFrame) -> tuple:
     """
-    콤마로 구분된 id 문자열을 mapping 사전을 통해 값으로 치환하여 반환합니다.
+    파싱된 그룹, 호스트, 네트워크 객체 DataFrame으로
+    네트워크 객체(DataFrame)와 그룹 객체(DataFrame)를 생성합니다.
     """
-    return ','.join(mapping.get(item.strip(), '') for item in ids.split(','))
-
-
-def combine_group_objects(row: pd.Series) -> str:
-    """
-    그룹 객체에서 변환된 hosts와 networks 값을 결합합니다.
-    """
-    values = [row.get('convert_hosts', ''), row.get('convert_networks', '')]
-    return ','.join(val for val in values if val and val.strip())
-
-
-def export_address_objects(group_file: str, host_file: str, network_file: str) -> tuple:
-    """
-    그룹, 호스트, 네트워크 객체 파일을 파싱하여
-    네트워크 객체(DataFrame)와 그룹 객체(DataFrame)를 반환합니다.
-    """
-    group_df = group_parsing(group_file)
-    network_df = network_parsing(network_file)
-    host_df = host_parsing(host_file)
-
     if not network_df.empty:
         network_df['Value'] = network_df.apply(combine_mask_end, axis=1)
     network_ids = dict(zip(network_df['id'].astype(str), network_df['Value'])) if 'id' in network_df and 'Value' in network_df else {}
     host_ids = dict(zip(host_df['id'].astype(str), host_df['ip'])) if 'id' in host_df and 'ip' in host_df else {}
 
-    group_df['convert_networks'] = group_df['networks'].apply(lambda x: replace_values(x, network_ids)) if 'networks' in group_df else ""
-    group_df['convert_hosts'] = group_df['hosts'].apply(lambda x: replace_values(x, host_ids)) if 'hosts' in group_df else ""
-    group_df['Entry'] = group_df.apply(combine_group_objects, axis=1)
+    member_values = {f'host:{key}': value for key, value in host_ids.items()}
+    member_values.update({f'network:{key}': value for key, value in network_ids.items()})
+
+    # 그룹별 멤버 인접 리스트 (호스트 → 네트워크 순서)
+    adjacency = {}
+    for position, (_, group) in enumerate(group_df.iterrows()):
+        members = []
+        for column, prefix in (('hosts', 'host'), ('networks', 'network')):
+            ids = group.get(column)
+            if isinstance(ids, str):
+                members.extend(f'{prefix}:{item.strip()}' for item in ids.split(',') if item.strip())
+        adjacency[str(position)] = members
+
+    closures = expand_groups(adjacency)
+    group_df['Entry'] = [
+        ','.join(value for value in (member_values.get(member, '') for member in closures[str(position)]) if value)
+        for position in range(len(group_df))
+    ]
 
     # 필요한 컬럼 선택 및 이름 변경
     group_df = group_df[['name', 'Entry']]
@@ -549,89 +574,67 @@ def export_address_objects(group_file: str, host_file: str, network_file: str) -
     return network_objects_df, group_df
 
 
-def export_service_objects(service_file: str) -> pd.DataFrame:
+def export_address_objects(group_file: str, host_file: str, network_file: str) -> tuple:
     """
-    서비스 객체 파일을 파싱하여 DataFrame으로 반환합니다.
+    그룹, 호스트, 네트워크 객체 파일을 파싱하여
+    네트워크 객체(DataFrame)와 그룹 객체(DataFrame)를 반환합니다.
+    """
+    return build_address_objects(group_parsing(group_file), host_parsing(host_file), network_parsing(network_file))
+
+
+def service_objects_from_frame(service_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    파싱된 서비스 객체 DataFrame에서 Name, Protocol, Port 컬럼만 남겨 반환합니다.
     """
-    service_df = service_parsing(service_file)
     if not service_df.empty:
         service_df = service_df[['name', 'protocol', 'str_svc_port']]
         service_df.columns = ['Name', 'Protocol', 'Port']
     return service_df
 
 
+def export_service_objects(service_file: str) -> pd.DataFrame:
+    """
+    서비스 객체 파일을 파싱하여 DataFrame으로 반환합니다.
+    """
+    return service_objects_from_frame(service_parsing(service_file))
+
+
 def export_objects(device_ip: str, username: str, password: str) -> list:
     """
-    원격 장비에서 객체 파일(conf)들을 다운로드하여 그룹/호스트/네트워크, 서비스 DataFrame을 생성한 후,
-    다운로드된 파일들은 삭제하고 DataFrame 리스트를 반환합니다.
+    원격 장비에서 객체 파일(conf)들의 내용을 읽어 그룹/호스트/네트워크, 서비스 DataFrame을 생성한 후,
+    DataFrame 리스트를 반환합니다.
     """
-    files = download_object_files(device_ip, 22, username, password, '/secui/etc/', './')
-    if len(files) < 4:
-        logging.error("필요한 conf 파일이 모두 다운로드되지 않았습니다.")
+    contents = fetch_object_contents(device_ip, 22, username, password, '/secui/etc/')
+    if len(contents) < len(OBJECT_CONF_FILES):
+        logging.error("필요한 conf 파일을 모두 읽어오지 못했습니다.")
         return []
-    group_file, host_file, network_file, service_file = files[:4]
-    address_df, address_group_df = export_address_objects(group_file, host_file, network_file)
-    service_df = export_service_objects(service_file)
-    delete_files(files)
+    address_df, address_group_df = build_address_objects(
+        parse_group_content(contents['groupobject.conf']),
+        parse_host_content(contents['hostobject.conf']),
+        parse_network_content(contents['networkobject.conf'])
+    )
+    service_df = service_objects_from_frame(parse_service_content(contents['serviceobject.conf']))
     return [address_df, address_group_df, service_df]
 
 
 def export_security_rules(device_ip: str, username: str, password: str) -> pd.DataFrame:
     """
-    원격 장비에서 규칙 파일(fwrules)을 다운로드하여 파싱한 후 DataFrame으로 반환합니다.
+    원격 장비에서 규칙 파일(fwrules)의 내용을 읽어 파싱한 후 DataFrame으로 반환합니다.
     """
-    file_name = download_rule_file(device_ip, 22, username, password, '/secui/etc/', './')
-    if not file_name:
+    content = fetch_rule_content(device_ip, 22, username, password, '/secui/etc/')
+    if not content:
         logging.error("규칙 파일 다운로드 실패")
         return pd.DataFrame()
-    rule_df = rule_parsing(file_name)
-    delete_files(file_name)
-    return rule_df
+    return parse_rule_content(content)
 
 
 # ────────────── SAVE TO EXCEL FUNCTION ──────────────
-def apply_excel_style(file_name: str) -> None:
-    """
-    모든 시트에 대해 헤더에 연한 회색 배경을 적용하고,
-    헤더의 너비를 자동 조절하되 최대 너비를 40으로 제한합니다.
-    
-    :param file_name: 처리할 엑셀 파일 이름
-    """
-    try:
-        workbook = load_workbook(file_name)
-        header_fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-
-        # 모든 워크시트를 순회하며 스타일 적용
-        for worksheet in workbook.worksheets:
-            header_row = worksheet[1]
-            for cell in header_row:
-                cell.fill = header_fill
-                column_letter = cell.column_letter
-                max_length = 0
-                for col_cell in worksheet[column_letter]:
-                    if col_cell.value is not None:
-                        cell_length = len(str(col_cell.value))
-                        if cell_length > max_length:
-                            max_length = cell_length
-                adjusted_width = (max_length + 2) * 1.2
-                worksheet.column_dimensions[column_letter].width = min(40, adjusted_width)
-
-        workbook.save(file_name)
-    except Exception as error:
-        logging.error("엑셀 스타일 적용 중 오류 발생: %s", error)
-
 def save_dfs_to_excel(dfs, sheet_names, file_name: str) -> bool:
     """
     단일 DataFrame 또는 DataFrame 리스트를 지정된 시트명으로 엑셀 파일에 저장합니다.
     """
     try:
-        if not isinstance(dfs, list):
-            dfs = [dfs]
-        if not isinstance(sheet_names, list):
-            sheet_names = [sheet_names]
-        with pd.ExcelWriter(file_name) as writer:
-            for df, sheet in zip(dfs, sheet_names):
-                df.to_excel(writer, sheet_name=sheet, index=False)
+        write_excel(file_name, dfs if isinstance(dfs, list) else [dfs], sheet_names)
         return True
     except Exception as e:
         logging.error("save_dfs_to_excel error: %s", e)
@@ -0,0 +1,77 @@
+# firewall/ngf/ngf_async_collector.py
+import asyncio
+import pandas as pd
+from typing import Optional
+from contextlib import asynccontextmanager
+from firewall.async_firewall_interface import AsyncFirewallInterface
+from .ngf_async_module import AsyncNGFClient
+from .ngf_collector import to_network_objects, to_service_objects, to_usage_logs
+
+
+class AsyncNGFCollector(AsyncFirewallInterface):
+    def __init__(self, hostname: str, ext_clnt_id: str, ext_clnt_secret: str, pool_size: int = 10,
+                 max_workers: int = 8):
+        """
+        Args:
+            pool_size: 장비와 유지할 HTTP 커넥션 수
+            max_workers: 서비스 그룹 상세 정보를 동시에 조회할 최대 요청 수
+        """
+        self.client = AsyncNGFClient(hostname, ext_clnt_id, ext_clnt_secret, pool_size=pool_size,
+                                     max_workers=max_workers)
+
+    @asynccontextmanager
+    async def session(self):
+        """수집 세션 비동기 컨텍스트 매니저.
+        한 번 로그인한 토큰과 조회한 응답(규칙 포함)을 세션 안의 모든 export가 공유하고,
+        세션이 끝날 때 한 번 로그아웃합니다.
+        """
+        async with self.client.session():
+            yield self
+
+    async def close(self) -> None:
+        await self.client.close()
+
+    async def get_system_info(self) -> pd.DataFrame:
+        """시스템 정보를 반환합니다."""
+        # NGF는 시스템 정보 기능이 없으므로 빈 DataFrame 반환
+        return pd.DataFrame()
+
+    async def export_security_rules(self) -> pd.DataFrame:
+        """보안 규칙을 반환합니다."""
+        return await self.client.export_security_rules()
+
+    async def export_network_objects(self) -> pd.DataFrame:
+        """네트워크 객체 정보를 PaloAlto 형식으로 변환하여 반환합니다."""
+        async with self.client.session():
+            host_df, network_df, domain_df = await asyncio.gather(
+                self.client.export_objects('host', use_session=False),
+                self.client.export_objects('network', use_session=False),
+                self.client.export_objects('domain', use_session=False)
+            )
+        return to_network_objects(host_df, network_df, domain_df)
+
+    async def export_network_group_objects(self) -> pd.DataFrame:
+        """네트워크 그룹 객체 정보를 중첩 그룹까지 펼친 멤버와 함께 반환합니다."""
+        return await self.client.export_network_group_objects_with_members()
+
+    async def export_service_objects(self) -> pd.DataFrame:
+        """서비스 객체 정보를 PaloAlto 형식으로 변환하여 반환합니다."""
+        async with self.client.session():
+            service_objects = await self.client.get_objects('service')
+        return to_service_objects(service_objects)
+
+    async def export_service_group_objects(self) -> pd.DataFrame:
+        """서비스 그룹 객체 정보를 멤버 정보와 함께 반환합니다."""
+        return await self.client.export_service_group_objects_with_members()
+
+    async def export_usage_logs(self, days: Optional[int] = None) -> pd.DataFrame:
+        """정책 사용이력을 DataFrame으로 반환합니다.
+
+        Args:
+            days: 미사용 기준 일수 (예: 30일 이상 미사용 시 '미사용'으로 표시)
+
+        Returns:
+            pd.DataFrame: Rule Name, Last Hit Date, Unused Days, 미사용여부 컬럼을 가진 DataFrame
+        """
+        # 수집 세션 안에서는 export_security_rules가 받아 둔 규칙 응답을 재사용
+        return to_usage_logs(await self.export_security_rules(), days)
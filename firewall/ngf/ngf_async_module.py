@@ -0,0 +1,311 @@
+import json
+import asyncio
+import logging
+import pandas as pd
+from contextlib import asynccontextmanager
+
+from firewall.http_session import aiohttp, create_async_http_session, request_with_retry
+from .ngf_module import (
+    parse_security_rules,
+    normalize_objects,
+    build_service_group_members,
+    resolve_network_group_members,
+)
+
+
+class AsyncNGFClient:
+    """
+    NGF REST API의 asyncio 클라이언트입니다.
+    응답 파싱은 NGFClient와 같은 함수를 사용합니다.
+    """
+
+    OBJECT_ENDPOINTS = {
+        "host": "/api/op/host/4/objects",
+        "network": "/api/op/network/4/objects",
+        "domain": "/api/op/domain/4/objects",
+        "group": "/api/op/group/4/objects",
+        "service": "/api/op/service/objects",
+        "service_group": "/api/op/service-group/objects",
+    }
+
+    def __init__(self, hostname: str, ext_clnt_id: str, ext_clnt_secret: str, timeout: int = 60,
+                 pool_size: int = 10, max_retries: int = 3, max_workers: int = 8):
+        """
+        :param pool_size: 장비와 유지할 keep-alive 커넥션 수
+        :param max_retries: 연결 실패 및 일시 장애 응답에 대한 최대 재시도 횟수
+        :param max_workers: 서비스 그룹 상세 정보를 동시에 조회할 최대 요청 수
+        """
+        self.hostname = hostname
+        self.ext_clnt_id = ext_clnt_id
+        self.ext_clnt_secret = ext_clnt_secret
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.max_workers = max(1, max_workers)
+        self.token = None
+        self.http = None
+        # 세션 중첩 깊이와 세션 동안 재사용할 GET 응답
+        self._session_depth = 0
+        self._session_cache = {}
+        # asyncio.Lock은 실행 중인 이벤트 루프 안에서 생성 (Python 3.8/3.9는 생성 시점의 루프에 묶임)
+        self._session_lock = None
+        self.user_agent = (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/54.0.2840.99 Safari/537.6"
+        )
+
+    @asynccontextmanager
+    async def session(self):
+        """
+        세션 컨텍스트 매니저.
+        동시에 실행되는 export가 같은 세션을 공유하며, 마지막 사용자가 나갈 때 로그아웃합니다.
+        세션 동안 같은 엔드포인트의 GET 응답은 한 번만 조회하여 재사용합니다.
+        """
+        if self._session_lock is None:
+            self._session_lock = asyncio.Lock()
+        async with self._session_lock:
+            if self._session_depth == 0:
+                if not await self.login():
+                    raise Exception("NGF 로그인 실패")
+            self._session_depth += 1
+        try:
+            yield
+        finally:
+            async with self._session_lock:
+                self._session_depth -= 1
+                if self._session_depth == 0:
+                    self._session_cache = {}
+                    await self.logout()
+
+    async def close(self):
+        """로그아웃 후 HTTP 세션을 정리합니다."""
+        await self.logout()
+        if self.http is not None:
+            await self.http.close()
+            self.http = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_headers(self, token: str = None) -> dict:
+        headers = {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+            'User-Agent': self.user_agent,
+        }
+        if token:
+            headers['Authorization'] = str(token)
+        return headers
+
+    async def _request(self, method: str, endpoint: str, timeout: int, **kwargs):
+        if self.http is None:
+            self.http = create_async_http_session(pool_size=self.pool_size)
+        return await request_with_retry(
+            self.http, method, f"https://{self.hostname}{endpoint}",
+            max_retries=self.max_retries,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            **kwargs
+        )
+
+    async def login(self) -> str:
+        """NGF에 로그인"""
+        if self.token:  # 이미 로그인된 경우
+            return self.token
+
+        data = {
+            "ext_clnt_id": self.ext_clnt_id,
+            "ext_clnt_secret": self.ext_clnt_secret,
+            "lang": "ko",
+            "force": 1
+        }
+        try:
+            response = await self._request(
+                'POST', "/api/au/external/login", timeout=3,
+                headers=self._get_headers(),
+                data=json.dumps(data)
+            )
+            async with response:
+                if response.status == 200:
+                    logging.info("Login Success")
+                    body = await response.json(content_type=None)
+                    self.token = body.get("result", {}).get("api_token")
+                    return self.token
+                logging.error("Login Failed, status code: %s", response.status)
+                return None
+        except Exception as e:
+            logging.error("Exception during login: %s", e)
+            return None
+
+    async def logout(self) -> bool:
+        """NGF에서 로그아웃"""
+        if not self.token:
+            return True
+
+        try:
+            response = await self._request(
+                'DELETE', "/api/au/external/logout", timeout=3,
+                headers=self._get_headers(token=self.token)
+            )
+            async with response:
+                if response.status == 200:
+                    logging.info("Logout Success")
+                    self.token = None
+                    return True
+                logging.error("Logout Failed, status code: %s", response.status)
+                return False
+        except Exception as e:
+            logging.error("Exception during logout: %s", e)
+            return False
+
+    async def _get(self, endpoint: str) -> dict:
+        """
+        내부적으로 GET 요청을 수행합니다.
+        세션 안에서는 성공한 응답을 캐시하여 같은 엔드포인트를 다시 조회하지 않습니다.
+        """
+        if self._session_depth and endpoint in self._session_cache:
+            return self._session_cache[endpoint]
+
+        try:
+            response = await self._request(
+                'GET', endpoint, timeout=self.timeout,
+                headers=self._get_headers(token=self.token)
+            )
+            async with response:
+                if response.status == 200:
+                    logging.info("GET %s Success", endpoint)
+                    data = await response.json(content_type=None)
+                    if self._session_depth:
+                        self._session_cache[endpoint] = data
+                    return data
+                logging.error("GET %s Failed, status code: %s", endpoint, response.status)
+                return None
+        except Exception as e:
+            logging.error("Exception during GET %s: %s", endpoint, e)
+            return None
+
+    async def get_fw4_rules(self) -> dict:
+        """
+        FW4 규칙 데이터를 조회합니다.
+        """
+        return await self._get("/api/po/fw/4/rules")
+
+    async def get_objects(self, object_type: str) -> dict:
+        """
+        객체 타입별 데이터를 조회합니다.
+        """
+        endpoint = self.OBJECT_ENDPOINTS.get(object_type)
+        if not endpoint:
+            raise ValueError(f"유효하지 않은 객체 타입: {object_type}")
+        return await self._get(endpoint)
+
+    async def get_service_group_objects_information(self, service_group_name: str) -> dict:
+        """서비스 그룹 객체의 상세 정보를 조회합니다."""
+        try:
+            response = await self._request(
+                'POST', "/api/op/service-group/get/objects", timeout=self.timeout,
+                headers=self._get_headers(token=self.token),
+                json={'name': service_group_name}
+            )
+            async with response:
+                if response.status == 200:
+                    return await response.json(content_type=None)
+                logging.error("Failed to get service group info, status code: %s", response.status)
+                return None
+        except Exception as e:
+            logging.error("Exception during get service group info: %s", e)
+            return None
+
+    async def export_security_rules(self) -> pd.DataFrame:
+        """
+        NGF 규칙 데이터를 파싱하여 pandas DataFrame으로 반환합니다.
+        """
+        try:
+            async with self.session():
+                rules_data = await self.get_fw4_rules()
+                if not rules_data:
+                    raise Exception("규칙 데이터를 가져올 수 없습니다")
+                return parse_security_rules(rules_data)
+        except Exception as e:
+            logging.error(f"NGF 규칙 데이터 수집 중 오류 발생: {str(e)}")
+            raise Exception(f"NGF 규칙 데이터 수집 실패: {str(e)}")
+
+    async def export_objects(self, object_type: str, use_session: bool = True) -> pd.DataFrame:
+        """
+        NGF 객체 데이터를 파싱하여 pandas DataFrame으로 반환합니다.
+
+        Parameters:
+            object_type (str): 조회할 객체 타입
+            use_session (bool): 세션 관리 여부. True면 내부에서 로그인/로그아웃,
+                              False면 외부 세션 사용
+        """
+        if not object_type:
+            raise ValueError("object_type 파라미터를 지정해야 합니다.")
+
+        async def _get_data():
+            try:
+                data = await self.get_objects(object_type)
+                if not data:
+                    raise Exception(f"데이터를 가져올 수 없습니다: {object_type}")
+
+                results = data.get("result", [])
+                if not results:
+                    logging.warning(f"결과 데이터가 없습니다: {object_type}")
+                    return pd.DataFrame()
+
+                return normalize_objects(results)
+
+            except Exception as e:
+                logging.error(f"NGF {object_type} 객체 데이터 수집 중 오류 발생: {str(e)}")
+                raise Exception(f"NGF {object_type} 객체 데이터 수집 실패: {str(e)}")
+
+        try:
+            if use_session:
+                async with self.session():
+                    return await _get_data()
+            return await _get_data()
+        except Exception as e:
+            raise Exception(f"NGF {object_type} 객체 데이터 수집 실패: {str(e)}")
+
+    async def export_service_group_objects_with_members(self) -> pd.DataFrame:
+        """
+        서비스 그룹 객체와 해당 멤버들의 정보를 포함한 DataFrame을 반환합니다.
+        그룹별 상세 정보는 max_workers개까지 동시에 조회합니다.
+        """
+        async with self.session():
+            service_df, group_df = await asyncio.gather(
+                self.export_objects('service', use_session=False),
+                self.export_objects('service_group', use_session=False)
+            )
+            service_lookup = {}
+            if not service_df.empty and {'srv_obj_id', 'name'} <= set(service_df.columns):
+                service_lookup = dict(zip(service_df['srv_obj_id'].astype(str), service_df['name']))
+
+            if group_df.empty:
+                return pd.DataFrame()
+
+            semaphore = asyncio.Semaphore(self.max_workers)
+
+            async def fetch(group_name: str) -> dict:
+                async with semaphore:
+                    return await self.get_service_group_objects_information(group_name)
+
+            group_names = group_df['name'].tolist()
+            details = await asyncio.gather(*(fetch(name) for name in group_names))
+            return build_service_group_members(group_names, details, service_lookup)
+
+    async def export_network_group_objects_with_members(self) -> pd.DataFrame:
+        """
+        네트워크 그룹 객체와 해당 멤버들의 정보를 포함한 DataFrame을 반환합니다.
+        중첩된 그룹은 모두 펼친 멤버로 반환합니다.
+        """
+        async with self.session():
+            host_df, network_df, group_df = await asyncio.gather(
+                self.export_objects('host', use_session=False),
+                self.export_objects('network', use_session=False),
+                self.export_objects('group', use_session=False)
+            )
+            return resolve_network_group_members(host_df, network_df, group_df)
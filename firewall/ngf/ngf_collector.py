@@ -1,13 +1,126 @@
 # firewall/ngf/ngf_collector.py
 import pandas as pd
 from typing import Optional
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from firewall.firewall_interface import FirewallInterface
 from .ngf_module import NGFClient
 
+
+def to_network_objects(host_df: pd.DataFrame, network_df: pd.DataFrame, domain_df: pd.DataFrame) -> pd.DataFrame:
+    """호스트/네트워크/도메인 객체를 PaloAlto 형식(Name, Type, Value)으로 변환합니다."""
+    # 호스트 객체
+    if not host_df.empty:
+        host_df = host_df[['name', 'ip_list']].rename(columns={'name': 'Name', 'ip_list': 'Value'})
+        host_df['Type'] = 'ip-netmask'
+    else:
+        host_df = pd.DataFrame(columns=['Name', 'Type', 'Value'])
+
+    # 네트워크 객체
+    if not network_df.empty:
+        network_df['Value'] = network_df.apply(
+            lambda row: f"{row['ip_list_ip_info1']}-{row['ip_list_ip_info2']}" if '.' in row['ip_list_ip_info1'] else f"{row['ip_list_ip_info2']}/{row['ip_list_ip_info2']}",
+            axis=1
+        )
+        network_df['Type'] = network_df['Value'].apply(lambda x: 'ip-netmask' if '/' in x else 'ip-range')
+    else:
+        network_df = pd.DataFrame(columns=['Name', 'Type', 'Value'])
+
+    # 도메인 객체
+    if not domain_df.empty:
+        domain_df = domain_df[['name', 'dmn_name']].rename(columns={'name': 'Name', 'dmn_name': 'Value'})
+        domain_df['Type'] = 'fqdn'
+    else:
+        domain_df = pd.DataFrame(columns=['Name', 'Type', 'Value'])
+
+    # 결과 합치기
+    result_df = pd.concat([host_df, network_df, domain_df], ignore_index=True)
+    return result_df
+
+
+def to_service_objects(service_objects: dict) -> pd.DataFrame:
+    """서비스 객체 조회 응답을 PaloAlto 형식(Name, Protocol, Port)으로 변환합니다."""
+    if service_objects and 'result' in service_objects:
+        service_df = pd.DataFrame(service_objects['result'])
+        if not service_df.empty:
+            service_df = service_df[['name', 'protocol', 'str_svc_port']].rename(
+                columns={'name': 'Name', 'protocol': 'Protocol', 'str_svc_port': 'Port'}
+            )
+            return service_df
+    return pd.DataFrame(columns=['Name', 'Protocol', 'Port'])
+
+
+def to_usage_logs(security_rules: pd.DataFrame, days: Optional[int] = None) -> pd.DataFrame:
+    """보안 규칙의 Last Hit Date로 정책 사용이력 DataFrame을 생성합니다.
+
+    Args:
+        security_rules: NGF 보안 규칙 DataFrame
+        days: 미사용 기준 일수
+
+    Returns:
+        pd.DataFrame: Rule Name, Last Hit Date, Unused Days, 미사용여부 컬럼을 가진 DataFrame
+    """
+    # 필요한 컬럼만 선택
+    if not security_rules.empty and 'Last Hit Date' in security_rules.columns:
+        result_df = security_rules[['Rule Name', 'Last Hit Date']]
+        
+        # 현재 날짜 가져오기
+        current_date = datetime.now()
+        
+        # Unused Days 계산
+        def calculate_unused_days(last_hit_date):
+            if pd.isna(last_hit_date) or not last_hit_date:
+                return None  # 사용 기록이 없는 경우
+            try:
+                # NGF의 last_hit_time 형식에 맞게 파싱
+                last_hit_datetime = datetime.strptime(last_hit_date, '%Y-%m-%d %H:%M:%S')
+                delta = current_date - last_hit_datetime
+                return delta.days
+            except (ValueError, TypeError):
+                return None
+        
+        # Unused Days 컬럼 추가
+        result_df['Unused Days'] = result_df['Last Hit Date'].apply(calculate_unused_days)
+        
+        # 미사용여부 컬럼 추가
+        def determine_usage_status(unused_days):
+            if pd.isna(unused_days):
+                return '미사용'  # 사용 기록이 없는 경우
+            if days is not None and unused_days > days:
+                return '미사용'  # 기준일 이상 미사용
+            return '사용'  # 기준일 이내 사용
+        
+        result_df['미사용여부'] = result_df['Unused Days'].apply(determine_usage_status)
+        
+        return result_df
+    
+    # 데이터가 없거나 Last Hit Date 컬럼이 없는 경우 빈 DataFrame 반환
+    return pd.DataFrame(columns=['Rule Name', 'Last Hit Date', 'Unused Days', '미사용여부'])
+
+
 class NGFCollector(FirewallInterface):
-    def __init__(self, hostname: str, ext_clnt_id: str, ext_clnt_secret: str):
-        self.client = NGFClient(hostname, ext_clnt_id, ext_clnt_secret)
+    def __init__(self, hostname: str, ext_clnt_id: str, ext_clnt_secret: str, pool_size: int = 10,
+                 max_workers: int = 8):
+        """
+        Args:
+            pool_size: 장비와 유지할 HTTP 커넥션 수
+            max_workers: 서비스 그룹 상세 정보를 동시에 조회할 최대 요청 수
+        """
+        self.client = NGFClient(hostname, ext_clnt_id, ext_clnt_secret, pool_size=pool_size,
+                                max_workers=max_workers)
+
+    @contextmanager
+    def session(self):
+        """수집 세션 컨텍스트 매니저.
+        한 번 로그인한 토큰과 조회한 응답(규칙 포함)을 세션 안의 모든 export가 공유하고,
+        세션이 끝날 때 한 번 로그아웃합니다.
+        """
+        with self.client.session():
+            yield self
+
+    def close(self) -> None:
+        """로그아웃 후 HTTP 커넥션 풀을 정리합니다."""
+        self.client.close()
 
     def get_system_info(self) -> pd.DataFrame:
         """시스템 정보를 반환합니다."""
@@ -20,65 +133,22 @@ class NGFCollector(FirewallInterface):
 
     def export_network_objects(self) -> pd.DataFrame:
         """네트워크 객체 정보를 PaloAlto 형식으로 변환하여 반환합니다."""
-        # 호스트 객체
-        host_df = self.client.export_objects('host')
-        if not host_df.empty:
-            host_df = host_df[['name', 'ip_list']].rename(columns={'name': 'Name', 'ip_list': 'Value'})
-            host_df['Type'] = 'ip-netmask'
-        else:
-            host_df = pd.DataFrame(columns=['Name', 'Type', 'Value'])
-
-        # 네트워크 객체
-        network_df = self.client.export_objects('network')
-        if not network_df.empty:
-            network_df['Value'] = network_df.apply(
-                lambda row: f"{row['ip_list_ip_info1']}-{row['ip_list_ip_info2']}" if '.' in row['ip_list_ip_info1'] else f"{row['ip_list_ip_info2']}/{row['ip_list_ip_info2']}",
-                axis=1
-            )
-            network_df['Type'] = network_df['Value'].apply(lambda x: 'ip-netmask' if '/' in x else 'ip-range')
-        else:
-            network_df = pd.DataFrame(columns=['Name', 'Type', 'Value'])
-
-        # 도메인 객체
-        domain_df = self.client.export_objects('domain')
-        if not domain_df.empty:
-            domain_df = domain_df[['name', 'dmn_name']].rename(coulmns={'name': 'Name', 'dmn_name': 'Value'})
-            domain_df['Type'] = 'fqdn'
-        else:
-            domain_df = pd.DataFrame(columns=['Name', 'Type', 'Value'])
-
-        # 결과 합치기
-        result_df = pd.concat([host_df, network_df, domain_df], ignore_index=True)
-        return result_df
+        with self.client.session():
+            host_df = self.client.export_objects('host', use_session=False)
+            network_df = self.client.export_objects('network', use_session=False)
+            domain_df = self.client.export_objects('domain', use_session=False)
+        return to_network_objects(host_df, network_df, domain_df)
 
     ## 아래부터 수정 필요
     def export_network_group_objects(self) -> pd.DataFrame:
-        """네트워크 그룹 객체 정보를 PaloAlto 형식으로 변환하여 반환합니다."""
-        group_objects = self.client.get_group_objects()
-        if group_objects and 'result' in group_objects:
-            group_df = pd.DataFrame(group_objects['result'])
-            if not group_df.empty:
-                # hosts와 networks를 합쳐서 Entry로 만들기
-                group_df['Entry'] = group_df.apply(
-                    lambda x: ','.join(filter(None, [
-                        x.get('hosts', ''),
-                        x.get('networks', '')
-                    ])), axis=1
-                )
-                return group_df[['name', 'Entry']].rename(columns={'name': 'Group Name'})
-        return pd.DataFrame(columns=['Group Name', 'Entry'])
+        """네트워크 그룹 객체 정보를 중첩 그룹까지 펼친 멤버와 함께 반환합니다."""
+        return self.client.export_network_group_objects_with_members()
 
     def export_service_objects(self) -> pd.DataFrame:
         """서비스 객체 정보를 PaloAlto 형식으로 변환하여 반환합니다."""
-        service_objects = self.client.get_service_objects()
-        if service_objects and 'result' in service_objects:
-            service_df = pd.DataFrame(service_objects['result'])
-            if not service_df.empty:
-                service_df = service_df[['name', 'protocol', 'str_svc_port']].rename(
-                    columns={'name': 'Name', 'protocol': 'Protocol', 'str_svc_port': 'Port'}
-                )
-                return service_df
-        return pd.DataFrame(columns=['Name', 'Protocol', 'Port'])
+        with self.client.session():
+            service_objects = self.client.get_service_objects()
+        return to_service_objects(service_objects)
 
     # def export_service_group_objects(self) -> pd.DataFrame:
     #     """서비스 그룹 객체 정보를 PaloAlto 형식으로 변환하여 반환합니다."""
@@ -104,42 +174,5 @@ class NGFCollector(FirewallInterface):
         Returns:
             pd.DataFrame: Rule Name, Last Hit Date, Unused Days, 미사용여부 컬럼을 가진 DataFrame
         """
-        # 보안 규칙 데이터 가져오기
-        security_rules = self.export_security_rules()
-        
-        # 필요한 컬럼만 선택
-        if not security_rules.empty and 'Last Hit Date' in security_rules.columns:
-            result_df = security_rules[['Rule Name', 'Last Hit Date']]
-            
-            # 현재 날짜 가져오기
-            current_date = datetime.now()
-            
-            # Unused Days 계산
-            def calculate_unused_days(last_hit_date):
-                if pd.isna(last_hit_date) or not last_hit_date:
-                    return None  # 사용 기록이 없는 경우
-                try:
-                    # NGF의 last_hit_time 형식에 맞게 파싱
-                    last_hit_datetime = datetime.strptime(last_hit_date, '%Y-%m-%d %H:%M:%S')
-                    delta = current_date - last_hit_datetime
-                    return delta.days
-                except (ValueError, TypeError):
-                    return None
-            
-            # Unused Days 컬럼 추가
-            result_df['Unused Days'] = result_df['Last Hit Date'].apply(calculate_unused_days)
-            
-            # 미사용여부 컬럼 추가
-            def determine_usage_status(unused_days):
-                if pd.isna(unused_days):
-                    return '미사용'  # 사용 기록이 없는 경우
-                if days is not None and unused_days > days:
-                    return '미사용'  # 기준일 이상 미사용
-                return '사용'  # 기준일 이내 사용
-            
-            result_df['미사용여부'] = result_df['Unused Days'].apply(determine_usage_status)
-            
-            return result_df
-        
-        # 데이터가 없거나 Last Hit Date 컬럼이 없는 경우 빈 DataFrame 반환
-        return pd.DataFrame(columns=['Rule Name', 'Last Hit Date', 'Unused Days', '미사용여부'])
\ No newline at end of file
+        # 수집 세션 안에서는 export_security_rules가 받아 둔 규칙 응답을 재사용
+        return to_usage_logs(self.export_security_rules(), days)
@@ -1,8 +1,13 @@
 import json
+import time
 import logging
 import requests
 import pandas as pd
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+from firewall.http_session import create_http_session, RETRY_STATUS_CODES
+from firewall.group_resolver import expand_groups
 
 # SSL 경고 비활성화
 requests.packages.urllib3.disable_warnings()
@@ -11,17 +16,204 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
 
+def list_to_string(list_data) -> str:
+    """
+    리스트 데이터를 콤마로 구분된 문자열로 변환합니다.
+    """
+    if isinstance(list_data, list):
+        return ','.join(str(s) for s in list_data)
+    return list_data
+
+
+def parse_security_rules(rules_data: dict) -> pd.DataFrame:
+    """
+    FW4 규칙 조회 응답을 보안 규칙 DataFrame으로 변환합니다.
+    """
+    security_rules = []
+    rules = rules_data.get("result", [])
+    for rule in rules:
+        seq = rule.get("seq")
+        fw_rule_id = rule.get("fw_rule_id")
+        name = rule.get("name")
+        # default rule은 건너뜁니다.
+        if name == "default":
+            continue
+        use = "Y" if rule.get("use") == 1 else "N"
+        action = "allow" if rule.get("action") == 1 else "deny"
+
+        src_list = rule.get("src")
+        if not src_list:
+            src_list = "any"
+        else:
+            src_list = [src.get("name") for src in src_list]
+
+        user_list = rule.get("user")
+        if not user_list:
+            user_list = "any"
+        else:
+            user_list = [list(user.values())[0] for user in user_list]
+
+        dst_list = rule.get("dst")
+        if not dst_list:
+            dst_list = "any"
+        else:
+            dst_list = [dst.get("name") for dst in dst_list]
+
+        srv_list = rule.get("srv")
+        if not srv_list:
+            srv_list = "any"
+        else:
+            srv_list = [srv.get("name") for srv in srv_list]
+
+        app_list = rule.get("app")
+        if not app_list:
+            app_list = "any"
+        else:
+            app_list = [app.get("name") for app in app_list]
+
+        last_hit_time = rule.get("last_hit_time")
+        desc = rule.get("desc")
+
+        info = {
+            "Seq": seq,
+            "Rule Name": fw_rule_id,
+            "Enable": use,
+            "Action": action,
+            "Source": list_to_string(src_list),
+            "User": list_to_string(user_list),
+            "Destination": list_to_string(dst_list),
+            "Service": list_to_string(srv_list),
+            "Application": list_to_string(app_list),
+            "Last Hit Date": last_hit_time,
+            "Description": desc
+        }
+        security_rules.append(info)
+
+    return pd.DataFrame(security_rules)
+
+
+def normalize_objects(results: list) -> pd.DataFrame:
+    """
+    객체 조회 결과를 평탄화한 DataFrame으로 변환합니다.
+    리스트/딕셔너리 값은 콤마로 구분된 문자열로 변환합니다.
+    """
+    df = pd.json_normalize(results, sep='_')
+    
+    for col in df.columns:
+        df[col] = df[col].apply(lambda x: list_to_string(x)
+                            if isinstance(x, list)
+                            else (','.join(map(str, x.values()))
+                                    if isinstance(x, dict) else x))
+    return df
+
+
+def build_service_group_members(group_names: list, details: list, service_lookup: dict) -> pd.DataFrame:
+    """
+    서비스 그룹별 상세 조회 응답의 멤버 ID를 서비스 이름으로 변환합니다.
+
+    Parameters:
+        group_names (list): 서비스 그룹 이름 리스트
+        details (list): group_names와 같은 순서의 상세 조회 응답 리스트
+        service_lookup (dict): 서비스 객체 ID -> 이름 매핑
+    """
+    group_details = []
+
+    for group_name, object_data in zip(group_names, details):
+        if object_data and 'result' in object_data:
+            result_data = object_data.get('result', [])
+            if result_data:
+                detail = pd.json_normalize(result_data, sep='_').iloc[0]
+                member_ids = str(detail['mem_id']).split(';') if detail['mem_id'] else []
+                member_names = []
+                for member_id in member_ids:
+                    member_id = member_id.strip()
+                    if member_id:
+                        member_name = service_lookup.get(member_id)
+                        if member_name:
+                            member_names.append(member_name)
+                        else:
+                            member_names.append(f'Unknown_{member_id}')
+
+                group_details.append({
+                    'Group Name': group_name,
+                    'Entry': ','.join(member_names) if member_names else ''
+                })
+
+    return pd.DataFrame(group_details)
+
+
+def resolve_network_group_members(host_df: pd.DataFrame, network_df: pd.DataFrame,
+                                  group_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    호스트/네트워크/그룹 객체 DataFrame으로 그룹별 전체 멤버를 해석합니다.
+    중첩된 그룹은 expand_groups로 펼칩니다.
+    """
+    if group_df.empty:
+        return pd.DataFrame(columns=['Group Name', 'Entry'])
+
+    # 1. 호스트, 네트워크 객체의 매핑 딕셔너리 생성
+    object_lookup = {}
+    
+    # 호스트 객체 매핑
+    if not host_df.empty:
+        for _, row in host_df.iterrows():
+            if 'addr_obj_id' in row and 'name' in row:
+                object_lookup[str(row['addr_obj_id'])] = row['name']
+
+    # 네트워크 객체 매핑
+    if not network_df.empty:
+        for _, row in network_df.iterrows():
+            if 'addr_obj_id' in row and 'name' in row:
+                object_lookup[str(row['addr_obj_id'])] = row['name']
+
+    # 2. 그룹 멤버십 인접 리스트 생성
+    group_names = {}
+    adjacency = {}
+    for _, group in group_df.iterrows():
+        group_id = str(group['addr_obj_id'])
+        member_ids = str(group['mmbr_obj_id']).split(';') if group['mmbr_obj_id'] else []
+        group_names[group_id] = group['name']
+        adjacency[group_id] = [mid.strip() for mid in member_ids if mid.strip()]
+
+    # 3. 중첩 그룹 펼치기 (그룹별 결과를 한 번만 계산, 순환 참조 감지)
+    closures = expand_groups(adjacency)
+
+    # 4. 결과 DataFrame 생성
+    group_details = []
+    for group_id, group_name in group_names.items():
+        all_members = {object_lookup.get(member_id, f'Unknown_{member_id}') for member_id in closures[group_id]}
+        group_details.append({
+            'Group Name': group_name,
+            'Entry': ','.join(sorted(all_members)) if all_members else ''
+        })
+
+    return pd.DataFrame(group_details)
+
+
 class NGFClient:
     """
     NGF API와 연동하여 로그인, 데이터 조회, 규칙 파싱 등의 기능을 제공하는 클라이언트입니다.
     """
 
-    def __init__(self, hostname: str, ext_clnt_id: str, ext_clnt_secret: str, timeout: int = 60):
+    def __init__(self, hostname: str, ext_clnt_id: str, ext_clnt_secret: str, timeout: int = 60,
+                 pool_size: int = 10, max_retries: int = 3, max_workers: int = 8):
+        """
+        :param pool_size: 장비와 유지할 keep-alive 커넥션 수
+        :param max_retries: 연결 실패 및 일시 장애 응답에 대한 최대 재시도 횟수
+        :param max_workers: 서비스 그룹 상세 정보를 동시에 조회할 최대 요청 수
+        """
         self.hostname = hostname
         self.ext_clnt_id = ext_clnt_id
         self.ext_clnt_secret = ext_clnt_secret
         self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_workers = max(1, max_workers)
         self.token = None
+        # 세션 중첩 깊이와 세션 동안 재사용할 GET 응답
+        self._session_depth = 0
+        self._session_cache = {}
+        # 장비에 대한 모든 호출이 공유하는 keep-alive 커넥션 풀
+        self.http = create_http_session(pool_size=pool_size, max_retries=max_retries)
         self.user_agent = (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -30,12 +222,27 @@ class NGFClient:
 
     @contextmanager
     def session(self):
-        """세션 컨텍스트 매니저"""
+        """
+        세션 컨텍스트 매니저.
+        중첩해서 사용할 수 있으며, 가장 바깥 세션에서만 로그인/로그아웃합니다.
+        세션 동안 같은 엔드포인트의 GET 응답은 한 번만 조회하여 재사용합니다.
+        """
+        if self._session_depth == 0:
+            if not self.login():
+                raise Exception("NGF 로그인 실패")
+        self._session_depth += 1
         try:
-            self.login()
             yield
         finally:
-            self.logout()
+            self._session_depth -= 1
+            if self._session_depth == 0:
+                self._session_cache = {}
+                self.logout()
+
+    def close(self):
+        """로그아웃 후 HTTP 커넥션 풀을 정리합니다."""
+        self.logout()
+        self.http.close()
 
     def _get_headers(self, token: str = None) -> dict:
         headers = {
@@ -60,7 +267,7 @@ class NGFClient:
             "force": 1
         }
         try:
-            response = requests.post(
+            response = self.http.post(
                 url,
                 headers=self._get_headers(),
                 data=json.dumps(data),
@@ -85,7 +292,7 @@ class NGFClient:
 
         url = f"https://{self.hostname}/api/au/external/logout"
         try:
-            response = requests.delete(
+            response = self.http.delete(
                 url,
                 headers=self._get_headers(token=self.token),
                 verify=False,
@@ -105,10 +312,14 @@ class NGFClient:
     def _get(self, endpoint: str) -> dict:
         """
         내부적으로 GET 요청을 수행합니다.
+        세션 안에서는 성공한 응답을 캐시하여 같은 엔드포인트를 다시 조회하지 않습니다.
         """
+        if self._session_depth and endpoint in self._session_cache:
+            return self._session_cache[endpoint]
+
         url = f"https://{self.hostname}{endpoint}"
         try:
-            response = requests.get(
+            response = self.http.get(
                 url,
                 headers=self._get_headers(token=self.token),
                 verify=False,
@@ -116,7 +327,10 @@ class NGFClient:
             )
             if response.status_code == 200:
                 logging.info("GET %s Success", endpoint)
-                return response.json()
+                data = response.json()
+                if self._session_depth:
+                    self._session_cache[endpoint] = data
+                return data
             else:
                 logging.error("GET %s Failed, status code: %s", endpoint, response.status_code)
                 return None
@@ -168,114 +382,58 @@ class NGFClient:
         return self._get("/api/op/service-group/objects")
     
     def get_service_group_objects_information(self, service_group_name: str) -> dict:
-        """서비스 그룹 객체의 상세 정보를 조회합니다."""
+        """
+        서비스 그룹 객체의 상세 정보를 조회합니다.
+        커넥션 풀(urllib3 Retry)은 POST 요청의 연결 실패만 재시도하고 응답 상태 코드와 읽기 시간 초과는
+        재시도하지 않으므로, 일시 장애 응답과 읽기 시간 초과만 max_retries회까지 지수 백오프로 재시도합니다.
+        연결 실패는 커넥션 풀에서 이미 재시도했으므로 다시 시도하지 않습니다.
+        """
         url = f"https://{self.hostname}/api/op/service-group/get/objects"
-        try:
-            response = requests.post(
-                url,
-                headers=self._get_headers(token=self.token),
-                verify=False,
-                timeout=self.timeout,
-                json={'name': service_group_name}
-            )
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logging.error("Failed to get service group info, status code: %s", response.status_code)
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.http.post(
+                    url,
+                    headers=self._get_headers(token=self.token),
+                    verify=False,
+                    timeout=self.timeout,
+                    json={'name': service_group_name}
+                )
+                if response.status_code == 200:
+                    return response.json()
+                if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    logging.error("Failed to get service group info, status code: %s", response.status_code)
+                    return None
+            except requests.exceptions.ConnectionError as e:
+                logging.error("Exception during get service group info: %s", e)
                 return None
-        except Exception as e:
-            logging.error("Exception during get service group info: %s", e)
-            return None
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logging.error("Exception during get service group info: %s", e)
+                    return None
+            time.sleep(0.5 * (2 ** attempt))
 
     @staticmethod
     def list_to_string(list_data) -> str:
         """
         리스트 데이터를 콤마로 구분된 문자열로 변환합니다.
         """
-        if isinstance(list_data, list):
-            return ','.join(str(s) for s in list_data)
-        return list_data
+        return list_to_string(list_data)
 
     def export_security_rules(self) -> pd.DataFrame:
         """
         NGF 규칙 데이터를 파싱하여 pandas DataFrame으로 반환합니다.
         """
         try:
-            token = self.login()
-            if not token:
-                raise Exception("NGF 로그인 실패")
-            
-            rules_data = self.get_fw4_rules()
-            if not rules_data:
-                raise Exception("규칙 데이터를 가져올 수 없습니다")
-            
-            security_rules = []
-            rules = rules_data.get("result", [])
-            for rule in rules:
-                seq = rule.get("seq")
-                fw_rule_id = rule.get("fw_rule_id")
-                name = rule.get("name")
-                # default rule은 건너뜁니다.
-                if name == "default":
-                    continue
-                use = "Y" if rule.get("use") == 1 else "N"
-                action = "allow" if rule.get("action") == 1 else "deny"
-
-                src_list = rule.get("src")
-                if not src_list:
-                    src_list = "any"
-                else:
-                    src_list = [src.get("name") for src in src_list]
-
-                user_list = rule.get("user")
-                if not user_list:
-                    user_list = "any"
-                else:
-                    user_list = [list(user.values())[0] for user in user_list]
-
-                dst_list = rule.get("dst")
-                if not dst_list:
-                    dst_list = "any"
-                else:
-                    dst_list = [dst.get("name") for dst in dst_list]
-
-                srv_list = rule.get("srv")
-                if not srv_list:
-                    srv_list = "any"
-                else:
-                    srv_list = [srv.get("name") for srv in srv_list]
-
-                app_list = rule.get("app")
-                if not app_list:
-                    app_list = "any"
-                else:
-                    app_list = [app.get("name") for app in app_list]
-
-                last_hit_time = rule.get("last_hit_time")
-                desc = rule.get("desc")
-
-                info = {
-                    "Seq": seq,
-                    "Rule Name": fw_rule_id,
-                    "Enable": use,
-                    "Action": action,
-                    "Source": self.list_to_string(src_list),
-                    "User": self.list_to_string(user_list),
-                    "Destination": self.list_to_string(dst_list),
-                    "Service": self.list_to_string(srv_list),
-                    "Application": self.list_to_string(app_list),
-                    "Last Hit Date": last_hit_time,
-                    "Description": desc
-                }
-                security_rules.append(info)
+            with self.session():
+                rules_data = self.get_fw4_rules()
+                if not rules_data:
+                    raise Exception("규칙 데이터를 가져올 수 없습니다")
+
+                return parse_security_rules(rules_data)
 
-            return pd.DataFrame(security_rules)
-        
         except Exception as e:
             logging.error(f"NGF 규칙 데이터 수집 중 오류 발생: {str(e)}")
             raise Exception(f"NGF 규칙 데이터 수집 실패: {str(e)}")
-        finally:
-            self.logout()
 
     def export_objects(self, object_type: str, use_session: bool = True) -> pd.DataFrame:
         """
@@ -313,14 +471,7 @@ class NGFClient:
                     logging.warning(f"결과 데이터가 없습니다: {object_type}")
                     return pd.DataFrame()
                 
-                df = pd.json_normalize(results, sep='_')
-                
-                for col in df.columns:
-                    df[col] = df[col].apply(lambda x: self.list_to_string(x)
-                                        if isinstance(x, list)
-                                        else (','.join(map(str, x.values()))
-                                                if isinstance(x, dict) else x))
-                return df
+                return normalize_objects(results)
 
             except Exception as e:
                 logging.error(f"NGF {object_type} 객체 데이터 수집 중 오류 발생: {str(e)}")
@@ -338,6 +489,7 @@ class NGFClient:
     def export_service_group_objects_with_members(self) -> pd.DataFrame:
         """
         서비스 그룹 객체와 해당 멤버들의 정보를 포함한 DataFrame을 반환합니다.
+        그룹별 상세 정보는 max_workers개까지 동시에 조회합니다.
         """
         with self.session():
             # 세션 내에서는 use_session=False로 호출
@@ -352,38 +504,17 @@ class NGFClient:
             if group_df.empty:
                 return pd.DataFrame()
             
-            # 3. 각 그룹의 상세 정보를 저장할 리스트
-            group_details = []
-            
-            # 4. 각 서비스 그룹에 대해 멤버 정보 조회
-            for _, group in group_df.iterrows():
-                object_data = self.get_service_group_objects_information(group['name'])
-                if object_data and 'result' in object_data:
-                    result_data = object_data.get('result', [])
-                    if result_data:
-                        detail = pd.json_normalize(result_data, sep='_').iloc[0]
-                        member_ids = str(detail['mem_id']).split(';') if detail['mem_id'] else []
-                        member_names = []
-                        for member_id in member_ids:
-                            member_id = member_id.strip()
-                            if member_id:
-                                member_name = service_lookup.get(member_id)
-                                if member_name:
-                                    member_names.append(member_name)
-                                else:
-                                    member_names.append(f'Unknown_{member_id}')
-                        
-                        group_details.append({
-                            'Group Name': group['name'],
-                            'Entry': ','.join(member_names) if member_names else ''
-                        })
-            
-            return pd.DataFrame(group_details)
+            # 3. 각 서비스 그룹의 상세 정보를 max_workers개까지 동시에 조회 (결과는 그룹 순서 유지)
+            group_names = group_df['name'].tolist()
+            workers = min(self.max_workers, len(group_names))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                details = list(executor.map(self.get_service_group_objects_information, group_names))
+            return build_service_group_members(group_names, details, service_lookup)
 
     def export_network_group_objects_with_members(self) -> pd.DataFrame:
         """
         네트워크 그룹 객체와 해당 멤버들의 정보를 포함한 DataFrame을 반환합니다.
-        중첩된 그룹을 재귀적으로 처리합니다.
+        중첩된 그룹은 모두 펼친 멤버로 반환합니다.
         """
         with self.session():
             # 1. 모든 객체 정보 가져오기
@@ -391,85 +522,7 @@ class NGFClient:
             network_df = self.export_objects('network', use_session=False)
             group_df = self.export_objects('group', use_session=False)
 
-            if group_df.empty:
-                return pd.DataFrame(columns=['Group Name', 'Entry'])
-
-            # 2. 호스트, 네트워크 객체의 매핑 딕셔너리 생성
-            object_lookup = {}
-            
-            # 호스트 객체 매핑
-            if not host_df.empty:
-                for _, row in host_df.iterrows():
-                    if 'addr_obj_id' in row and 'name' in row:
-                        object_lookup[str(row['addr_obj_id'])] = row['name']
-
-            # 네트워크 객체 매핑
-            if not network_df.empty:
-                for _, row in network_df.iterrows():
-                    if 'addr_obj_id' in row and 'name' in row:
-                        object_lookup[str(row['addr_obj_id'])] = row['name']
-
-            # 3. 그룹 멤버십 매핑 생성
-            group_membership = {}
-            for _, group in group_df.iterrows():
-                group_id = str(group['addr_obj_id'])
-                member_ids = str(group['mmbr_obj_id']).split(';') if group['mmbr_obj_id'] else []
-                group_membership[group_id] = {
-                    'name': group['name'],
-                    'direct_members': [mid.strip() for mid in member_ids if mid.strip()],
-                    'all_members': set()  # 모든 하위 멤버를 저장할 set
-                }
-
-            # 4. 그룹 멤버십 순환 처리
-            def resolve_group_membership(group_id: str, processed_groups: set = None):
-                """그룹의 모든 멤버를 재귀적으로 해석하여 all_members에 저장"""
-                if processed_groups is None:
-                    processed_groups = set()
-                
-                if group_id in processed_groups:
-                    logging.warning(f"순환 참조 감지: {group_id}")
-                    return set()
-                
-                if group_id not in group_membership:
-                    return set()
-
-                # 이미 계산된 경우 반환
-                if group_membership[group_id]['all_members']:
-                    return group_membership[group_id]['all_members']
-
-                processed_groups.add(group_id)
-                all_members = set()
-
-                # 직접 멤버 처리
-                for member_id in group_membership[group_id]['direct_members']:
-                    if member_id in object_lookup:
-                        # 일반 객체인 경우
-                        all_members.add(object_lookup[member_id])
-                    elif member_id in group_membership:
-                        # 그룹인 경우 재귀적으로 처리
-                        sub_members = resolve_group_membership(member_id, processed_groups)
-                        all_members.update(sub_members)
-                    else:
-                        all_members.add(f'Unknown_{member_id}')
-
-                processed_groups.remove(group_id)
-                group_membership[group_id]['all_members'] = all_members
-                return all_members
-
-            # 5. 모든 그룹에 대해 멤버십 해석
-            for group_id in group_membership:
-                if not group_membership[group_id]['all_members']:
-                    resolve_group_membership(group_id)
-
-            # 6. 결과 DataFrame 생성
-            group_details = []
-            for group_id, group_info in group_membership.items():
-                group_details.append({
-                    'Group Name': group_info['name'],
-                    'Entry': ','.join(sorted(group_info['all_members'])) if group_info['all_members'] else ''
-                })
-
-            return pd.DataFrame(group_details)
+            return resolve_network_group_members(host_df, network_df, group_df)
         
 # ────────────── 모듈 테스트 예시 ──────────────
 if __name__ == '__main__':
@@ -0,0 +1,80 @@
+# firewall/paloalto/paloalto_async_collector.py
+import asyncio
+import pandas as pd
+from typing import Optional
+from contextlib import asynccontextmanager
+from firewall.async_firewall_interface import AsyncFirewallInterface
+from firewall.group_resolver import flatten_group_entries
+from .paloalto_async_module import AsyncPaloAltoAPI
+from .paloalto_collector import summarize_hit_counts
+
+
+class AsyncPaloAltoCollector(AsyncFirewallInterface):
+    def __init__(self, hostname: str, username: str, password: str, stream_config: bool = False,
+                 pool_size: int = 10, max_workers: int = 4):
+        """
+        Args:
+            stream_config: 설정 XML 스트리밍 파싱 여부
+            pool_size: 장비와 유지할 HTTP 커넥션 수
+            max_workers: vsys별 히트 카운트를 동시에 조회할 최대 요청 수 (관리 플레인 부하 제한)
+        """
+        self.api = AsyncPaloAltoAPI(hostname, username, password, stream_config=stream_config, pool_size=pool_size)
+        self.max_workers = max(1, max_workers)
+
+    @asynccontextmanager
+    async def session(self):
+        """수집 세션 비동기 컨텍스트 매니저.
+        세션 안의 export는 같은 설정 스냅샷을 공유하고, 세션이 끝나면 스냅샷을 폐기하여
+        다음 세션에서 최신 설정을 다시 내려받습니다.
+        """
+        try:
+            yield self
+        finally:
+            self.api.invalidate_config()
+
+    async def close(self) -> None:
+        await self.api.close()
+
+    async def get_system_info(self) -> pd.DataFrame:
+        """시스템 정보를 반환합니다."""
+        return await self.api.get_system_info()
+
+    async def export_security_rules(self) -> pd.DataFrame:
+        """보안 규칙을 반환합니다."""
+        return await self.api.export_security_rules()
+
+    async def export_network_objects(self) -> pd.DataFrame:
+        """네트워크 객체 정보를 반환합니다."""
+        return await self.api.export_network_objects()
+
+    async def export_network_group_objects(self) -> pd.DataFrame:
+        """네트워크 그룹 객체 정보를 중첩 그룹까지 펼친 멤버와 함께 반환합니다."""
+        return flatten_group_entries(await self.api.export_network_group_objects())
+
+    async def export_service_objects(self) -> pd.DataFrame:
+        """서비스 객체 정보를 반환합니다."""
+        return await self.api.export_service_objects()
+
+    async def export_service_group_objects(self) -> pd.DataFrame:
+        """서비스 그룹 객체 정보를 반환합니다."""
+        return await self.api.export_service_group_objects()
+
+    async def export_usage_logs(self, days: Optional[int] = None) -> pd.DataFrame:
+        """정책 사용이력을 DataFrame으로 반환합니다.
+
+        Args:
+            days: 미사용 기준 일수 (예: 30일 이상 미사용 시 '미사용'으로 표시)
+
+        Returns:
+            pd.DataFrame: Rule Name, Last Hit Date, Unused Days, 미사용여부 컬럼을 가진 DataFrame
+        """
+        vsys_list = await self.api.get_vsys_list()
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def fetch(vsys_name: str) -> pd.DataFrame:
+            async with semaphore:
+                return await self.api.export_hit_count(vsys_name)
+
+        # gather는 입력 순서대로 결과를 반환하므로 vsys 순서가 유지됨
+        hit_counts = await asyncio.gather(*(fetch(vsys_name) for vsys_name in vsys_list))
+        return summarize_hit_counts(list(hit_counts), days)
@@ -0,0 +1,251 @@
+import os
+import asyncio
+import tempfile
+import xml.etree.ElementTree as ET
+
+import pandas as pd
+
+from firewall.http_session import aiohttp, create_async_http_session, request_with_retry
+from .paloalto_module import (
+    ConfigSnapshot,
+    parse_api_key,
+    parse_vsys_list,
+    parse_system_info,
+    parse_hit_count,
+    hit_count_command,
+)
+
+
+class AsyncPaloAltoAPI:
+    """
+    PaloAlto XML API의 asyncio 클라이언트입니다.
+    응답 파싱은 PaloAltoAPI와 같은 함수를 사용하며, CPU 작업(XML/DataFrame 변환)은
+    이벤트 루프를 막지 않도록 기본 스레드 풀에서 실행합니다.
+    """
+
+    def __init__(self, hostname: str, username: str, password: str, stream_config: bool = False,
+                 pool_size: int = 10, max_retries: int = 3, timeout: int = 10000) -> None:
+        """
+        :param stream_config: True이면 설정 XML을 디스크에 내려받아 iterparse로 스트리밍 파싱합니다.
+        :param pool_size: 장비와 유지할 keep-alive 커넥션 수
+        :param max_retries: 연결 실패 및 일시 장애 응답에 대한 최대 재시도 횟수
+        :param timeout: API 요청 제한 시간 (초)
+        """
+        self.hostname = hostname
+        self.base_url = f'https://{hostname}/api/'
+        self.stream_config = stream_config
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._username = username
+        self._password = password
+        self.api_key = None
+        self.http = None
+        self._config_snapshots = {}
+        self._config_locks = {}
+        # asyncio.Lock은 실행 중인 이벤트 루프 안에서 생성 (Python 3.8/3.9는 생성 시점의 루프에 묶임)
+        self._key_lock = None
+
+    async def close(self) -> None:
+        """캐시된 설정 스냅샷과 HTTP 세션을 정리합니다."""
+        self.invalidate_config()
+        if self.http is not None:
+            await self.http.close()
+            self.http = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _request(self, parameters):
+        if self.http is None:
+            self.http = create_async_http_session(pool_size=self.pool_size)
+        try:
+            response = await request_with_retry(
+                self.http, 'GET', self.base_url,
+                max_retries=self.max_retries,
+                params=list(parameters),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        except asyncio.TimeoutError:
+            raise Exception("API 요청 시간 초과")
+        except aiohttp.ClientConnectionError:
+            raise Exception(f"API 서버 연결 실패: {self.hostname}")
+        except aiohttp.ClientError as e:
+            raise Exception(f"API 요청 중 오류 발생: {str(e)}")
+        if response.status != 200:
+            text = await response.text()
+            raise Exception(f"API 요청 실패 (상태 코드: {response.status}): {text}")
+        return response
+
+    async def get_api_data(self, parameters) -> str:
+        """API 호출을 수행하고 응답 본문을 반환합니다."""
+        response = await self._request(parameters)
+        try:
+            return await response.text()
+        finally:
+            response.release()
+
+    async def get_api_key(self) -> str:
+        """API 키를 반환합니다. 최초 호출 시에만 키를 생성합니다."""
+        if self._key_lock is None:
+            self._key_lock = asyncio.Lock()
+        async with self._key_lock:
+            if self.api_key is None:
+                try:
+                    keygen_params = (
+                        ('type', 'keygen'),
+                        ('user', self._username),
+                        ('password', self._password)
+                    )
+                    self.api_key = parse_api_key(await self.get_api_data(keygen_params))
+                except ET.ParseError:
+                    raise Exception("API 응답 XML 파싱 실패")
+                except Exception as e:
+                    raise Exception(f"API 키 생성 실패: {str(e)}")
+        return self.api_key
+
+    async def get_vsys_list(self) -> list:
+        """
+        vsys 리스트를 반환합니다.
+
+        :return: vsys 이름 리스트
+        """
+        params = (
+            ('key', await self.get_api_key()),
+            ('type', 'config'),
+            ('action', 'get'),
+            ('xpath', '/config/devices/entry/vsys/entry'),
+        )
+        return parse_vsys_list(await self.get_api_data(params))
+
+    async def _config_params(self, config_type: str) -> tuple:
+        action = 'show' if config_type == 'running' else 'get'
+        return (
+            ('key', await self.get_api_key()),
+            ('type', 'config'),
+            ('action', action),
+            ('xpath', '/config')
+        )
+
+    async def get_config(self, config_type: str = 'running') -> str:
+        """
+        설정 정보를 가져옵니다.
+
+        :param config_type: 'running' 또는 기타
+        :return: 설정 XML 문자열
+        """
+        return await self.get_api_data(await self._config_params(config_type))
+
+    async def download_config(self, config_type: str = 'running', file_path: str = None,
+                              chunk_size: int = 1024 * 1024) -> str:
+        """
+        설정 XML을 메모리에 올리지 않고 청크 단위로 파일에 내려받습니다.
+
+        :param config_type: 'running' 또는 기타
+        :param file_path: 저장할 파일 경로, None이면 임시 파일 생성
+        :param chunk_size: 한 번에 기록할 바이트 수
+        :return: 저장된 파일 경로
+        """
+        if file_path is None:
+            fd, file_path = tempfile.mkstemp(prefix=f'{self.hostname}_{config_type}_', suffix='.xml')
+            os.close(fd)
+        response = await self._request(await self._config_params(config_type))
+        try:
+            with open(file_path, mode='wb') as file:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    file.write(chunk)
+        except Exception:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            raise
+        finally:
+            response.release()
+        return file_path
+
+    async def get_config_snapshot(self, config_type: str = 'running') -> ConfigSnapshot:
+        """
+        설정 스냅샷을 반환합니다. 여러 export가 동시에 요청해도 설정은 한 번만 내려받습니다.
+
+        :param config_type: 'running' 또는 기타
+        :return: 설정 스냅샷
+        """
+        lock = self._config_locks.setdefault(config_type, asyncio.Lock())
+        async with lock:
+            snapshot = self._config_snapshots.get(config_type)
+            if snapshot is None:
+                if self.stream_config:
+                    snapshot = ConfigSnapshot(config_type, file_path=await self.download_config(config_type))
+                else:
+                    config_xml = await self.get_config(config_type)
+                    root = await asyncio.get_running_loop().run_in_executor(None, ET.fromstring, config_xml)
+                    snapshot = ConfigSnapshot(config_type, root=root)
+                self._config_snapshots[config_type] = snapshot
+        return snapshot
+
+    def invalidate_config(self, config_type: str = None) -> None:
+        """
+        캐시된 설정 스냅샷을 폐기합니다. 다음 export 호출 시 설정을 다시 내려받습니다.
+
+        :param config_type: 폐기할 설정 종류, None이면 전체 폐기
+        """
+        config_types = list(self._config_snapshots) if config_type is None else [config_type]
+        for name in config_types:
+            snapshot = self._config_snapshots.pop(name, None)
+            if snapshot is not None:
+                snapshot.close()
+
+    async def get_system_info(self) -> pd.DataFrame:
+        """
+        시스템 정보를 DataFrame으로 반환합니다.
+
+        :return: 시스템 정보 DataFrame
+        """
+        params = (
+            ('type', 'op'),
+            ('cmd', '<show><system><info/></system></show>'),
+            ('key', await self.get_api_key())
+        )
+        return parse_system_info(await self.get_api_data(params))
+
+    async def _export_config_items(self, iter_name: str, config_type: str) -> pd.DataFrame:
+        snapshot = await self.get_config_snapshot(config_type)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: pd.DataFrame(getattr(snapshot, iter_name)())
+        )
+
+    async def export_security_rules(self, config_type: str = 'running') -> pd.DataFrame:
+        """보안 규칙 정보를 DataFrame으로 반환합니다."""
+        return await self._export_config_items('iter_security_rules', config_type)
+
+    async def export_network_objects(self, config_type: str = 'running') -> pd.DataFrame:
+        """네트워크 객체 정보를 DataFrame으로 반환합니다."""
+        return await self._export_config_items('iter_network_objects', config_type)
+
+    async def export_network_group_objects(self, config_type: str = 'running') -> pd.DataFrame:
+        """네트워크 그룹 객체 정보를 DataFrame으로 반환합니다."""
+        return await self._export_config_items('iter_network_group_objects', config_type)
+
+    async def export_service_objects(self, config_type: str = 'running') -> pd.DataFrame:
+        """서비스 객체 정보를 DataFrame으로 반환합니다."""
+        return await self._export_config_items('iter_service_objects', config_type)
+
+    async def export_service_group_objects(self, config_type: str = 'running') -> pd.DataFrame:
+        """서비스 그룹 객체 정보를 DataFrame으로 반환합니다."""
+        return await self._export_config_items('iter_service_group_objects', config_type)
+
+    async def export_hit_count(self, vsys_name: str = 'vsys1') -> pd.DataFrame:
+        """
+        히트 카운트 정보를 DataFrame으로 반환합니다.
+
+        :param vsys_name: vsys 이름
+        :return: 히트 카운트 DataFrame
+        """
+        params = (
+            ('type', 'op'),
+            ('cmd', hit_count_command(vsys_name)),
+            ('key', await self.get_api_key())
+        )
+        return parse_hit_count(await self.get_api_data(params), vsys_name)
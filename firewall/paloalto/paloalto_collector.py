@@ -1,12 +1,73 @@
 # firewall/paloalto/paloalto_collector.py
 import pandas as pd
-from typing import Optional
+from typing import List, Optional
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from firewall.firewall_interface import FirewallInterface
+from firewall.group_resolver import flatten_group_entries
 from .paloalto_module import PaloAltoAPI
 
+USAGE_LOG_COLUMNS = ['Rule Name', 'Last Hit Date', 'Unused Days', '미사용여부']
+
+
+def summarize_hit_counts(hit_counts: List[pd.DataFrame], days: Optional[int] = None) -> pd.DataFrame:
+    """vsys별 히트 카운트 DataFrame을 합쳐 정책 사용이력 DataFrame으로 변환합니다.
+
+    Args:
+        hit_counts: vsys별 히트 카운트 DataFrame 리스트
+        days: 미사용 기준 일수
+
+    Returns:
+        pd.DataFrame: Rule Name, Last Hit Date, Unused Days, 미사용여부 컬럼을 가진 DataFrame
+    """
+    if not hit_counts:
+        return pd.DataFrame(columns=USAGE_LOG_COLUMNS)
+
+    # 모든 vsys의 데이터를 하나로 합침
+    result_df = pd.concat(hit_counts, ignore_index=True)
+    
+    # 필요한 컬럼만 선택
+    result_df = result_df[['Rule Name', 'Last Hit Date', 'Unused Days']]
+    
+    # 미사용여부 컬럼 추가
+    def determine_usage_status(unused_days):
+        if pd.isna(unused_days):
+            return '미사용'  # 사용 기록이 없는 경우
+        if days is not None and unused_days > days:
+            return '미사용'  # 기준일 이상 미사용
+        return '사용'  # 기준일 이내 사용
+    
+    result_df['미사용여부'] = result_df['Unused Days'].apply(determine_usage_status)
+    
+    return result_df
+
+
 class PaloAltoCollector(FirewallInterface):
-    def __init__(self, hostname: str, username: str, password: str):
-        self.api = PaloAltoAPI(hostname, username, password)
+    def __init__(self, hostname: str, username: str, password: str, stream_config: bool = False,
+                 pool_size: int = 10, max_workers: int = 4):
+        """
+        Args:
+            stream_config: 설정 XML 스트리밍 파싱 여부
+            pool_size: 장비와 유지할 HTTP 커넥션 풀 크기
+            max_workers: vsys별 히트 카운트를 동시에 조회할 최대 작업 수 (관리 플레인 부하 제한)
+        """
+        self.api = PaloAltoAPI(hostname, username, password, stream_config=stream_config, pool_size=pool_size)
+        self.max_workers = max(1, max_workers)
+
+    @contextmanager
+    def session(self):
+        """수집 세션 컨텍스트 매니저.
+        세션 안의 export는 같은 설정 스냅샷을 공유하고, 세션이 끝나면 스냅샷을 폐기하여
+        다음 세션에서 최신 설정을 다시 내려받습니다.
+        """
+        try:
+            yield self
+        finally:
+            self.api.invalidate_config()
+
+    def close(self) -> None:
+        """캐시된 설정 스냅샷과 HTTP 커넥션 풀을 정리합니다."""
+        self.api.close()
 
     def get_system_info(self) -> pd.DataFrame:
         """시스템 정보를 반환합니다."""
@@ -21,8 +82,8 @@ class PaloAltoCollector(FirewallInterface):
         return self.api.export_network_objects()
 
     def export_network_group_objects(self) -> pd.DataFrame:
-        """네트워크 그룹 객체 정보를 반환합니다."""
-        return self.api.export_network_group_objects()
+        """네트워크 그룹 객체 정보를 중첩 그룹까지 펼친 멤버와 함께 반환합니다."""
+        return flatten_group_entries(self.api.export_network_group_objects())
 
     def export_service_objects(self) -> pd.DataFrame:
         """서비스 객체 정보를 반환합니다."""
@@ -41,28 +102,13 @@ class PaloAltoCollector(FirewallInterface):
         Returns:
             pd.DataFrame: Rule Name, Last Hit Date, Unused Days, 미사용여부 컬럼을 가진 DataFrame
         """
-        # 모든 vsys의 히트 카운트 정보를 수집
+        # 모든 vsys의 히트 카운트 정보를 제한된 동시성으로 수집 (결과는 vsys 순서 유지)
         vsys_list = self.api.get_vsys_list()
-        hit_counts = []
-        
-        for vsys in vsys_list:
-            df = self.api.export_hit_count(vsys)
-            hit_counts.append(df)
-        
-        # 모든 vsys의 데이터를 하나로 합침
-        result_df = pd.concat(hit_counts, ignore_index=True)
-        
-        # 필요한 컬럼만 선택
-        result_df = result_df[['Rule Name', 'Last Hit Date', 'Unused Days']]
-        
-        # 미사용여부 컬럼 추가
-        def determine_usage_status(unused_days):
-            if pd.isna(unused_days):
-                return '미사용'  # 사용 기록이 없는 경우
-            if days is not None and unused_days > days:
-                return '미사용'  # 기준일 이상 미사용
-            return '사용'  # 기준일 이내 사용
-        
-        result_df['미사용여부'] = result_df['Unused Days'].apply(determine_usage_status)
+        if not vsys_list:
+            return summarize_hit_counts([], days)
+
+        workers = min(self.max_workers, len(vsys_list))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            hit_counts = list(executor.map(self.api.export_hit_count, vsys_list))
         
-        return result_df
\ No newline at end of file
+        return summarize_hit_counts(hit_counts, days)
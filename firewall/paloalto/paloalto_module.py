@@ -1,14 +1,17 @@
 import os
 import time
+import tempfile
 import datetime
 import logging
 import requests
 import xml.etree.ElementTree as ET
 
 import pandas as pd
-from openpyxl import load_workbook
 from openpyxl.styles import PatternFill
 
+from firewall.http_session import create_http_session
+from firewall.excel_writer import write_excel
+
 # SSL 설정
 requests.packages.urllib3.util.ssl_.DEFAULT_CIPHERS += ':DES-CBC3-SHA'
 requests.packages.urllib3.disable_warnings()
@@ -20,42 +23,350 @@ logging.basicConfig(
 )
 
 
-def apply_excel_style(file_name: str) -> None:
+def get_member_texts(xml_elements) -> list:
     """
-    모든 시트에 대해 헤더에 연한 회색 배경을 적용하고,
-    헤더의 너비를 자동 조절하되 최대 너비를 40으로 제한합니다.
-    
-    :param file_name: 처리할 엑셀 파일 이름
+    주어진 XML 요소 리스트에서 텍스트 값을 추출합니다.
+
+    :param xml_elements: XML 요소 리스트
+    :return: 텍스트 값 리스트
     """
     try:
-        workbook = load_workbook(file_name)
-        header_fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-
-        # 모든 워크시트를 순회하며 스타일 적용
-        for worksheet in workbook.worksheets:
-            header_row = worksheet[1]
-            for cell in header_row:
-                cell.fill = header_fill
-                column_letter = cell.column_letter
-                max_length = 0
-                for col_cell in worksheet[column_letter]:
-                    if col_cell.value is not None:
-                        cell_length = len(str(col_cell.value))
-                        if cell_length > max_length:
-                            max_length = cell_length
-                adjusted_width = (max_length + 2) * 1.2
-                worksheet.column_dimensions[column_letter].width = min(40, adjusted_width)
-
-        workbook.save(file_name)
-    except Exception as error:
-        logging.error("엑셀 스타일 적용 중 오류 발생: %s", error)
+        return [element.text for element in xml_elements if element.text is not None]
+    except Exception:
+        return []
+
+
+def list_to_string(list_data: list) -> str:
+    """
+    리스트 데이터를 콤마 구분 문자열로 변환합니다.
+
+    :param list_data: 리스트 데이터
+    :return: 콤마로 구분된 문자열
+    """
+    return ','.join(str(item) for item in list_data)
+
+
+def parse_api_key(xml_text: str) -> str:
+    """
+    keygen 응답 XML에서 API 키를 추출합니다.
+
+    :param xml_text: keygen 응답 XML 문자열
+    :return: API 키
+    """
+    key_element = ET.fromstring(xml_text).find('./result/key')
+    if key_element is None:
+        raise Exception("API 키를 찾을 수 없습니다")
+    return key_element.text
+
+
+def parse_vsys_list(xml_text: str) -> list:
+    """
+    vsys 설정 응답 XML에서 vsys 이름 리스트를 추출합니다.
+
+    :param xml_text: vsys 설정 응답 XML 문자열
+    :return: vsys 이름 리스트
+    """
+    vsys_entries = ET.fromstring(xml_text).findall('./result/entry')
+    return [vsys.attrib.get('name') for vsys in vsys_entries]
+
+
+def parse_system_info(xml_text: str) -> pd.DataFrame:
+    """
+    show system info 응답 XML을 시스템 정보 DataFrame으로 변환합니다.
+
+    :param xml_text: show system info 응답 XML 문자열
+    :return: 시스템 정보 DataFrame
+    """
+    tree = ET.fromstring(xml_text)
+    uptime = tree.findtext("./result/system/uptime")
+    info = {
+        "hostname": tree.findtext("./result/system/hostname"),
+        "ip_address": tree.findtext("./result/system/ip-address"),
+        "mac_address": tree.findtext("./result/system/mac-address"),
+        "uptime": uptime.split(" ")[0] if uptime else None,
+        "model": tree.findtext("./result/system/model"),
+        "serial_number": tree.findtext("./result/system/serial"),
+        "sw_version": tree.findtext("./result/system/sw-version"),
+        "app_version": tree.findtext("./result/system/app-version"),
+    }
+    return pd.DataFrame(info, index=[0])
+
+
+def hit_count_command(vsys_name: str) -> str:
+    """vsys의 보안 규칙 히트 카운트 조회 op 명령을 반환합니다."""
+    return (
+        f"<show><rule-hit-count><vsys><vsys-name><entry name='{vsys_name}'>"
+        "<rule-base><entry name='security'><rules><all/></rules></entry></rule-base>"
+        "</entry></vsys-name></vsys></rule-hit-count></show>"
+    )
+
+
+def parse_hit_count(xml_text: str, vsys_name: str) -> pd.DataFrame:
+    """
+    rule-hit-count 응답 XML을 히트 카운트 DataFrame으로 변환합니다.
+
+    :param xml_text: rule-hit-count 응답 XML 문자열
+    :param vsys_name: vsys 이름
+    :return: 히트 카운트 DataFrame
+    """
+    tree = ET.fromstring(xml_text)
+    rule_entries = tree.findall('./result/rule-hit-count/vsys/entry/rule-base/entry/rules/entry')
+
+    hit_counts = []
+    for rule in rule_entries:
+        rule_name = str(rule.attrib.get('name'))
+        member_texts = get_member_texts(rule)
+        try:
+            hit_count = member_texts[1]
+            last_hit_ts = int(member_texts[2])
+            first_hit_ts = int(member_texts[4])
+        except (IndexError, ValueError) as error:
+            logging.error("히트 카운트 파싱 중 오류 발생: %s", error)
+            continue
+
+        no_unused_days = 99999
+        no_hit_date = datetime.datetime(1900, 1, 1).strftime('%Y-%m-%d')
+
+        if first_hit_ts == 0:
+            unused_days = no_unused_days
+        else:
+            unused_days = (datetime.datetime.now() - datetime.datetime.fromtimestamp(last_hit_ts)).days
+
+        last_hit_date = no_hit_date if last_hit_ts == 0 else datetime.datetime.fromtimestamp(last_hit_ts).strftime('%Y-%m-%d')
+        first_hit_date = no_hit_date if first_hit_ts == 0 else datetime.datetime.fromtimestamp(first_hit_ts).strftime('%Y-%m-%d')
+
+        hit_counts.append({
+            "Vsys": vsys_name,
+            "Rule Name": rule_name,
+            "Hit Count": hit_count,
+            "First Hit Date": first_hit_date,
+            "Last Hit Date": last_hit_date,
+            "Unused Days": unused_days
+        })
+
+    return pd.DataFrame(hit_counts)
+
+
+class ConfigSnapshot:
+    """
+    한 번 내려받은 설정 XML을 여러 export 간에 공유하기 위한 스냅샷입니다.
+
+    파싱된 트리(root)를 메모리에 보관하거나, 디스크에 저장된 XML 파일(file_path)을
+    iterparse로 순회하는 스트리밍 방식 중 하나로 동작합니다.
+    """
+
+    VSYS_PATH = './result/config/devices/entry/vsys/entry'
+    VSYS_TAGS = ['result', 'config', 'devices', 'entry', 'vsys', 'entry']
+
+    def __init__(self, config_type: str, root: ET.Element = None, file_path: str = None) -> None:
+        if (root is None) == (file_path is None):
+            raise ValueError("root와 file_path 중 하나만 지정해야 합니다.")
+        self.config_type = config_type
+        self.root = root
+        self.file_path = file_path
+        self.fetched_at = datetime.datetime.now()
+
+    @property
+    def is_streaming(self) -> bool:
+        return self.file_path is not None
+
+    def close(self) -> None:
+        """스트리밍 모드에서 내려받은 임시 XML 파일을 삭제합니다."""
+        if self.file_path and os.path.exists(self.file_path):
+            try:
+                os.remove(self.file_path)
+            except OSError as error:
+                logging.error("설정 임시 파일 삭제 실패 (%s): %s", self.file_path, error)
+        self.file_path = None
+        self.root = None
+
+    def iter_vsys_entries(self, sub_path: str):
+        """
+        각 vsys 하위의 sub_path 요소를 (vsys 이름, 요소) 형태로 순회합니다.
+
+        :param sub_path: vsys entry 기준 상대 경로 (예: 'address/entry')
+        :return: (vsys 이름, XML 요소) 제너레이터
+        """
+        if self.is_streaming:
+            yield from self._iter_streaming_entries(sub_path)
+            return
+        if self.root is None:
+            raise ValueError("이미 닫힌 설정 스냅샷입니다.")
+        for vsys in self.root.findall(self.VSYS_PATH):
+            vsys_name = vsys.attrib.get('name')
+            for entry in vsys.findall(f'./{sub_path}'):
+                yield vsys_name, entry
+
+    def _iter_streaming_entries(self, sub_path: str):
+        """
+        iterparse로 XML 파일을 점진적으로 파싱하며 대상 요소를 반환합니다.
+        처리가 끝난 요소는 부모에서 즉시 제거하므로 메모리 사용량은
+        문서 전체가 아닌 entry 하나 크기로 제한됩니다.
+        """
+        target = self.VSYS_TAGS + sub_path.split('/')
+        target_depth = len(target)
+        vsys_depth = len(self.VSYS_TAGS)
+        path = []
+        elements = []
+        vsys_name = None
+
+        for event, elem in ET.iterparse(self.file_path, events=('start', 'end')):
+            if event == 'start':
+                if elements:
+                    path.append(elem.tag)
+                elements.append(elem)
+                if len(path) == vsys_depth and path == self.VSYS_TAGS:
+                    vsys_name = elem.attrib.get('name')
+                continue
+
+            elements.pop()
+            if not elements:
+                break
+
+            # 대상 entry 내부 요소는 entry 전체가 완성될 때까지 유지
+            if len(path) > target_depth and path[:target_depth] == target:
+                path.pop()
+                continue
+
+            if path == target:
+                yield vsys_name, elem
+
+            elements[-1].remove(elem)
+            elem.clear()
+            path.pop()
+
+    def iter_security_rules(self):
+        """
+        보안 규칙을 파싱되는 순서대로 하나씩 반환합니다.
+
+        :return: 보안 규칙 dict 제너레이터
+        """
+        vsys_seq = {}
+
+        for vsys_name, rule in self.iter_vsys_entries('rulebase/security/rules/entry'):
+            vsys_seq[vsys_name] = vsys_seq.get(vsys_name, 0) + 1
+            rule_name = str(rule.attrib.get('name'))
+            disabled_list = get_member_texts(rule.findall('./disabled'))
+            disabled_status = "N" if list_to_string(disabled_list) == "yes" else "Y"
+            action = list_to_string(get_member_texts(rule.findall('./action')))
+            source = list_to_string(get_member_texts(rule.findall('./source/member')))
+            user = list_to_string(get_member_texts(rule.findall('./source-user/member')))
+            destination = list_to_string(get_member_texts(rule.findall('./destination/member')))
+            service = list_to_string(get_member_texts(rule.findall('./service/member')))
+            application = list_to_string(get_member_texts(rule.findall('./application/member')))
+            url_filtering = list_to_string(get_member_texts(rule.findall('./profile-setting/profiles/url-filtering/member')))
+            category = list_to_string(get_member_texts(rule.findall('./category/member')))
+            category = "any" if not category else category
+            description_list = get_member_texts(rule.findall('./description'))
+            description = list_to_string([desc.replace('\n', ' ') for desc in description_list])
+
+            yield {
+                "Vsys": vsys_name,
+                "Seq": vsys_seq[vsys_name],
+                "Rule Name": rule_name,
+                "Enable": disabled_status,
+                "Action": action,
+                "Source": source,
+                "User": user,
+                "Destination": destination,
+                "Service": service,
+                "Application": application,
+                "Security Profile": url_filtering,
+                "Category": category,
+                "Description": description,
+            }
+
+    def iter_network_objects(self):
+        """
+        네트워크 객체를 파싱되는 순서대로 하나씩 반환합니다.
+
+        :return: 네트워크 객체 dict 제너레이터
+        """
+        for _, address in self.iter_vsys_entries('address/entry'):
+            address_name = address.attrib.get('name')
+            address_type = address.find('*').tag if address.find('*') is not None else ""
+            member_elements = address.findall(f'./{address_type}')
+            members = [elem.text for elem in member_elements if elem.text is not None]
+
+            yield {
+                "Name": address_name,
+                "Type": address_type,
+                "Value": list_to_string(members)
+            }
+
+    def iter_network_group_objects(self):
+        """
+        네트워크 그룹 객체를 파싱되는 순서대로 하나씩 반환합니다.
+
+        :return: 네트워크 그룹 객체 dict 제너레이터
+        """
+        for _, group in self.iter_vsys_entries('address-group/entry'):
+            group_name = group.attrib.get('name')
+            member_elements = group.findall('./static/member')
+            members = [elem.text for elem in member_elements if elem.text is not None]
+
+            yield {
+                "Group Name": group_name,
+                "Entry": list_to_string(members)
+            }
+
+    def iter_service_objects(self):
+        """
+        서비스 객체를 파싱되는 순서대로 하나씩 반환합니다.
+
+        :return: 서비스 객체 dict 제너레이터
+        """
+        for _, service in self.iter_vsys_entries('service/entry'):
+            service_name = service.attrib.get('name')
+            protocol_elem = service.find('protocol')
+            if protocol_elem is not None:
+                for protocol in protocol_elem:
+                    protocol_name = protocol.tag
+                    port = protocol.find('port').text if protocol.find('port') is not None else None
+
+                    yield {
+                        "Name": service_name,
+                        "Protocol": protocol_name,
+                        "Port": port,
+                    }
+
+    def iter_service_group_objects(self):
+        """
+        서비스 그룹 객체를 파싱되는 순서대로 하나씩 반환합니다.
+
+        :return: 서비스 그룹 객체 dict 제너레이터
+        """
+        for _, group in self.iter_vsys_entries('service-group/entry'):
+            group_name = group.attrib.get('name')
+            member_elements = group.findall('./members/member')
+            members = [elem.text for elem in member_elements if elem.text is not None]
+
+            yield {
+                "Group Name": group_name,
+                "Entry": list_to_string(members),
+            }
 
 
 class PaloAltoAPI:
-    def __init__(self, hostname: str, username: str, password: str) -> None:
+    def __init__(self, hostname: str, username: str, password: str, stream_config: bool = False,
+                 pool_size: int = 10, max_retries: int = 3) -> None:
+        """
+        :param stream_config: True이면 설정 XML을 디스크에 내려받아 iterparse로 스트리밍 파싱합니다.
+                              대용량 설정에서 메모리 사용량을 entry 하나 크기로 제한합니다.
+        :param pool_size: 장비와 유지할 keep-alive 커넥션 풀 크기
+        :param max_retries: 연결 실패 및 일시 장애 응답에 대한 최대 재시도 횟수
+        """
         self.hostname = hostname
         self.base_url = f'https://{hostname}/api/'
+        self.stream_config = stream_config
+        self.http = create_http_session(pool_size=pool_size, max_retries=max_retries)
         self.api_key = self._get_api_key(username, password)
+        self._config_snapshots = {}
+
+    def close(self) -> None:
+        """캐시된 설정 스냅샷과 HTTP 커넥션 풀을 정리합니다."""
+        self.invalidate_config()
+        self.http.close()
 
     def save_to_excel(self, data, sheet_names=None) -> str:
         """
@@ -73,24 +384,20 @@ class PaloAltoAPI:
         
         # 단일 DataFrame인 경우
         if not isinstance(data, list):
-            sheet_name = sheet_names if isinstance(sheet_names, str) else "Sheet1"
-            file_name = f"{current_date}_{self.hostname}_{sheet_name}.xlsx"
-            with pd.ExcelWriter(file_name, engine='openpyxl') as writer:
-                data.to_excel(writer, sheet_name=sheet_name, index=False)
+            sheet_names = sheet_names if isinstance(sheet_names, str) else "Sheet1"
+            file_name = f"{current_date}_{self.hostname}_{sheet_names}.xlsx"
         else:
             # 여러 DataFrame인 경우
-            num_sheets = len(data)
-            if sheet_names is None:
-                sheet_names = [f"Sheet{i+1}" for i in range(num_sheets)]
-            elif not isinstance(sheet_names, list):
+            if sheet_names is not None and not isinstance(sheet_names, list):
                 sheet_names = [sheet_names]
             file_name = f"{current_date}_{self.hostname}_combined.xlsx"
-            with pd.ExcelWriter(file_name) as writer:
-                for df, sheet in zip(data, sheet_names):
-                    df.to_excel(writer, sheet_name=sheet, index=False)
         
-        # 엑셀 파일에 스타일 적용 (모든 시트)
-        apply_excel_style(file_name)
+        # 헤더 배경색과 열 너비를 기록 시점에 함께 적용 (모든 시트)
+        write_excel(
+            file_name, data, sheet_names,
+            header_fill=PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid'),
+            auto_width=True
+        )
         return file_name
 
     @staticmethod
@@ -101,10 +408,7 @@ class PaloAltoAPI:
         :param xml_elements: XML 요소 리스트
         :return: 텍스트 값 리스트
         """
-        try:
-            return [element.text for element in xml_elements if element.text is not None]
-        except Exception:
-            return []
+        return get_member_texts(xml_elements)
 
     @staticmethod
     def list_to_string(list_data: list) -> str:
@@ -114,16 +418,17 @@ class PaloAltoAPI:
         :param list_data: 리스트 데이터
         :return: 콤마로 구분된 문자열
         """
-        return ','.join(str(item) for item in list_data)
+        return list_to_string(list_data)
 
-    def get_api_data(self, parameters, timeout: int = 10000):
+    def get_api_data(self, parameters, timeout: int = 10000, stream: bool = False):
         """API 호출을 수행합니다."""
         try:
-            response = requests.get(
+            response = self.http.get(
                 self.base_url,
                 params=parameters,
                 verify=False,
-                timeout=timeout
+                timeout=timeout,
+                stream=stream
             )
             if response.status_code != 200:
                 raise Exception(f"API 요청 실패 (상태 코드: {response.status_code}): {response.text}")
@@ -144,11 +449,7 @@ class PaloAltoAPI:
                 ('password', password)
             )
             response = self.get_api_data(keygen_params)
-            tree = ET.fromstring(response.text)
-            key_element = tree.find('./result/key')
-            if key_element is None:
-                raise Exception("API 키를 찾을 수 없습니다")
-            return key_element.text
+            return parse_api_key(response.text)
         except ET.ParseError:
             raise Exception("API 응답 XML 파싱 실패")
         except Exception as e:
@@ -168,8 +469,16 @@ class PaloAltoAPI:
         )
 
         response = self.get_api_data(params)
-        vsys_entries = ET.fromstring(response.text).findall('./result/entry')
-        return [vsys.attrib.get('name') for vsys in vsys_entries]
+        return parse_vsys_list(response.text)
+
+    def _config_params(self, config_type: str) -> tuple:
+        action = 'show' if config_type == 'running' else 'get'
+        return (
+            ('key', self.api_key),
+            ('type', 'config'),
+            ('action', action),
+            ('xpath', '/config')
+        )
 
     def get_config(self, config_type: str = 'running') -> str:
         """
@@ -178,16 +487,65 @@ class PaloAltoAPI:
         :param config_type: 'running' 또는 기타
         :return: 설정 XML 문자열
         """
-        action = 'show' if config_type == 'running' else 'get'
-        params = (
-            ('key', self.api_key),
-            ('type', 'config'),
-            ('action', action),
-            ('xpath', '/config')
-        )
-        response = self.get_api_data(params)
+        response = self.get_api_data(self._config_params(config_type))
         return response.text
 
+    def download_config(self, config_type: str = 'running', file_path: str = None,
+                        chunk_size: int = 1024 * 1024) -> str:
+        """
+        설정 XML을 메모리에 올리지 않고 청크 단위로 파일에 내려받습니다.
+
+        :param config_type: 'running' 또는 기타
+        :param file_path: 저장할 파일 경로, None이면 임시 파일 생성
+        :param chunk_size: 한 번에 기록할 바이트 수
+        :return: 저장된 파일 경로
+        """
+        if file_path is None:
+            fd, file_path = tempfile.mkstemp(prefix=f'{self.hostname}_{config_type}_', suffix='.xml')
+            os.close(fd)
+        response = self.get_api_data(self._config_params(config_type), stream=True)
+        try:
+            with open(file_path, mode='wb') as file:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        file.write(chunk)
+        except Exception:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            raise
+        finally:
+            response.close()
+        return file_path
+
+    def get_config_snapshot(self, config_type: str = 'running') -> ConfigSnapshot:
+        """
+        설정 스냅샷을 반환합니다. 최초 호출 시에만 설정을 내려받아 파싱하고,
+        이후에는 invalidate_config()가 호출될 때까지 같은 스냅샷을 재사용합니다.
+
+        :param config_type: 'running' 또는 기타
+        :return: 설정 스냅샷
+        """
+        snapshot = self._config_snapshots.get(config_type)
+        if snapshot is None:
+            if self.stream_config:
+                snapshot = ConfigSnapshot(config_type, file_path=self.download_config(config_type))
+            else:
+                snapshot = ConfigSnapshot(config_type, root=ET.fromstring(self.get_config(config_type)))
+            self._config_snapshots[config_type] = snapshot
+        return snapshot
+
+    def invalidate_config(self, config_type: str = None) -> None:
+        """
+        캐시된 설정 스냅샷을 폐기합니다. 다음 export 호출 시 설정을 다시 내려받습니다.
+
+        :param config_type: 폐기할 설정 종류, None이면 전체 폐기
+        """
+        config_types = list(self._config_snapshots) if config_type is None else [config_type]
+        for name in config_types:
+            snapshot = self._config_snapshots.pop(name, None)
+            if snapshot is not None:
+                snapshot.close()
+
     def save_config(self, config_type: str = 'running') -> bool:
         """
         설정 정보를 XML 파일로 저장합니다.
@@ -196,11 +554,9 @@ class PaloAltoAPI:
         :return: 저장 성공 여부
         """
         current_date = time.strftime("%Y-%m-%d-%H-%M-%S", time.localtime())
-        config_data = self.get_config(config_type)
         file_name = f'{current_date}_{self.hostname}_{config_type}_config.xml'
         try:
-            with open(file_name, mode='w', encoding='utf8') as file:
-                file.write(config_data)
+            self.download_config(config_type, file_name)
             return True
         except Exception as error:
             logging.error("설정 저장 중 오류 발생: %s", error)
@@ -218,19 +574,7 @@ class PaloAltoAPI:
             ('key', self.api_key)
         )
         response = self.get_api_data(params)
-        tree = ET.fromstring(response.text)
-        uptime = tree.findtext("./result/system/uptime")
-        info = {
-            "hostname": tree.findtext("./result/system/hostname"),
-            "ip_address": tree.findtext("./result/system/ip-address"),
-            "mac_address": tree.findtext("./result/system/mac-address"),
-            "uptime": uptime.split(" ")[0] if uptime else None,
-            "model": tree.findtext("./result/system/model"),
-            "serial_number": tree.findtext("./result/system/serial"),
-            "sw_version": tree.findtext("./result/system/sw-version"),
-            "app_version": tree.findtext("./result/system/app-version"),
-        }
-        return pd.DataFrame(info, index=[0])
+        return parse_system_info(response.text)
 
     def get_system_state(self) -> pd.DataFrame:
         """
@@ -272,6 +616,51 @@ class PaloAltoAPI:
         }
         return pd.DataFrame(state, index=[0])
 
+    def iter_security_rules(self, config_type: str = 'running'):
+        """
+        보안 규칙을 파싱되는 순서대로 하나씩 반환합니다.
+
+        :param config_type: 'running' 또는 기타
+        :return: 보안 규칙 dict 제너레이터
+        """
+        return self.get_config_snapshot(config_type).iter_security_rules()
+
+    def iter_network_objects(self, config_type: str = 'running'):
+        """
+        네트워크 객체를 파싱되는 순서대로 하나씩 반환합니다.
+
+        :param config_type: 'running' 또는 기타
+        :return: 네트워크 객체 dict 제너레이터
+        """
+        return self.get_config_snapshot(config_type).iter_network_objects()
+
+    def iter_network_group_objects(self, config_type: str = 'running'):
+        """
+        네트워크 그룹 객체를 파싱되는 순서대로 하나씩 반환합니다.
+
+        :param config_type: 'running' 또는 기타
+        :return: 네트워크 그룹 객체 dict 제너레이터
+        """
+        return self.get_config_snapshot(config_type).iter_network_group_objects()
+
+    def iter_service_objects(self, config_type: str = 'running'):
+        """
+        서비스 객체를 파싱되는 순서대로 하나씩 반환합니다.
+
+        :param config_type: 'running' 또는 기타
+        :return: 서비스 객체 dict 제너레이터
+        """
+        return self.get_config_snapshot(config_type).iter_service_objects()
+
+    def iter_service_group_objects(self, config_type: str = 'running'):
+        """
+        서비스 그룹 객체를 파싱되는 순서대로 하나씩 반환합니다.
+
+        :param config_type: 'running' 또는 기타
+        :return: 서비스 그룹 객체 dict 제너레이터
+        """
+        return self.get_config_snapshot(config_type).iter_service_group_objects()
+
     def export_security_rules(self, config_type: str = 'running') -> pd.DataFrame:
         """
         보안 규칙 정보를 DataFrame으로 반환합니다.
@@ -279,48 +668,7 @@ class PaloAltoAPI:
         :param config_type: 'running' 또는 기타
         :return: 보안 규칙 DataFrame
         """
-        config_xml = self.get_config(config_type)
-        tree = ET.fromstring(config_xml)
-        vsys_entries = tree.findall('./result/config/devices/entry/vsys/entry')
-        security_rules = []
-
-        for vsys in vsys_entries:
-            vsys_name = vsys.attrib.get('name')
-            rulebase = vsys.findall('./rulebase/security/rules/entry')
-            for idx, rule in enumerate(rulebase):
-                rule_name = str(rule.attrib.get('name'))
-                disabled_list = self._get_member_texts(rule.findall('./disabled'))
-                disabled_status = "N" if self.list_to_string(disabled_list) == "yes" else "Y"
-                action = self.list_to_string(self._get_member_texts(rule.findall('./action')))
-                source = self.list_to_string(self._get_member_texts(rule.findall('./source/member')))
-                user = self.list_to_string(self._get_member_texts(rule.findall('./source-user/member')))
-                destination = self.list_to_string(self._get_member_texts(rule.findall('./destination/member')))
-                service = self.list_to_string(self._get_member_texts(rule.findall('./service/member')))
-                application = self.list_to_string(self._get_member_texts(rule.findall('./application/member')))
-                url_filtering = self.list_to_string(self._get_member_texts(rule.findall('./profile-setting/profiles/url-filtering/member')))
-                category = self.list_to_string(self._get_member_texts(rule.findall('./category/member')))
-                category = "any" if not category else category
-                description_list = self._get_member_texts(rule.findall('./description'))
-                description = self.list_to_string([desc.replace('\n', ' ') for desc in description_list])
-
-                rule_info = {
-                    "Vsys": vsys_name,
-                    "Seq": idx + 1,
-                    "Rule Name": rule_name,
-                    "Enable": disabled_status,
-                    "Action": action,
-                    "Source": source,
-                    "User": user,
-                    "Destination": destination,
-                    "Service": service,
-                    "Application": application,
-                    "Security Profile": url_filtering,
-                    "Category": category,
-                    "Description": description,
-                }
-                security_rules.append(rule_info)
-
-        return pd.DataFrame(security_rules)
+        return pd.DataFrame(self.iter_security_rules(config_type))
 
     def export_network_objects(self, config_type: str = 'running') -> pd.DataFrame:
         """
@@ -329,25 +677,7 @@ class PaloAltoAPI:
         :param config_type: 'running' 또는 기타
         :return: 네트워크 객체 DataFrame
         """
-        config_xml = self.get_config(config_type)
-        tree = ET.fromstring(config_xml)
-        address_entries = tree.findall('./result/config/devices/entry/vsys/entry/address/entry')
-        address_objects = []
-
-        for address in address_entries:
-            address_name = address.attrib.get('name')
-            address_type = address.find('*').tag if address.find('*') is not None else ""
-            member_elements = address.findall(f'./{address_type}')
-            members = [elem.text for elem in member_elements if elem.text is not None]
-
-            object_info = {
-                "Name": address_name,
-                "Type": address_type,
-                "Value": self.list_to_string(members)
-            }
-            address_objects.append(object_info)
-
-        return pd.DataFrame(address_objects)
+        return pd.DataFrame(self.iter_network_objects(config_type))
 
     def export_network_group_objects(self, config_type: str = 'running') -> pd.DataFrame:
         """
@@ -356,23 +686,7 @@ class PaloAltoAPI:
         :param config_type: 'running' 또는 기타
         :return: 네트워크 그룹 객체 DataFrame
         """
-        config_xml = self.get_config(config_type)
-        tree = ET.fromstring(config_xml)
-        group_entries = tree.findall('./result/config/devices/entry/vsys/entry/address-group/entry')
-        group_objects = []
-
-        for group in group_entries:
-            group_name = group.attrib.get('name')
-            member_elements = group.findall('./static/member')
-            members = [elem.text for elem in member_elements if elem.text is not None]
-
-            group_info = {
-                "Group Name": group_name,
-                "Entry": self.list_to_string(members)
-            }
-            group_objects.append(group_info)
-
-        return pd.DataFrame(group_objects)
+        return pd.DataFrame(self.iter_network_group_objects(config_type))
 
     def export_service_objects(self, config_type: str = 'running') -> pd.DataFrame:
         """
@@ -381,27 +695,7 @@ class PaloAltoAPI:
         :param config_type: 'running' 또는 기타
         :return: 서비스 객체 DataFrame
         """
-        config_xml = self.get_config(config_type)
-        tree = ET.fromstring(config_xml)
-        service_entries = tree.findall('./result/config/devices/entry/vsys/entry/service/entry')
-        service_objects = []
-
-        for service in service_entries:
-            service_name = service.attrib.get('name')
-            protocol_elem = service.find('protocol')
-            if protocol_elem is not None:
-                for protocol in protocol_elem:
-                    protocol_name = protocol.tag
-                    port = protocol.find('port').text if protocol.find('port') is not None else None
-
-                    service_info = {
-                        "Name": service_name,
-                        "Protocol": protocol_name,
-                        "Port": port,
-                    }
-                    service_objects.append(service_info)
-
-        return pd.DataFrame(service_objects)
+        return pd.DataFrame(self.iter_service_objects(config_type))
 
     def export_service_group_objects(self, config_type: str = 'running') -> pd.DataFrame:
         """
@@ -410,23 +704,7 @@ class PaloAltoAPI:
         :param config_type: 'running' 또는 기타
         :return: 서비스 그룹 객체 DataFrame
         """
-        config_xml = self.get_config(config_type)
-        tree = ET.fromstring(config_xml)
-        group_entries = tree.findall('./result/config/devices/entry/vsys/entry/service-group/entry')
-        group_objects = []
-
-        for group in group_entries:
-            group_name = group.attrib.get('name')
-            member_elements = group.findall('./members/member')
-            members = [elem.text for elem in member_elements if elem.text is not None]
-
-            group_info = {
-                "Group Name": group_name,
-                "Entry": self.list_to_string(members),
-            }
-            group_objects.append(group_info)
-
-        return pd.DataFrame(group_objects)
+        return pd.DataFrame(self.iter_service_group_objects(config_type))
 
     def export_hit_count(self, vsys_name: str = 'vsys1') -> pd.DataFrame:
         """
@@ -437,48 +715,8 @@ class PaloAltoAPI:
         """
         params = (
             ('type', 'op'),
-            (
-                'cmd',
-                f"<show><rule-hit-count><vsys><vsys-name><entry name='{vsys_name}'>"
-                "<rule-base><entry name='security'><rules><all/></rules></entry></rule-base>"
-                "</entry></vsys-name></vsys></rule-hit-count></show>"
-            ),
+            ('cmd', hit_count_command(vsys_name)),
             ('key', self.api_key)
         )
         response = self.get_api_data(params)
-        tree = ET.fromstring(response.text)
-        rule_entries = tree.findall('./result/rule-hit-count/vsys/entry/rule-base/entry/rules/entry')
-
-        hit_counts = []
-        for rule in rule_entries:
-            rule_name = str(rule.attrib.get('name'))
-            member_texts = self._get_member_texts(rule)
-            try:
-                hit_count = member_texts[1]
-                last_hit_ts = int(member_texts[2])
-                first_hit_ts = int(member_texts[4])
-            except (IndexError, ValueError) as error:
-                logging.error("히트 카운트 파싱 중 오류 발생: %s", error)
-                continue
-
-            no_unused_days = 99999
-            no_hit_date = datetime.datetime(1900, 1, 1).strftime('%Y-%m-%d')
-
-            if first_hit_ts == 0:
-                unused_days = no_unused_days
-            else:
-                unused_days = (datetime.datetime.now() - datetime.datetime.fromtimestamp(last_hit_ts)).days
-
-            last_hit_date = no_hit_date if last_hit_ts == 0 else datetime.datetime.fromtimestamp(last_hit_ts).strftime('%Y-%m-%d')
-            first_hit_date = no_hit_date if first_hit_ts == 0 else datetime.datetime.fromtimestamp(first_hit_ts).strftime('%Y-%m-%d')
-
-            hit_counts.append({
-                "Vsys": vsys_name,
-                "Rule Name": rule_name,
-                "Hit Count": hit_count,
-                "First Hit Date": first_hit_date,
-                "Last Hit Date": last_hit_date,
-                "Unused Days": unused_days
-            })
-
-        return pd.DataFrame(hit_counts)
\ No newline at end of file
+        return parse_hit_count(response.text, vsys_name)
@@ -0,0 +1,315 @@
+# firewall/snapshot_store.py
+import os
+import re
+import json
+import logging
+import datetime
+import threading
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:  # parquet/feather 형식을 사용할 때 오류 발생
+    pyarrow = None
+
+MANIFEST_FILE = 'manifest.json'
+
+# 스냅샷 ID(시점) 형식 (같은 초에 여러 번 수집해도 구분되도록 마이크로초까지 기록)
+TIMESTAMP_FORMAT = '%Y%m%d-%H%M%S-%f'
+
+# 저장 형식별 파일 확장자
+FILE_EXTENSIONS = {
+    'parquet': '.parquet',
+    'feather': '.feather',
+    'pickle': '.pkl.gz',
+}
+
+
+def _safe_name(name: str) -> str:
+    """장비/데이터 이름을 디렉터리/파일 이름으로 사용할 수 있게 변환합니다."""
+    return re.sub(r'[^\w.-]+', '_', str(name)).strip('._') or '_'
+
+
+def _is_private(path: str) -> bool:
+    """
+    현재 사용자가 소유하고 다른 사용자가 쓸 수 없는 파일/디렉터리인지 확인합니다.
+    (소유자 정보가 없는 Windows에서는 검사하지 않습니다.)
+    """
+    if not hasattr(os, 'getuid'):
+        return True
+    stat = os.stat(path)
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def _to_columnar(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    컬럼 파일로 저장할 수 있도록 DataFrame을 정리합니다.
+    인덱스를 초기화하고, 컬럼 이름과 여러 타입이 섞인 object 컬럼 값을 문자열로 변환합니다 (빈 값은 유지).
+    """
+    result = df.reset_index(drop=True)
+    result.columns = [str(col) for col in result.columns]
+    for col in result.columns:
+        if result[col].dtype == object and pd.api.types.infer_dtype(result[col], skipna=True).startswith('mixed'):
+            result[col] = result[col].map(lambda value: value if pd.isna(value) else str(value))
+    return result
+
+
+class SnapshotStore:
+    """
+    장비별 수집 데이터를 시점(스냅샷) 단위의 압축 컬럼 파일로 저장하고 조회합니다.
+
+    root_dir/{장비}/{스냅샷 ID}/{데이터 이름}.parquet 형식으로 저장하며,
+    모든 스냅샷 정보는 root_dir/manifest.json에 기록합니다.
+    """
+
+    def __init__(self, root_dir: str, file_format: Optional[str] = None, compression: Optional[str] = None):
+        """
+        Args:
+            root_dir: 저장소 디렉터리
+            file_format: 'parquet'(기본값), 'feather', 'pickle' 중 하나
+                (parquet/feather는 pyarrow가 필요하며, pickle은 컬럼 단위로 읽을 수 없음)
+            compression: 압축 방식 (기본값: parquet/feather는 zstd, pickle은 gzip)
+        """
+        self.root_dir = root_dir
+        self.file_format = file_format or 'parquet'
+        if self.file_format not in FILE_EXTENSIONS:
+            raise ValueError(f"지원하지 않는 저장 형식입니다: {self.file_format}")
+        if self.file_format != 'pickle' and pyarrow is None:
+            raise ImportError(
+                f"{self.file_format} 형식으로 저장하려면 pyarrow가 필요합니다 "
+                f"(pyarrow 없이 사용하려면 file_format='pickle'을 지정하세요)."
+            )
+        self.compression = compression or ('gzip' if self.file_format == 'pickle' else 'zstd')
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        os.makedirs(self.root_dir, exist_ok=True)
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.root_dir, MANIFEST_FILE)
+
+    def _read_manifest(self) -> List[dict]:
+        if not os.path.exists(self.manifest_path):
+            return []
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('snapshots', [])
+
+    def _write_manifest(self, snapshots: List[dict]) -> None:
+        """manifest를 임시 파일에 쓴 뒤 교체하여 중간에 중단되어도 기존 내용이 깨지지 않게 합니다."""
+        temp_path = f"{self.manifest_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'snapshots': snapshots}, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.manifest_path)
+
+    def _write_frame(self, df: pd.DataFrame, file_path: str, file_format: str) -> None:
+        if file_format == 'parquet':
+            df.to_parquet(file_path, compression=self.compression, index=False)
+        elif file_format == 'feather':
+            df.to_feather(file_path, compression=self.compression)
+        else:
+            df.to_pickle(file_path, compression=self.compression)
+
+    def _check_pickle_path(self, file_path: str) -> None:
+        """
+        pickle 파일을 읽기 전에 저장소 안의 파일이고, manifest와 파일 및 상위 디렉터리가 모두
+        현재 사용자 전용인지 확인합니다. pickle은 읽을 때 임의의 코드를 실행할 수 있으므로
+        다른 사용자가 바꿀 수 있는 파일은 읽지 않습니다.
+
+        Raises:
+            PermissionError: 저장소 밖의 파일이거나 현재 사용자 전용이 아닌 경우
+        """
+        root = os.path.realpath(self.root_dir)
+        path = os.path.realpath(file_path)
+        if os.path.commonpath([root, path]) != root:
+            raise PermissionError(f"저장소 밖의 pickle 파일은 읽지 않습니다: {file_path}")
+        checked = [self.manifest_path, path]
+        directory = os.path.dirname(path)
+        while directory != root:
+            checked.append(directory)
+            directory = os.path.dirname(directory)
+        checked.append(root)
+        for checked_path in checked:
+            if not _is_private(checked_path):
+                raise PermissionError(f"현재 사용자 전용이 아니므로 pickle 스냅샷을 읽지 않습니다: {checked_path}")
+
+    @staticmethod
+    def _read_frame(file_path: str, file_format: str, columns: Optional[List[str]]) -> pd.DataFrame:
+        if file_format == 'parquet':
+            return pd.read_parquet(file_path, columns=columns)
+        if file_format == 'feather':
+            return pd.read_feather(file_path, columns=columns)
+        df = pd.read_pickle(file_path)
+        return df[columns] if columns is not None else df
+
+    def save(self, device: str, data: Dict[str, pd.DataFrame], timestamp: Optional[datetime.datetime] = None,
+             vendor: Optional[str] = None) -> str:
+        """
+        장비 1대의 수집 데이터를 하나의 스냅샷으로 저장합니다.
+
+        Args:
+            device: 장비 이름
+            data: {데이터 이름: DataFrame} (예: security_rules, network_objects, usage_logs, system_info)
+            timestamp: 수집 시점 (기본값: 현재 시각)
+            vendor: 방화벽 벤더 (manifest에 기록)
+
+        Returns:
+            스냅샷 ID
+
+        Raises:
+            FileExistsError: 같은 장비에 같은 스냅샷 ID가 이미 있는 경우
+            ValueError: 장비 또는 데이터 이름이 다른 이름과 같은 파일 이름으로 변환되는 경우
+        """
+        snapshot_id = (timestamp or datetime.datetime.now()).strftime(TIMESTAMP_FORMAT)
+        device_dir = _safe_name(device)
+        relative_dir = f"{device_dir}/{snapshot_id}"
+
+        file_names = {}
+        for name, df in data.items():
+            if df is None:
+                continue
+            file_name = f"{relative_dir}/{_safe_name(name)}{FILE_EXTENSIONS[self.file_format]}"
+            if file_name in file_names.values():
+                raise ValueError(f"데이터 이름이 같은 파일 이름으로 변환됩니다: {name}")
+            file_names[name] = file_name
+
+        with self._lock:
+            for snapshot in self._read_manifest():
+                if snapshot['device'] == str(device) and snapshot['snapshot_id'] == snapshot_id:
+                    raise FileExistsError(f"{device} 장비에 {snapshot_id} 스냅샷이 이미 있습니다.")
+                if snapshot['device'] != str(device) and _safe_name(snapshot['device']) == device_dir:
+                    raise ValueError(
+                        f"장비 이름 '{device}'이(가) 기존 장비 '{snapshot['device']}'와 같은 디렉터리({device_dir})로 변환됩니다."
+                    )
+            # 다른 저장 작업이 같은 스냅샷을 만들지 못하도록 디렉터리를 먼저 생성
+            os.makedirs(os.path.join(self.root_dir, relative_dir))
+
+        datasets = {}
+        for name, file_name in file_names.items():
+            df = data[name]
+            frame = _to_columnar(df)
+            self._write_frame(frame, os.path.join(self.root_dir, file_name), self.file_format)
+            datasets[name] = {'file': file_name, 'rows': len(frame), 'columns': list(frame.columns)}
+
+        entry = {
+            'device': str(device),
+            'vendor': vendor,
+            'snapshot_id': snapshot_id,
+            'format': self.file_format,
+            'datasets': datasets,
+        }
+        with self._lock:
+            snapshots = self._read_manifest()
+            snapshots.append(entry)
+            snapshots.sort(key=lambda snapshot: (snapshot['device'], snapshot['snapshot_id']))
+            self._write_manifest(snapshots)
+
+        self.logger.info(f"{device} 스냅샷 저장 완료: {snapshot_id} ({len(datasets)}개 데이터)")
+        return snapshot_id
+
+    def save_collection(self, combined: Dict[str, pd.DataFrame],
+                        timestamp: Optional[datetime.datetime] = None) -> Dict[str, str]:
+        """
+        FleetCollector.collect 결과를 장비별 스냅샷으로 나누어 저장합니다.
+
+        Args:
+            combined: FleetCollector.collect 결과 (Device, Vendor 컬럼이 있는 수집 항목별 DataFrame)
+            timestamp: 수집 시점 (기본값: 현재 시각)
+
+        Returns:
+            {장비 이름: 스냅샷 ID}
+        """
+        timestamp = timestamp or datetime.datetime.now()
+        per_device: Dict[str, Dict[str, pd.DataFrame]] = {}
+        vendors: Dict[str, str] = {}
+        for name, df in combined.items():
+            if name == 'failures' or 'Device' not in df.columns:
+                continue
+            for device, device_df in df.groupby('Device', sort=False):
+                per_device.setdefault(device, {})[name] = device_df.drop(columns=['Device', 'Vendor'], errors='ignore')
+                if 'Vendor' in device_df.columns and len(device_df):
+                    vendors[device] = device_df['Vendor'].iloc[0]
+
+        device_dirs = {}
+        for device in per_device:
+            other = device_dirs.setdefault(_safe_name(device), device)
+            if other != device:
+                raise ValueError(f"장비 이름 '{device}'와 '{other}'이(가) 같은 디렉터리({_safe_name(device)})로 변환됩니다.")
+
+        return {
+            device: self.save(device, data, timestamp, vendors.get(device))
+            for device, data in per_device.items()
+        }
+
+    def list_snapshots(self, device: Optional[str] = None) -> pd.DataFrame:
+        """
+        저장된 스냅샷 목록을 반환합니다.
+
+        Returns:
+            Device, Vendor, Snapshot ID, Datasets 컬럼을 가진 DataFrame (장비, 시점 순)
+        """
+        rows = [
+            {
+                'Device': snapshot['device'],
+                'Vendor': snapshot.get('vendor'),
+                'Snapshot ID': snapshot['snapshot_id'],
+                'Datasets': ','.join(snapshot['datasets']),
+            }
+            for snapshot in self._read_manifest()
+            if device is None or snapshot['device'] == str(device)
+        ]
+        return pd.DataFrame(rows, columns=['Device', 'Vendor', 'Snapshot ID', 'Datasets'])
+
+    def find_snapshot(self, device: str, snapshot_id: Optional[str] = None,
+                      before: Optional[datetime.datetime] = None) -> dict:
+        """
+        장비의 스냅샷 정보를 찾습니다.
+
+        Args:
+            device: 장비 이름
+            snapshot_id: 스냅샷 ID (지정하면 해당 스냅샷)
+            before: 이 시점 이전(포함)의 가장 최근 스냅샷 (snapshot_id가 없을 때 사용)
+
+        Returns:
+            manifest의 스냅샷 항목 (snapshot_id와 before가 모두 없으면 가장 최근 스냅샷)
+        """
+        candidates = [snapshot for snapshot in self._read_manifest() if snapshot['device'] == str(device)]
+        if snapshot_id is not None:
+            candidates = [snapshot for snapshot in candidates if snapshot['snapshot_id'] == snapshot_id]
+        elif before is not None:
+            limit = before.strftime(TIMESTAMP_FORMAT)
+            candidates = [snapshot for snapshot in candidates if snapshot['snapshot_id'] <= limit]
+        if not candidates:
+            raise KeyError(f"{device} 장비의 스냅샷이 없습니다: {snapshot_id or before or 'latest'}")
+        return max(candidates, key=lambda snapshot: snapshot['snapshot_id'])
+
+    def load(self, device: str, dataset: str, snapshot_id: Optional[str] = None,
+             before: Optional[datetime.datetime] = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        스냅샷에서 데이터 하나를 읽어옵니다.
+
+        Args:
+            device: 장비 이름
+            dataset: 데이터 이름 (예: security_rules)
+            snapshot_id: 스냅샷 ID (기본값: 가장 최근 스냅샷)
+            before: 이 시점 이전(포함)의 가장 최근 스냅샷
+            columns: 읽어올 컬럼 목록 (parquet/feather는 해당 컬럼만 디스크에서 읽음)
+
+        Returns:
+            저장된 DataFrame
+
+        Raises:
+            PermissionError: pickle 스냅샷 파일이 현재 사용자 전용이 아닌 경우
+        """
+        snapshot = self.find_snapshot(device, snapshot_id, before)
+        if dataset not in snapshot['datasets']:
+            raise KeyError(f"{device} {snapshot['snapshot_id']} 스냅샷에 {dataset} 데이터가 없습니다.")
+        file_path = os.path.join(self.root_dir, snapshot['datasets'][dataset]['file'])
+        if snapshot['format'] == 'pickle':
+            self._check_pickle_path(file_path)
+            if columns is not None:
+                self.logger.warning(
+                    f"pickle 형식 스냅샷은 컬럼만 골라 읽을 수 없어 전체 데이터를 읽은 뒤 컬럼을 선택합니다: {file_path}"
+                )
+        return self._read_frame(file_path, snapshot['format'], columns)
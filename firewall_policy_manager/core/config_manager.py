@@ -5,6 +5,7 @@
 설정 파일을 관리하는 모듈
 """
 
+import re
 import json
 import logging
 import sys
@@ -31,6 +32,9 @@ class ConfigManager:
         except json.JSONDecodeError:
             logger.error(f"설정 파일 '{config_file}'의 형식이 올바르지 않습니다.")
             sys.exit(1)
+        
+        # 컴파일된 정규식 패턴 (설정 키별로 한 번만 컴파일)
+        self._patterns = {}
     
     def get(self, key, default=None):
         """
@@ -52,4 +56,19 @@ class ConfigManager:
             return value
         except (KeyError, TypeError):
             logger.warning(f"설정 키 '{key}'를 찾을 수 없습니다. 기본값 '{default}'를 사용합니다.")
-            return default 
\ No newline at end of file
+            return default
+    
+    def get_pattern(self, name, default='MASKED'):
+        """
+        patterns 설정의 정규식을 컴파일하여 가져옵니다. 같은 패턴은 한 번만 컴파일합니다.
+        
+        Args:
+            name (str): patterns 아래의 패턴 이름 (예: pattern_3)
+            default (str): 설정이 없을 때 사용할 패턴
+            
+        Returns:
+            re.Pattern: 컴파일된 정규식
+        """
+        if name not in self._patterns:
+            self._patterns[name] = re.compile(self.get(f'patterns.{name}', default))
+        return self._patterns[name]
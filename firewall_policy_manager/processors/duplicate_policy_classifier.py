@@ -6,9 +6,9 @@
 """
 
 import logging
-import pandas as pd
 import os
 from firewall_policy_manager.utils.request_utils import RequestUtils
+from firewall_policy_manager.utils.excel_cache import ExcelCache
 
 logger = logging.getLogger(__name__)
 
@@ -50,11 +50,11 @@ class DuplicatePolicyClassifier:
             if not info_file:
                 return False
             
-            info_df = pd.read_excel(info_file)
+            info_df = ExcelCache.read_excel(info_file)
             auto_extension_id = RequestUtils.find_auto_extension_id(info_df)
             
             # 중복정책 파일 로드
-            df = pd.read_excel(selected_file)
+            df = ExcelCache.read_excel(selected_file)
             
             # 컬럼 확인
             current_columns = df.columns.tolist()
@@ -188,8 +188,8 @@ class DuplicatePolicyClassifier:
                 return False
             
             # 파일 로드
-            policy_df = pd.read_excel(policy_file)
-            duplicate_df = pd.read_excel(duplicate_file)
+            policy_df = ExcelCache.read_excel(policy_file)
+            duplicate_df = ExcelCache.read_excel(duplicate_file)
             
             # 중복여부 컬럼 추가 (없는 경우)
             if '중복여부' not in policy_df.columns:
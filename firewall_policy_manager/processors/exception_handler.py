@@ -8,6 +8,7 @@
 import logging
 import pandas as pd
 from datetime import datetime, timedelta
+from firewall_policy_manager.utils.excel_cache import ExcelCache
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +58,7 @@ class ExceptionHandler:
             if not rule_file:
                 return False
             
-            df = pd.read_excel(rule_file)
+            df = ExcelCache.read_excel(rule_file)
             
             current_date = datetime.now()
             three_months_ago = current_date - timedelta(days=self.config.get('timeframes.recent_policy_days', 90))
@@ -157,7 +158,7 @@ class ExceptionHandler:
             if not rule_file:
                 return False
             
-            df = pd.read_excel(rule_file)
+            df = ExcelCache.read_excel(rule_file)
             
             current_date = datetime.now()
             
@@ -7,9 +7,17 @@ MIS ID 추가 기능을 제공하는 모듈
 
 import logging
 import pandas as pd
+from firewall_policy_manager.utils.excel_cache import ExcelCache
 
 logger = logging.getLogger(__name__)
 
+# MIS ID 파일을 한 번에 읽어오는 행 수
+MIS_CHUNK_SIZE = 100000
+
+# MIS ID 파일에서 읽어오는 컬럼 (청크마다 타입이 달라지지 않도록 문자열로 읽음)
+MIS_COLUMNS = ['ruleset_id', 'mis_id']
+MIS_DTYPES = {'ruleset_id': str, 'mis_id': str}
+
 class MisIdAdder:
     """MIS ID 추가 기능을 제공하는 클래스"""
     
@@ -22,6 +30,51 @@ class MisIdAdder:
         """
         self.config = config_manager
     
+    def normalize_ruleset_ids(self, ruleset_ids):
+        """
+        정책 파일의 Ruleset ID를 MIS ID 파일과 같은 문자열 형식으로 변환합니다.
+        빈 칸이 있어 실수형으로 읽힌 정수 ID(예: 4.0)는 정수 형식('4')으로 변환합니다.
+        
+        Args:
+            ruleset_ids (Series): 정책 파일의 Ruleset ID
+            
+        Returns:
+            Series: 문자열 Ruleset ID (빈 값은 NaN)
+        """
+        def to_id(value):
+            if isinstance(value, float) and value.is_integer():
+                return str(int(value))
+            return str(value)
+        
+        return ruleset_ids.astype(object).map(to_id, na_action='ignore')
+    
+    def read_mis_id_map(self, mis_file, ruleset_ids, chunksize=MIS_CHUNK_SIZE):
+        """
+        MIS ID 파일을 청크 단위로 읽어 필요한 ruleset_id의 MIS ID 매핑만 만듭니다.
+        ruleset_id마다 파일에서 처음 나온 MIS ID를 사용하며, 모두 찾으면 나머지는 읽지 않습니다.
+        
+        Args:
+            mis_file (str): MIS ID CSV 파일 경로
+            ruleset_ids: 매핑이 필요한 ruleset_id 목록 (normalize_ruleset_ids로 변환한 문자열)
+            chunksize (int): 한 번에 읽어올 행 수
+            
+        Returns:
+            Series: 문자열 ruleset_id를 인덱스로 하는 MIS ID
+        """
+        wanted = pd.Index(pd.unique(pd.Series(ruleset_ids, dtype=object).dropna()))
+        mapping = {}
+        if wanted.empty:
+            return pd.Series(mapping, dtype=object)
+        
+        for chunk in pd.read_csv(mis_file, usecols=MIS_COLUMNS, dtype=MIS_DTYPES, chunksize=chunksize):
+            chunk = chunk[chunk['ruleset_id'].isin(wanted) & ~chunk['ruleset_id'].isin(mapping)]
+            chunk = chunk.drop_duplicates(subset=['ruleset_id'], keep='first')
+            mapping.update(zip(chunk['ruleset_id'], chunk['mis_id']))
+            if len(mapping) == len(wanted):
+                break
+        
+        return pd.Series(list(mapping.values()), index=pd.Index(list(mapping.keys()), dtype=object), dtype=object)
+    
     def add_mis_id(self, file_manager):
         """
         파일에 MIS ID를 추가합니다.
@@ -44,30 +97,20 @@ class MisIdAdder:
             if not mis_file:
                 return False
             
-            rule_df = pd.read_excel(file)
-            mis_df = pd.read_csv(mis_file)
-            
-            # 중복 제거
-            mis_df_unique = mis_df.drop_duplicates(subset=['ruleset_id'], keep='first')
+            rule_df = ExcelCache.read_excel(file)
             
-            # MIS ID 매핑 생성
-            mis_id_map = mis_df_unique.set_index('ruleset_id')['mis_id']
+            # MIS ID가 비어 있는 정책의 ruleset_id만 MIS ID 파일에서 찾음
+            missing = rule_df['MIS ID'].isna() | (rule_df['MIS ID'] == '')
+            ruleset_ids = self.normalize_ruleset_ids(rule_df['Ruleset ID'])
+            mis_id_map = self.read_mis_id_map(mis_file, ruleset_ids[missing])
             
             # MIS ID 업데이트
-            total = len(rule_df)
-            updated_count = 0
-            
-            for idx, row in rule_df.iterrows():
-                print(f"\rMIS ID 업데이트 중: {idx + 1}/{total}", end='', flush=True)
-                
-                ruleset_id = row['Ruleset ID']
-                current_mis_id = row['MIS ID']
-                
-                if (pd.isna(current_mis_id) or current_mis_id == '') and ruleset_id in mis_id_map:
-                    rule_df.at[idx, 'MIS ID'] = mis_id_map.get(ruleset_id)
-                    updated_count += 1
-            
-            print()  # 줄바꿈
+            targets = missing & ruleset_ids.isin(mis_id_map.index)
+            updated_count = int(targets.sum())
+            if updated_count:
+                rule_df['MIS ID'] = rule_df['MIS ID'].astype(object).mask(
+                    targets, ruleset_ids.map(mis_id_map)
+                )
             
             new_file_name = file_manager.update_version(file)
             rule_df.to_excel(new_file_name, index=False, engine='openpyxl')
@@ -79,4 +122,4 @@ class MisIdAdder:
             return True
         except Exception as e:
             logger.exception(f"MIS ID 추가 중 오류 발생: {e}")
-            return False 
\ No newline at end of file
+            return False 
@@ -7,6 +7,7 @@
 
 import logging
 import pandas as pd
+from firewall_policy_manager.utils.excel_cache import ExcelCache
 import os
 
 logger = logging.getLogger(__name__)
@@ -37,7 +38,6 @@ class NotificationClassifier:
             file_name: 파일 이름
             excel_manager: Excel 관리자
         """
-        df.to_excel(file_name, index=False, na_rep='', sheet_name=sheet_type)
         excel_manager.save_to_excel(df, sheet_type, file_name)
     
     def classify_notifications(self, file_manager, excel_manager):
@@ -58,7 +58,7 @@ class NotificationClassifier:
                 return False
             
             logger.info("정책 분류 시작")
-            df = pd.read_excel(selected_file)
+            df = ExcelCache.read_excel(selected_file)
             
             # 1. 만료된 사용 정책 분류
             try:
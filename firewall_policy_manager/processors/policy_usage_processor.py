@@ -6,7 +6,7 @@
 """
 
 import logging
-import pandas as pd
+from firewall_policy_manager.utils.excel_cache import ExcelCache
 
 logger = logging.getLogger(__name__)
 
@@ -44,8 +44,8 @@ class PolicyUsageProcessor:
                 return False
             
             # 파일 로드
-            policy_df = pd.read_excel(policy_file)
-            usage_df = pd.read_excel(usage_file)
+            policy_df = ExcelCache.read_excel(policy_file)
+            usage_df = ExcelCache.read_excel(usage_file)
             
             # 미사용여부 컬럼이 없으면 추가
             if '미사용여부' not in policy_df.columns:
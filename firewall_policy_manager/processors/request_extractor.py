@@ -7,6 +7,7 @@
 
 import logging
 import pandas as pd
+from firewall_policy_manager.utils.excel_cache import ExcelCache
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +39,7 @@ class RequestExtractor:
             if not file_name:
                 return False
             
-            df = pd.read_excel(file_name)
+            df = ExcelCache.read_excel(file_name)
             
             # 'Unknown' 값을 제외하고 고유한 Request Type 값을 추출
             unique_types = df[df['Request Type'] != 'Unknown']['Request Type'].unique()
@@ -6,11 +6,26 @@
 """
 
 import logging
+import numpy as np
 import pandas as pd
 from firewall_policy_manager.utils.request_utils import RequestUtils
+from firewall_policy_manager.utils.excel_cache import ExcelCache
 
 logger = logging.getLogger(__name__)
 
+# GROUP 정책의 매칭 키 (정책 컬럼, 정보 컬럼) - 하나라도 일치하는 정보 중 첫 번째 행을 사용
+GROUP_MATCH_KEYS = [
+    (['Request ID', 'MIS ID'], ['REQUEST_ID', 'MIS_ID']),
+    (['Request ID', 'End Date', 'Request User'], ['REQUEST_ID', 'REQUEST_END_DATE', 'WRITE_PERSON_ID']),
+    (['Request ID', 'End Date', 'Request User'], ['REQUEST_ID', 'REQUEST_END_DATE', 'REQUESTER_ID']),
+]
+
+# 그 외 정책의 매칭 키
+DEFAULT_MATCH_KEY = (['Request ID'], ['REQUEST_ID'])
+
+# 매칭된 값을 날짜로 변환하는 컬럼
+DATE_COLUMNS = ['REQUEST_START_DATE', 'REQUEST_END_DATE', 'Start Date', 'End Date']
+
 class RequestInfoAdder:
     """신청 정보 추가 기능을 제공하는 클래스"""
     
@@ -33,44 +48,105 @@ class RequestInfoAdder:
         Returns:
             DataFrame: 처리된 DataFrame
         """
-        df = pd.read_excel(file)
+        df = ExcelCache.read_excel(file)
         df.replace({'nan': None}, inplace=True)
         return df.astype(str)
     
+    def _first_match_positions(self, rule_df, info_df, rule_columns, info_columns):
+        """
+        규칙별로 키가 일치하는 info_df의 첫 번째 행 위치를 찾습니다.
+        info_df의 키별 첫 번째 행으로 해시 인덱스를 만들어 한 번에 조회합니다.
+        
+        Args:
+            rule_df (DataFrame): 규칙 DataFrame
+            info_df (DataFrame): 정보 DataFrame
+            rule_columns (list): 규칙의 키 컬럼
+            info_columns (list): 정보의 키 컬럼 (rule_columns와 같은 순서)
+            
+        Returns:
+            ndarray: 규칙별 info_df 행 위치 (일치하는 행이 없으면 -1)
+        """
+        info_keys = info_df[info_columns]
+        first_rows = (info_keys.notna().all(axis=1) & ~info_keys.duplicated()).to_numpy()
+        first_positions = np.flatnonzero(first_rows)
+        if first_positions.size == 0:
+            return np.full(len(rule_df), -1)
+        key_index = pd.MultiIndex.from_frame(info_keys[first_rows].astype(object))
+        
+        rule_keys = rule_df[rule_columns].astype(object)
+        rule_keys.columns = info_columns
+        found = key_index.get_indexer(pd.MultiIndex.from_frame(rule_keys))
+        positions = np.where(found >= 0, first_positions[found], -1)
+        # 빈 키는 어떤 정보와도 일치하지 않음 (== 비교와 동일)
+        positions[~rule_keys.notna().all(axis=1).to_numpy()] = -1
+        return positions
+    
+    def _to_datetime(self, values):
+        """값마다 pd.to_datetime을 적용합니다 (고유 값마다 한 번만 변환)."""
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+        converted = np.empty(len(uniques), dtype=object)
+        converted[:] = [pd.to_datetime(value, errors='coerce') for value in uniques]
+        return converted[codes]
+    
+    def _assign_column(self, rule_df, rows, col, values):
+        """rows 위치의 col 컬럼에 값을 한 번에 기록합니다 (없는 컬럼은 새로 생성)."""
+        if col not in rule_df.columns:
+            rule_df[col] = pd.Series(np.nan, index=rule_df.index, dtype=object)
+        elif rule_df[col].dtype != object:
+            rule_df[col] = rule_df[col].astype(object)
+        rule_df.loc[rows, col] = values
+    
     def match_and_update_df(self, rule_df, info_df):
         """
         조건에 따라 DataFrame의 값을 매칭 및 업데이트합니다.
+        규칙마다 info_df 순서상 첫 번째로 일치하는 정보를 찾아 정보의 모든 컬럼 값을 반영하고,
+        일치하는 정보가 없으면 파싱된 신청 정보로 신청 컬럼을 채웁니다.
         
         Args:
             rule_df (DataFrame): 규칙 DataFrame
             info_df (DataFrame): 정보 DataFrame
         """
-        total = len(rule_df)
-        for idx, row in rule_df.iterrows():
-            print(f"\r신청 정보 매칭 중: {idx + 1}/{total}", end='', flush=True)
-            if row['Request Type'] == 'GROUP':
-                matched_row = info_df[
-                    ((info_df['REQUEST_ID'] == row['Request ID']) & (info_df['MIS_ID'] == row['MIS ID'])) |
-                    ((info_df['REQUEST_ID'] == row['Request ID']) & (info_df['REQUEST_END_DATE'] == row['End Date']) & (info_df['WRITE_PERSON_ID'] == row['Request User'])) |
-                    ((info_df['REQUEST_ID'] == row['Request ID']) & (info_df['REQUEST_END_DATE'] == row['End Date']) & (info_df['REQUESTER_ID'] == row['Request User']))
-                ]
-            else:
-                matched_row = info_df[info_df['REQUEST_ID'] == row['Request ID']]
-            
-            if not matched_row.empty:
-                for col in matched_row.columns:
-                    if col in ['REQUEST_START_DATE', 'REQUEST_END_DATE', 'Start Date', 'End Date']:
-                        rule_df.at[idx, col] = pd.to_datetime(matched_row[col].values[0], errors='coerce')
-                    else:
-                        rule_df.at[idx, col] = matched_row[col].values[0]
-            elif row['Request Type'] != 'nan' and row['Request Type'] != 'Unknown':
-                rule_df.at[idx, 'REQUEST_ID'] = row['Request ID']
-                rule_df.at[idx, 'REQUEST_START_DATE'] = row['Start Date']
-                rule_df.at[idx, 'REQUEST_END_DATE'] = row['End Date']
-                rule_df.at[idx, 'REQUESTER_ID'] = row['Request User']
-                rule_df.at[idx, 'REQUESTER_EMAIL'] = row['Request User'] + '@gmail.com'
+        # 규칙별 매칭 위치 계산 (GROUP 정책은 세 가지 키 중 info_df에서 가장 앞선 행)
+        positions = self._first_match_positions(rule_df, info_df, *DEFAULT_MATCH_KEY)
+        is_group = (rule_df['Request Type'] == 'GROUP').to_numpy()
+        if is_group.any():
+            candidates = np.stack([
+                self._first_match_positions(rule_df, info_df, rule_columns, info_columns)
+                for rule_columns, info_columns in GROUP_MATCH_KEYS
+            ])
+            candidates = np.where(candidates >= 0, candidates, len(info_df)).min(axis=0)
+            positions = np.where(is_group, np.where(candidates < len(info_df), candidates, -1), positions)
+        
+        matched = positions >= 0
+        fallback = ~matched & ~rule_df['Request Type'].isin(['nan', 'Unknown']).to_numpy()
+        
+        # 매칭되지 않은 정책에 채울 값 (기록 전에 원래 값 보관)
+        fallback_values = {
+            'REQUEST_ID': rule_df['Request ID'][fallback].to_numpy(dtype=object),
+            'REQUEST_START_DATE': rule_df['Start Date'][fallback].to_numpy(dtype=object),
+            'REQUEST_END_DATE': rule_df['End Date'][fallback].to_numpy(dtype=object),
+            'REQUESTER_ID': rule_df['Request User'][fallback].to_numpy(dtype=object),
+            'REQUESTER_EMAIL': (rule_df['Request User'][fallback] + '@gmail.com').to_numpy(dtype=object),
+        }
+        
+        matched_info = info_df.iloc[positions[matched]]
+        matched_values = {}
+        for col in info_df.columns:
+            values = matched_info[col].to_numpy(dtype=object)
+            matched_values[col] = self._to_datetime(values) if col in DATE_COLUMNS else values
+        
+        # 먼저 기록되는 행의 컬럼부터 추가되도록 순서 결정 (행 단위 처리와 같은 컬럼 순서)
+        first_matched = np.argmax(matched) if matched.any() else len(matched)
+        first_fallback = np.argmax(fallback) if fallback.any() else len(fallback)
+        updates = [(matched, matched_values), (fallback, fallback_values)]
+        if first_fallback < first_matched:
+            updates.reverse()
+        for rows, values_by_column in updates:
+            if rows.any():
+                for col, values in values_by_column.items():
+                    self._assign_column(rule_df, rows, col, values)
         
-        print()  # 줄바꿈
+        logger.info(f"신청 정보 매칭 완료 - 매칭: {matched.sum()}건, 신청 정보로 채움: {fallback.sum()}건")
     
     def add_request_info(self, file_manager):
         """
@@ -9,9 +9,26 @@ import re
 import logging
 import pandas as pd
 from datetime import datetime
+from firewall_policy_manager.utils.excel_cache import ExcelCache
 
 logger = logging.getLogger(__name__)
 
+# 신청번호 첫 글자별 신청 유형
+REQUEST_TYPE_CODES = {
+    'P': 'GROUP',
+    'F': 'NORMAL',
+    'S': 'SERVER',
+    'M': 'PAM',
+}
+
+# 파싱 결과 컬럼
+REQUEST_INFO_COLUMNS = [
+    'Request Type', 'Request ID', 'Ruleset ID', 'MIS ID', 'Request User', 'Start Date', 'End Date'
+]
+
+# 패턴 앞의 전역 인라인 플래그 (예: (?i)) - 컴파일된 패턴의 flags로 따로 전달
+INLINE_FLAGS = re.compile(r'^(?:\(\?[aiLmsux]+\))+')
+
 class RequestParser:
     """신청 정보 파싱 기능을 제공하는 클래스"""
     
@@ -64,19 +81,12 @@ class RequestParser:
         if pd.isnull(description):
             return data_dict
         
-        # 패턴 정의
-        pattern_3 = re.compile(self.config.get('patterns.pattern_3', 'MASKED'))
-        pattern_1_rulename = re.compile(self.config.get('patterns.pattern_1_rulename', 'MASKED'))
-        pattern_1_user = self.config.get('patterns.pattern_1_user', 'MASKED')
-        rulename_1_rulename = self.config.get('patterns.rulename_1_rulename', 'MASKED')
-        rulename_1_date = self.config.get('patterns.rulename_1_date', 'MASKED')
-        
-        # 매칭
-        match_3 = pattern_3.match(description)
-        name_match = pattern_1_rulename.match(str(rulename))
-        user_match = re.search(pattern_1_user, description)
-        desc_match = re.search(rulename_1_rulename, description)
-        date_match = re.search(rulename_1_date, description)
+        # 매칭 (패턴은 설정 관리자에서 한 번만 컴파일됨)
+        match_3 = self.config.get_pattern('pattern_3').match(description)
+        name_match = self.config.get_pattern('pattern_1_rulename').match(str(rulename))
+        user_match = self.config.get_pattern('pattern_1_user').search(description)
+        desc_match = self.config.get_pattern('rulename_1_rulename').search(description)
+        date_match = self.config.get_pattern('rulename_1_date').search(description)
         
         if match_3:
             data_dict = {
@@ -90,16 +100,7 @@ class RequestParser:
             }
             
             type_code = data_dict["Request ID"][:1]
-            if type_code == "P":
-                data_dict["Request Type"] = "GROUP"
-            elif type_code == "F":
-                data_dict["Request Type"] = "NORMAL"
-            elif type_code == "S":
-                data_dict["Request Type"] = "SERVER"
-            elif type_code == "M":
-                data_dict["Request Type"] = "PAM"
-            else:
-                data_dict["Request Type"] = "Unknown"
+            data_dict["Request Type"] = REQUEST_TYPE_CODES.get(type_code, "Unknown")
         
         if name_match:
             data_dict['Request Type'] = "OLD"
@@ -127,6 +128,111 @@ class RequestParser:
         
         return data_dict
     
+    def _extract(self, values, name, anchored=False):
+        """
+        설정 패턴으로 문자열 시리즈 전체를 한 번에 검색합니다.
+        
+        Args:
+            values (Series): 검색할 문자열 시리즈
+            name (str): patterns 아래의 패턴 이름
+            anchored (bool): True이면 re.match처럼 문자열 처음부터 일치해야 함
+            
+        Returns:
+            DataFrame: 0번 컬럼은 전체 일치 문자열(일치하지 않으면 NaN), 1번부터는 패턴의 그룹
+        """
+        pattern = self.config.get_pattern(name)
+        body = INLINE_FLAGS.sub('', pattern.pattern)
+        wrapped = re.compile(('\\A' if anchored else '') + f'({body})', pattern.flags)
+        extracted = values.str.extract(wrapped, expand=True)
+        extracted.columns = range(extracted.shape[1])
+        return extracted.astype(object)
+    
+    def _convert_dates(self, values):
+        """날짜 문자열 시리즈를 변환합니다 (고유 값마다 한 번만 변환)."""
+        mapping = {value: self.convert_to_date(value) for value in pd.unique(values.dropna())}
+        return values.map(mapping)
+    
+    def parse_requests(self, rulenames, descriptions):
+        """
+        규칙 이름과 설명 시리즈 전체에서 신청 정보를 파싱합니다.
+        각 행에 parse_request_info를 적용한 것과 같은 결과를 컬럼 단위 연산으로 계산합니다.
+        
+        Args:
+            rulenames (Series): 규칙 이름
+            descriptions (Series): 설명
+            
+        Returns:
+            DataFrame: REQUEST_INFO_COLUMNS 컬럼의 파싱 결과 (descriptions와 같은 인덱스)
+        """
+        default_date = self.convert_to_date('19000101')
+        result = pd.DataFrame({
+            'Request Type': 'Unknown',
+            'Request ID': None,
+            'Ruleset ID': None,
+            'MIS ID': None,
+            'Request User': None,
+            'Start Date': default_date,
+            'End Date': default_date,
+        }, index=descriptions.index, columns=REQUEST_INFO_COLUMNS, dtype=object)
+        
+        # 설명이 없는 정책은 기본값 유지
+        has_description = descriptions.notna()
+        description = descriptions[has_description].astype(object).map(str)
+        rulename = rulenames[has_description].astype(object).map(str)
+        parsed = result[has_description].copy()
+        if parsed.empty:
+            return result
+        
+        # 패턴별 매칭
+        match_3 = self._extract(description, 'pattern_3', anchored=True)
+        name_match = self._extract(rulename, 'pattern_1_rulename', anchored=True)
+        user_match = self._extract(description, 'pattern_1_user')
+        desc_match = self._extract(description, 'rulename_1_rulename')
+        date_match = self._extract(description, 'rulename_1_date')
+        
+        has_match_3 = match_3[0].notna()
+        has_name = name_match[0].notna()
+        has_user = user_match[0].notna()
+        has_desc = desc_match[0].notna()
+        has_date = date_match[0].notna()
+        request_user = user_match[1].str.replace('*ACL*', '', regex=False) if has_user.any() else user_match[0]
+        
+        if has_match_3.any():
+            mis_id = match_3[6].where(match_3[6].notna() & (match_3[6] != ''), None)
+            parsed.loc[has_match_3, 'Request Type'] = (
+                match_3[5].str[:1].map(REQUEST_TYPE_CODES).fillna('Unknown')[has_match_3]
+            )
+            parsed.loc[has_match_3, 'Request ID'] = match_3[5][has_match_3]
+            parsed.loc[has_match_3, 'Ruleset ID'] = match_3[1][has_match_3]
+            parsed.loc[has_match_3, 'MIS ID'] = mis_id[has_match_3]
+            parsed.loc[has_match_3, 'Request User'] = match_3[4][has_match_3]
+            parsed.loc[has_match_3, 'Start Date'] = self._convert_dates(match_3[2][has_match_3])
+            parsed.loc[has_match_3, 'End Date'] = self._convert_dates(match_3[3][has_match_3])
+        
+        if has_name.any():
+            parsed.loc[has_name, 'Request Type'] = 'OLD'
+            parsed.loc[has_name, 'Request ID'] = name_match[1][has_name]
+            parsed.loc[has_name & has_user, 'Request User'] = request_user[has_name & has_user]
+            name_dates = date_match[0][has_name & has_date].str.split('~')
+            parsed.loc[has_name & has_date, 'Start Date'] = self._convert_dates(name_dates.str[0])
+            parsed.loc[has_name & has_date, 'End Date'] = self._convert_dates(name_dates.str[1])
+        
+        if has_desc.any():
+            dates = description[has_desc].str.split(';').str[0].str.split('~')
+            start_dates = dates.str[0].str.replace('[', '', regex=False).str.replace('-', '', regex=False)
+            end_dates = dates.str[1].str.replace(']', '', regex=False).str.replace('-', '', regex=False)
+            
+            parsed.loc[has_desc, 'Request Type'] = 'OLD'
+            parsed.loc[has_desc, 'Request ID'] = desc_match[1][has_desc].str.split('-').str[1]
+            parsed.loc[has_desc, 'Ruleset ID'] = None
+            parsed.loc[has_desc, 'MIS ID'] = None
+            parsed.loc[has_desc, 'Request User'] = request_user.where(has_user, None)[has_desc]
+            parsed.loc[has_desc, 'Start Date'] = self._convert_dates(start_dates)
+            parsed.loc[has_desc, 'End Date'] = self._convert_dates(end_dates)
+        
+        result.loc[has_description] = parsed
+        return result
+    
     def parse_request_type(self, file_manager):
         """
         파일에서 신청 유형을 파싱합니다.
@@ -143,16 +249,12 @@ class RequestParser:
             if not file_name:
                 return False
             
-            df = pd.read_excel(file_name)
-            
-            total = len(df)
-            for index, row in df.iterrows():
-                print(f"\r신청 정보 파싱 중: {index + 1}/{total}", end='', flush=True)
-                result = self.parse_request_info(row['Rule Name'], row['Description'])
-                for key, value in result.items():
-                    df.at[index, key] = value
+            df = ExcelCache.read_excel(file_name)
             
-            print()  # 줄바꿈
+            # 전체 정책을 한 번에 파싱하고 결과 컬럼을 한 번에 반영
+            result = self.parse_requests(df['Rule Name'], df['Description'])
+            df[REQUEST_INFO_COLUMNS] = result
+            logger.info(f"신청 정보 파싱 완료: {len(df)}건")
             
             new_file_name = file_manager.update_version(file_name)
             df.to_excel(new_file_name, index=False)
@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+엑셀 파일 읽기 결과를 캐시하는 기능을 제공하는 모듈
+"""
+
+import os
+import json
+import hashlib
+import logging
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 캐시 디렉터리 이름 (사용자별 캐시 위치 아래에 생성)
+CACHE_DIR_NAME = os.path.join('firewall_policy_manager', 'excel_cache')
+
+# 캐시 형식이 바뀌면 증가시켜 기존 캐시를 무효화
+CACHE_VERSION = 1
+
+# 캐시 디렉터리 최대 크기 (넘으면 오래 사용하지 않은 캐시부터 삭제)
+CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+class ExcelCache:
+    """엑셀 파일 파싱 결과를 바이너리 캐시 파일로 보관하고 재사용하는 클래스"""
+
+    @staticmethod
+    def default_cache_dir():
+        """
+        사용자별 캐시 디렉터리를 반환합니다.
+        Windows는 %LOCALAPPDATA%, 그 외는 $XDG_CACHE_HOME 또는 ~/.cache 아래를 사용합니다.
+
+        Returns:
+            str: 캐시 디렉터리 경로
+        """
+        base = os.environ.get('LOCALAPPDATA') if os.name == 'nt' else os.environ.get('XDG_CACHE_HOME')
+        return os.path.join(base or os.path.join(os.path.expanduser('~'), '.cache'), CACHE_DIR_NAME)
+
+    @staticmethod
+    def _is_private(path):
+        """
+        현재 사용자가 소유하고 다른 사용자가 쓸 수 없는 파일/디렉터리인지 확인합니다.
+        캐시 파일은 pickle이므로 다른 사용자가 바꿀 수 있는 위치의 파일은 읽지 않습니다.
+        (소유자 정보가 없는 Windows에서는 사용자별 캐시 디렉터리를 신뢰합니다.)
+
+        Args:
+            path (str): 확인할 경로
+
+        Returns:
+            bool: 현재 사용자 전용 여부
+        """
+        if not hasattr(os, 'getuid'):
+            return True
+        stat = os.stat(path)
+        return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+    @staticmethod
+    def _content_hash(file_path):
+        """
+        파일 내용의 SHA-256 해시를 계산합니다.
+
+        Args:
+            file_path (str): 파일 경로
+
+        Returns:
+            str: 16진수 해시 문자열
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _cache_paths(file_path, read_options, cache_dir=None):
+        """
+        엑셀 파일과 읽기 옵션에 해당하는 캐시 데이터/메타 파일 경로를 반환합니다.
+
+        Args:
+            file_path (str): 엑셀 파일 경로
+            read_options (dict): pd.read_excel 옵션
+            cache_dir (str): 캐시 디렉터리 (None이면 사용자별 캐시 디렉터리)
+
+        Returns:
+            tuple: (캐시 데이터 파일 경로, 메타 파일 경로)
+        """
+        abs_path = os.path.abspath(file_path)
+        key_source = json.dumps({
+            'path': abs_path,
+            'options': read_options,
+            'pandas': pd.__version__,
+            'version': CACHE_VERSION
+        }, sort_keys=True, default=str)
+        key = hashlib.sha1(key_source.encode('utf-8')).hexdigest()
+        directory = cache_dir or ExcelCache.default_cache_dir()
+        return os.path.join(directory, f"{key}.pkl"), os.path.join(directory, f"{key}.json")
+
+    @staticmethod
+    def _load_meta(meta_path):
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_meta(meta_path, meta):
+        temp_path = f"{meta_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(temp_path, meta_path)
+
+    @staticmethod
+    def _prune(directory, keep_path, max_bytes=CACHE_MAX_BYTES):
+        """
+        원본 엑셀 파일이 없어진 캐시를 삭제하고, 전체 크기가 max_bytes를 넘으면
+        오래 사용하지 않은 캐시부터 삭제합니다. (keep_path 캐시는 삭제하지 않음)
+
+        Args:
+            directory (str): 캐시 디렉터리
+            keep_path (str): 방금 기록한 캐시 데이터 파일 경로
+            max_bytes (int): 캐시 디렉터리 최대 크기
+        """
+        entries = []
+        for name in os.listdir(directory):
+            if not name.endswith('.json'):
+                continue
+            meta_path = os.path.join(directory, name)
+            data_path = f"{meta_path[:-len('.json')]}.pkl"
+            try:
+                stat = os.stat(data_path)
+            except OSError:
+                ExcelCache._remove_entry(data_path, meta_path)
+                continue
+            if data_path != keep_path:
+                meta = ExcelCache._load_meta(meta_path)
+                if meta is None or not os.path.exists(meta.get('path', '')):
+                    ExcelCache._remove_entry(data_path, meta_path)
+                    continue
+            entries.append((data_path == keep_path, stat.st_mtime, stat.st_size, data_path, meta_path))
+
+        # 방금 기록한 캐시, 최근 사용한 캐시 순으로 남김
+        total = 0
+        for keep, _, size, data_path, meta_path in sorted(entries, reverse=True):
+            if total + size > max_bytes and not keep:
+                ExcelCache._remove_entry(data_path, meta_path)
+            else:
+                total += size
+
+    @staticmethod
+    def _remove_entry(data_path, meta_path):
+        for path in (data_path, meta_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def read_excel(file_path, cache_dir=None, **kwargs):
+        """
+        엑셀 파일을 읽습니다. 같은 파일을 다시 읽을 때는 캐시 파일에서 바로 읽어옵니다.
+
+        캐시는 파일 경로와 읽기 옵션별로 저장되며, 파일 크기/수정 시각이 같으면 그대로 사용합니다.
+        수정 시각만 바뀐 경우 내용 해시를 비교해 내용이 같으면 계속 사용하고, 다르면 다시 파싱합니다.
+        캐시 디렉터리나 캐시 파일이 현재 사용자 전용이 아니면 캐시를 사용하지 않습니다.
+        새 캐시를 기록할 때 원본 파일이 없어진 캐시를 지우고, 전체 크기를 CACHE_MAX_BYTES 이하로 유지합니다.
+
+        Args:
+            file_path (str): 엑셀 파일 경로
+            cache_dir (str): 캐시 디렉터리 (None이면 사용자별 캐시 디렉터리)
+            **kwargs: pd.read_excel 옵션
+
+        Returns:
+            DataFrame: 읽어온 데이터 (sheet_name 옵션에 따라 DataFrame 딕셔너리)
+        """
+        data_path, meta_path = ExcelCache._cache_paths(file_path, kwargs, cache_dir)
+        directory = os.path.dirname(data_path)
+        stat = os.stat(file_path)
+        content_hash = None
+
+        trusted = not os.path.exists(directory) or ExcelCache._is_private(directory)
+        if not trusted:
+            logger.warning(f"캐시 디렉터리 '{directory}'가 현재 사용자 전용이 아니므로 캐시를 사용하지 않습니다.")
+            return pd.read_excel(file_path, **kwargs)
+
+        meta = ExcelCache._load_meta(meta_path)
+        if (meta is not None and meta.get('size') == stat.st_size and os.path.exists(data_path)
+                and ExcelCache._is_private(data_path) and ExcelCache._is_private(meta_path)):
+            valid = meta.get('mtime_ns') == stat.st_mtime_ns
+            if not valid:
+                content_hash = ExcelCache._content_hash(file_path)
+                valid = meta.get('sha256') == content_hash
+            if valid:
+                try:
+                    df = pd.read_pickle(data_path)
+                    if meta.get('mtime_ns') != stat.st_mtime_ns:
+                        meta['mtime_ns'] = stat.st_mtime_ns
+                        ExcelCache._write_meta(meta_path, meta)
+                    # 캐시 정리 시 최근 사용한 캐시가 남도록 사용 시각 기록
+                    try:
+                        os.utime(data_path)
+                    except OSError:
+                        pass
+                    logger.info(f"캐시에서 '{file_path}' 파일을 읽었습니다.")
+                    return df
+                except Exception as e:
+                    logger.warning(f"캐시 파일을 읽지 못해 다시 파싱합니다: {e}")
+
+        content_hash = content_hash or ExcelCache._content_hash(file_path)
+        df = pd.read_excel(file_path, **kwargs)
+
+        try:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            temp_path = f"{data_path}.tmp"
+            pd.to_pickle(df, temp_path)
+            os.replace(temp_path, data_path)
+            ExcelCache._write_meta(meta_path, {
+                'path': os.path.abspath(file_path),
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': content_hash
+            })
+            ExcelCache._prune(directory, data_path)
+        except Exception as e:
+            logger.warning(f"엑셀 캐시 저장 중 오류 발생: {e}")
+
+        return df
@@ -6,8 +6,9 @@ Excel 파일 관리 기능을 제공하는 모듈
 """
 
 import logging
-from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Alignment, PatternFill, Font
+from openpyxl import Workbook
+from openpyxl.styles import Alignment, PatternFill
+from firewall.excel_writer import write_sheet
 
 logger = logging.getLogger(__name__)
 
@@ -33,29 +34,26 @@ class ExcelManager:
             file_name (str): 파일 이름
         """
         try:
-            wb = load_workbook(file_name)
-            sheet = wb[sheet_type]
-            
-            # 첫 번째 행 삽입
-            sheet.insert_rows(1)
-            sheet['A1'] = '="대상 정책 수: "&COUNTA(B:B)-1'
-            sheet['A1'].font = Font(bold=True)
-            
             # 헤더 스타일 설정
             header_color = self.config.get('excel_styles.header_fill_color', 'E0E0E0')
             history_color = self.config.get('excel_styles.history_fill_color', 'ccffff')
+            header_fill = PatternFill(start_color=header_color, end_color=header_color, fill_type='solid')
+            history_fill = PatternFill(start_color=history_color, end_color=history_color, fill_type='solid')
             
-            for col in range(1, 8):
-                cell = sheet.cell(row=2, column=col)
-                cell.alignment = Alignment(horizontal='center')
-                cell.fill = PatternFill(start_color=header_color, end_color=header_color, fill_type='solid')
-            
+            header_fills = {col: header_fill for col in range(1, 8)}
             if sheet_type != '이력없음_미사용정책':
-                for col in range(8, 24):
-                    cell = sheet.cell(row=2, column=col)
-                    cell.fill = PatternFill(start_color=history_color, end_color=history_color, fill_type='solid')
+                header_fills.update({col: history_fill for col in range(8, 24)})
+            center = Alignment(horizontal='center')
             
-            wb.save(file_name)
+            # 첫 번째 행(대상 정책 수)과 헤더 스타일을 기록 시점에 함께 적용
+            workbook = Workbook(write_only=True)
+            write_sheet(
+                workbook, df, sheet_type,
+                header_fills=header_fills,
+                header_alignments={col: center for col in range(1, 8)},
+                banner='="대상 정책 수: "&COUNTA(B:B)-1'
+            )
+            workbook.save(file_name)
             logger.info(f"Excel 파일 '{file_name}'의 '{sheet_type}' 시트에 데이터를 저장했습니다.")
         except Exception as e:
             logger.exception(f"Excel 파일 저장 중 오류 발생: {e}")
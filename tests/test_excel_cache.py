@@ -0,0 +1,43 @@
+import os
+
+import pandas as pd
+import pytest
+
+from firewall_policy_manager.utils.excel_cache import ExcelCache
+
+
+def write_workbook(path, rows):
+    pd.DataFrame({'Rule Name': [f'rule-{i}' for i in range(rows)]}).to_excel(path, index=False)
+    return str(path)
+
+
+def cache_sources(cache_dir):
+    return sorted(
+        ExcelCache._load_meta(os.path.join(cache_dir, name))['path']
+        for name in os.listdir(cache_dir) if name.endswith('.json')
+    )
+
+
+def test_entries_of_deleted_workbooks_are_pruned(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    old = write_workbook(tmp_path / 'rules_v1.xlsx', 3)
+    new = write_workbook(tmp_path / 'rules_v2.xlsx', 3)
+    ExcelCache.read_excel(old, cache_dir=cache_dir)
+    os.remove(old)
+
+    ExcelCache.read_excel(new, cache_dir=cache_dir)
+
+    assert cache_sources(cache_dir) == [os.path.abspath(new)]
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='POSIX 권한 검사')
+def test_cache_writable_by_others_is_not_used(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / 'cache')
+    workbook = write_workbook(tmp_path / 'rules.xlsx', 3)
+    ExcelCache.read_excel(workbook, cache_dir=cache_dir)
+    os.chmod(cache_dir, 0o777)
+    monkeypatch.setattr(pd, 'read_pickle', lambda *args, **kwargs: pytest.fail('캐시를 읽으면 안 됨'))
+
+    df = ExcelCache.read_excel(workbook, cache_dir=cache_dir)
+
+    assert len(df) == 3
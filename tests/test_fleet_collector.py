@@ -0,0 +1,53 @@
+import threading
+import time
+
+import pandas as pd
+
+from firewall.fleet_collector import FleetCollector
+
+
+class SleepingFleetCollector(FleetCollector):
+    """장비 연결 없이 device['sleep']초 동안 수집하는 것처럼 동작하며 동시 수집 장비 수를 기록"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, exports=['system_info'], **kwargs)
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+        self.started = []
+
+    def _collect_device(self, device, outcome):
+        vendor = device['source_type']
+        with self.lock:
+            self.started.append(device['name'])
+            for key in ('all', vendor):
+                self.active[key] = self.active.get(key, 0) + 1
+                self.peak[key] = max(self.peak.get(key, 0), self.active[key])
+        time.sleep(device['sleep'])
+        outcome['data']['system_info'] = pd.DataFrame({'Hostname': [device['name']]})
+        with self.lock:
+            for key in ('all', vendor):
+                self.active[key] -= 1
+
+
+def test_limited_vendor_does_not_block_other_vendors():
+    inventory = [{'name': f'mf2-{i}', 'source_type': 'mf2', 'sleep': 0.2} for i in range(8)]
+    inventory += [{'name': f'pa-{i}', 'source_type': 'paloalto', 'sleep': 0.2} for i in range(4)]
+    fleet = SleepingFleetCollector(max_workers=8, vendor_limits={'mf2': 2})
+
+    result = fleet.collect(inventory)
+
+    # PaloAlto 장비는 MF2 대기열 뒤에 있어도 첫 번째 묶음에서 시작
+    assert set(fleet.started[:6]) == {'mf2-0', 'mf2-1', 'pa-0', 'pa-1', 'pa-2', 'pa-3'}
+    assert fleet.peak['mf2'] == 2
+    assert list(result['system_info']['Device']) == [device['name'] for device in inventory]
+
+
+def test_timed_out_devices_keep_their_slot_until_the_worker_exits():
+    inventory = [{'name': f'pa-{i}', 'source_type': 'paloalto', 'sleep': 0.3} for i in range(4)]
+    fleet = SleepingFleetCollector(max_workers=2, device_timeout=0.05)
+
+    result = fleet.collect(inventory)
+
+    assert fleet.peak['all'] == 2
+    assert set(result['failures']['Device']) == {device['name'] for device in inventory}
@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from firewall_policy_manager.processors.mis_id_adder import MisIdAdder
+
+
+@pytest.mark.parametrize('chunksize', [1, 3, 100])
+def test_mapping_does_not_depend_on_chunksize(tmp_path, chunksize):
+    mis_file = tmp_path / 'mis.csv'
+    pd.DataFrame({
+        'ruleset_id': [1, 2, 3, 4, 'X9', 5, 4],
+        'mis_id': ['M1', 'M2', 'M3', 'M4', 'M9', 'M5', 'M4-dup'],
+        'extra': range(7),
+    }).to_csv(mis_file, index=False)
+    adder = MisIdAdder(None)
+    # 빈 칸이 있는 엑셀 컬럼은 실수형으로 읽힘
+    ruleset_ids = adder.normalize_ruleset_ids(pd.Series([4.0, np.nan, 5.0, 8.0]))
+
+    mapping = adder.read_mis_id_map(str(mis_file), ruleset_ids, chunksize=chunksize)
+
+    assert mapping.to_dict() == {'4': 'M4', '5': 'M5'}
+    assert list(ruleset_ids.map(mapping)) == ['M4', np.nan, 'M5', np.nan]
+
+
+def test_normalize_ruleset_ids_matches_csv_strings():
+    ids = MisIdAdder(None).normalize_ruleset_ids(pd.Series([4, 4.0, '4', 'X9', 4.5, None], dtype=object))
+
+    assert list(ids[:5]) == ['4', '4', '4', 'X9', '4.5']
+    assert pd.isna(ids[5])
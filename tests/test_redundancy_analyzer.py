@@ -0,0 +1,71 @@
+import pandas as pd
+import pytest
+
+from analysis.core.change_analyzer import ChangeAnalyzer
+from analysis.core.redundancy_analyzer import RedundancyAnalyzer
+
+
+def make_rules():
+    """Vsys가 다른 같은 이름의 정책이 있는 PaloAlto 정책"""
+    return pd.DataFrame({
+        'Seq': [1, 2, 3, 4, 5, 6],
+        'Vsys': ['vsys1', 'vsys2', 'vsys1', 'vsys2', 'vsys1', 'vsys2'],
+        'Rule Name': ['web', 'web', 'web-copy', 'web-copy', 'db', 'db'],
+        'Enable': ['Y'] * 6,
+        'Action': ['Allow'] * 6,
+        'Source': ['10.0.0.1', '10.0.0.2', '10.0.0.1', '10.0.0.9', '10.0.1.1', '10.0.1.1'],
+        'User': ['any'] * 6,
+        'Destination': ['10.1.0.1', '10.1.0.2', '10.1.0.1', '10.1.0.2', '10.1.1.1', '10.1.1.1'],
+        'Service': ['tcp_443', 'tcp_443', 'tcp_443', 'tcp_443', 'tcp_3306', 'tcp_3306'],
+        'Application': ['any'] * 6,
+        'Category': ['any'] * 6,
+    })
+
+
+def test_incremental_matches_full_analysis_with_duplicate_names_across_vsys():
+    analyzer = RedundancyAnalyzer()
+    before = make_rules()
+    state = analyzer.build_state(before, 'paloalto')
+
+    after = before.copy()
+    after.loc[3, 'Source'] = '10.0.0.2'  # vsys2의 web-copy가 vsys2의 web과 같아짐
+    changes = ChangeAnalyzer().analyze(before, after)
+
+    result, new_state = analyzer.analyze_incremental(after, 'paloalto', state, changes)
+    expected = analyzer.analyze(after, 'paloalto', max_workers=1)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert list(new_state.columns) == ['Vsys', 'Rule Name', 'Key']
+    assert new_state['Key'].nunique() == 4
+
+
+def test_incremental_reuses_stored_keys_per_vsys():
+    analyzer = RedundancyAnalyzer()
+    rules = make_rules()
+    state = analyzer.build_state(rules, 'paloalto')
+
+    # 변경이 없으면 저장된 키를 그대로 사용하며, vsys별 키가 섞이지 않아야 함
+    no_changes = {'added': rules.iloc[0:0], 'removed': rules.iloc[0:0], 'changed': pd.DataFrame(columns=['Rule Name'])}
+    result, new_state = analyzer.analyze_incremental(rules, 'paloalto', state, no_changes)
+
+    pd.testing.assert_frame_equal(result, analyzer.analyze(rules, 'paloalto', max_workers=1))
+    pd.testing.assert_frame_equal(new_state, state)
+
+
+@pytest.mark.parametrize('make_state', [
+    # Vsys 없이 이름만 저장된 이전 형식의 상태
+    lambda analyzer, rules: analyzer.build_state(rules, 'paloalto').drop(columns='Vsys'),
+    # 같은 (Vsys, Rule Name)이 여러 번 나오는 상태
+    lambda analyzer, rules: pd.concat([analyzer.build_state(rules, 'paloalto')] * 2, ignore_index=True),
+])
+def test_incremental_falls_back_to_full_rebuild_when_state_is_ambiguous(make_state):
+    analyzer = RedundancyAnalyzer()
+    rules = make_rules()
+    state = make_state(analyzer, rules)
+
+    after = rules.copy()
+    after.loc[3, 'Source'] = '10.0.0.2'
+    changes = {'added': rules.iloc[0:0], 'removed': rules.iloc[0:0], 'changed': pd.DataFrame(columns=['Rule Name'])}
+
+    result, _ = analyzer.analyze_incremental(after, 'paloalto', state, changes)
+    pd.testing.assert_frame_equal(result, analyzer.analyze(after, 'paloalto', max_workers=1))
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from firewall_policy_manager.processors.request_info_adder import RequestInfoAdder
+
+INFO_COLUMNS = ['REQUEST_ID', 'MIS_ID', 'REQUEST_START_DATE', 'REQUEST_END_DATE',
+                'WRITE_PERSON_ID', 'REQUESTER_ID', 'REQUESTER_EMAIL']
+
+
+def make_rules():
+    return pd.DataFrame({
+        'Rule Name': ['r1', 'r2', 'r3', 'r4'],
+        'Request Type': ['GROUP', 'GENERAL', 'GROUP', 'nan'],
+        'Request ID': ['PS001', 'PS002', 'PS003', 'nan'],
+        'MIS ID': ['M1', 'nan', 'M9', 'nan'],
+        'Start Date': ['2024-01-01', '2024-02-01', '2024-03-01', 'nan'],
+        'End Date': ['2024-12-31', '2025-01-31', '2025-03-01', 'nan'],
+        'Request User': ['kim', 'lee', 'park', 'nan'],
+    })
+
+
+def make_info(rows):
+    return pd.DataFrame(rows, columns=INFO_COLUMNS)
+
+
+def test_empty_info_falls_back_to_request_values():
+    rule_df = make_rules()
+    RequestInfoAdder(None).match_and_update_df(rule_df, make_info([]))
+
+    assert list(rule_df['REQUEST_ID']) == ['PS001', 'PS002', 'PS003', np.nan]
+    assert list(rule_df['REQUESTER_EMAIL']) == ['kim@gmail.com', 'lee@gmail.com', 'park@gmail.com', np.nan]
+
+
+def test_all_nan_keys_do_not_match():
+    rule_df = make_rules()
+    info_df = make_info([
+        ['PS009', np.nan, '2024-01-01', '2024-12-31', 'choi', 'choi', 'choi@example.com'],
+    ])
+    info_df['MIS_ID'] = info_df['MIS_ID'].astype(str)  # 빈 MIS_ID 컬럼 (pandas 3에서는 NaN 유지)
+    RequestInfoAdder(None).match_and_update_df(rule_df, info_df)
+
+    assert list(rule_df['REQUEST_ID']) == ['PS001', 'PS002', 'PS003', np.nan]
+    assert list(rule_df['REQUESTER_ID']) == ['kim', 'lee', 'park', np.nan]
+
+
+def test_group_rule_uses_first_matching_info_row():
+    rule_df = make_rules()
+    info_df = make_info([
+        ['PS003', 'M3', '2024-03-01', '2025-03-01', 'park', 'jung', 'jung@example.com'],
+        ['PS001', 'M1', '2024-01-01', '2024-12-31', 'han', 'han', 'han@example.com'],
+        ['PS002', 'M2', '2024-02-01', '2025-01-31', 'lee', 'lee', 'lee@example.com'],
+        ['PS003', 'M9', '2024-03-01', '2025-03-01', 'yoon', 'yoon', 'yoon@example.com'],
+    ])
+    RequestInfoAdder(None).match_and_update_df(rule_df, info_df)
+
+    # r3은 MIS ID가 일치하는 4번째 행보다 작성자가 일치하는 1번째 행이 먼저임
+    assert list(rule_df['REQUESTER_EMAIL'][:3]) == ['han@example.com', 'lee@example.com', 'jung@example.com']
+    assert rule_df.loc[0, 'MIS_ID'] == 'M1'
+    assert rule_df.loc[2, 'REQUEST_END_DATE'] == pd.Timestamp('2025-03-01')
+    assert pd.isna(rule_df.loc[3, 'REQUEST_ID'])
@@ -0,0 +1,37 @@
+import os
+
+import pandas as pd
+import pytest
+
+from firewall import snapshot_store
+from firewall.snapshot_store import SnapshotStore
+
+
+def make_rules():
+    return pd.DataFrame({'Rule Name': ['web', 'db'], 'Source': ['10.0.0.1', '10.0.1.1']})
+
+
+@pytest.mark.skipif(snapshot_store.pyarrow is not None, reason='pyarrow가 설치된 환경')
+def test_default_format_requires_pyarrow(tmp_path):
+    with pytest.raises(ImportError):
+        SnapshotStore(str(tmp_path))
+
+
+def test_pickle_round_trip(tmp_path):
+    store = SnapshotStore(str(tmp_path), file_format='pickle')
+    store.save('fw-01', {'security_rules': make_rules()})
+
+    df = store.load('fw-01', 'security_rules', columns=['Rule Name'])
+
+    assert list(df['Rule Name']) == ['web', 'db']
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='POSIX 권한 검사')
+def test_pickle_writable_by_others_is_not_loaded(tmp_path):
+    store = SnapshotStore(str(tmp_path), file_format='pickle')
+    store.save('fw-01', {'security_rules': make_rules()})
+    file_name = store.find_snapshot('fw-01')['datasets']['security_rules']['file']
+    os.chmod(os.path.join(str(tmp_path), file_name), 0o666)
+
+    with pytest.raises(PermissionError):
+        store.load('fw-01', 'security_rules')